@@ -0,0 +1,78 @@
+"""Бенчмарк проверки запрещенных слов в зависимости от размера списка.
+
+Сравнивает прежний подход, при котором основы запрещенных слов вычислялись
+для каждого отзыва, с предварительно скомпилированным BannedWordsMatcher.
+
+Запуск из каталога automated_moderation_service:
+
+    PYTHONPATH=src:.. python benchmarks/banned_words.py
+"""
+
+# stdlib
+import random
+import time
+from collections.abc import Callable
+from functools import partial
+
+# thirdparty
+from nltk import word_tokenize
+
+# project
+from services.banned_words import BannedWordsMatcher, get_stemmer
+from services.tokenizer import tokenize
+
+LIST_SIZES = (10, 100, 1_000, 5_000)
+REVIEWS = 200
+RUSSIAN_LETTERS = "абвгдеёжзийклмнопрстуфхцчшщъыьэюя"
+REVIEW_SAMPLE = (
+    "Фильм оставил очень приятное впечатление: актеры играют убедительно, сюжет держит в напряжении "
+    "до самого конца, а музыка отлично подчеркивает атмосферу. Немного затянута середина, но в целом "
+    "рекомендую посмотреть всей семьей в выходные."
+)
+
+
+def random_word(rng: random.Random) -> str:
+    return "".join(rng.choice(RUSSIAN_LETTERS) for _ in range(rng.randint(5, 12)))
+
+
+def legacy_contains(banned_words: list[str], text: str) -> bool:
+    """Проверка в том виде, в котором она выполнялась до компиляции списка."""
+    stemmer_ru, stemmer_en = get_stemmer("ru"), get_stemmer("en")
+    banned_stems = {stemmer_ru.stem(word) for word in banned_words} | {stemmer_en.stem(word) for word in banned_words}
+    words = word_tokenize(text.lower())
+    word_stems = {stemmer_ru.stem(word) for word in words} | {stemmer_en.stem(word) for word in words}
+    return any(stem in banned_stems for stem in word_stems)
+
+
+def compiled_contains(matcher: BannedWordsMatcher, text: str) -> bool:
+    """Проверка по предварительно скомпилированному списку."""
+    return matcher.contains(tokenize(text.lower()))
+
+
+def measure(check: Callable[[str], bool], reviews: list[str]) -> float:
+    """Возвращает среднее время проверки одного отзыва в миллисекундах."""
+    started = time.perf_counter()
+    for review in reviews:
+        check(review)
+    return (time.perf_counter() - started) / len(reviews) * 1000
+
+
+def main() -> None:
+    rng = random.Random(42)
+    reviews = [f"Review title: Отзыв {i}. Review text: {REVIEW_SAMPLE}" for i in range(REVIEWS)]
+
+    print(f"{'Размер списка':>14} | {'Сборка, мс':>10} | {'Прежний, мс/отзыв':>18} | {'Новый, мс/отзыв':>16}")
+    for size in LIST_SIZES:
+        banned_words = [random_word(rng) for _ in range(size)]
+
+        started = time.perf_counter()
+        matcher = BannedWordsMatcher(banned_words)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        legacy_ms = measure(partial(legacy_contains, banned_words), reviews)
+        compiled_ms = measure(partial(compiled_contains, matcher), reviews)
+        print(f"{size:>14} | {build_ms:>10.1f} | {legacy_ms:>18.3f} | {compiled_ms:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Нагрузочный тест AI-модерации на локальной имитации GigaChat API.
+
+Запускает имитацию GigaChat в том же процессе, направляет на нее сервис и модерирует
+поток уникальных отзывов с заданной конкурентностью, как консьюмер при разборе
+отставания в Kafka. Выводит пропускную способность и перцентили времени модерации отзыва.
+Задержки и вердикты имитации генерируются с фиксированным зерном, поэтому прогоны
+воспроизводимы и не требуют обращений к платному API.
+
+Запуск из каталога automated_moderation_service:
+
+    PYTHONPATH=src:.. MODERATION_LOGGING_LEVEL=WARNING python benchmarks/llm_load.py --reviews 2000
+
+Режимы сервиса включаются обычными настройками, например GIGACHAT_BATCH_ENABLED=true,
+GIGACHAT_STREAM_ENABLED=true или GIGACHAT_HEDGE_ENABLED=true.
+"""
+
+# stdlib
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+
+# project
+from core.config import settings
+from core.metrics import Histogram, metrics
+from services.ai_service import AIModerationService
+from services.ai_service.fake_server import (
+    FakeGigaChatServer,
+    FakeServerConfig,
+)
+
+WORDS = ["фильм", "сюжет", "актеры", "музыка", "финал", "режиссер", "атмосфера", "диалоги", "сцена", "герой"]
+
+
+def build_reviews(count: int, seed: int) -> list[str]:
+    """Генерирует уникальные отзывы, чтобы кэши сервиса не снимали нагрузку с API."""
+    rng = random.Random(seed)
+    return [
+        f"Review title: Отзыв {number}. Review text: {' '.join(rng.choices(WORDS, k=rng.randint(20, 80)))}"
+        for number in range(count)
+    ]
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = FakeGigaChatServer(
+        FakeServerConfig(
+            latency_ms=args.latency_ms,
+            latency_sigma=args.latency_sigma,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            seed=args.seed,
+        )
+    )
+    await server.start()
+    base_url = f"http://127.0.0.1:{server.port}"
+    settings.gigachat.auth_url = f"{base_url}/api/v2/oauth"
+    settings.gigachat.chat_url = f"{base_url}/api/v1/chat/completions"
+    settings.verdict_cache.enabled = False
+
+    reviews = build_reviews(args.reviews, args.seed)
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for review in reviews:
+        queue.put_nowait(review)
+    latency = Histogram(window=len(reviews))
+    statuses: Counter[str] = Counter()
+
+    async def worker() -> None:
+        while not queue.empty():
+            review = queue.get_nowait()
+            started = time.perf_counter()
+            status, _, details = await AIModerationService.moderate_text(review)
+            latency.observe((time.perf_counter() - started) * 1000)
+            statuses[status] += 1
+            # Ответ после досрочного вердикта дочитывается до закрытия соединений
+            if details is not None:
+                await details
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    await AIModerationService.close()
+    await server.close()
+
+    summary = latency.snapshot()
+    print(f"Отзывов: {len(reviews)}, конкурентность: {args.concurrency}, запросов к API: {server.requests}")
+    print(f"Время: {elapsed:.2f} с, пропускная способность: {len(reviews) / elapsed:.1f} отзывов/с")
+    print(
+        f"Время модерации отзыва, мс: p50 {summary['p50']:.0f}, p95 {summary['p95']:.0f}, "
+        f"p99 {summary['p99']:.0f}, максимум {summary['max']:.0f}"
+    )
+    print("Статусы: " + ", ".join(f"{status} {count}" for status, count in sorted(statuses.items())))
+    llm_metrics = {name: value for name, value in metrics.snapshot().items() if name.startswith(("llm_", "circuit"))}
+    for name, value in sorted(llm_metrics.items()):
+        print(f"{name}: {value}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reviews", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=500.0, help="Медиана задержки ответа имитации, мс")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Разброс логнормальной задержки")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Доля ответов 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Доля ответов 429")
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
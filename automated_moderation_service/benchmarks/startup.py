@@ -0,0 +1,48 @@
+"""Проверка бюджета времени холодного запуска консьюмера.
+
+Измеряет время от запуска интерпретатора до готовности консьюмера к подключению
+к Kafka: импорт приложения и прогрев быстрой модерации. Kafka и сеть не нужны,
+поэтому проверку можно запускать в изолированном окружении.
+
+Запуск из каталога automated_moderation_service:
+
+    PYTHONPATH=src:.. python benchmarks/startup.py [бюджет в секундах]
+
+Возвращает ненулевой код, если медианное время запуска превышает бюджет.
+"""
+
+# stdlib
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 5
+DEFAULT_BUDGET = 3.0
+READY_SCRIPT = "from main import KafkaReviewConsumer; KafkaReviewConsumer.warm_up()"
+
+
+def measure_startup() -> float:
+    """Возвращает время от запуска процесса до готовности консьюмера в секундах."""
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", READY_SCRIPT],
+        check=True,
+        env={**os.environ, "MODERATION_LOGGING_LEVEL": "WARNING"},
+    )
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET
+    timings = [measure_startup() for _ in range(RUNS)]
+    median = statistics.median(timings)
+    print(f"Запусков: {RUNS}, медиана: {median:.3f} с, максимум: {max(timings):.3f} с, бюджет: {budget:.3f} с")
+    if median > budget:
+        print("Бюджет времени запуска превышен")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Бенчмарк токенизаторов быстрой модерации.
+
+Сравнивает nltk word_tokenize с регулярным выражением по времени разбиения отзыва
+и по полноте поиска запрещенных слов на корпусе отзывов реальной длины.
+
+Запуск из каталога automated_moderation_service:
+
+    PYTHONPATH=src:.. python benchmarks/tokenizer.py
+"""
+
+# stdlib
+import random
+import time
+
+# project
+from services.banned_words import BannedWordsMatcher
+from services.tokenizer import TOKENIZERS
+
+REVIEWS = 1_000
+MAX_REVIEW_LENGTH = 1_000
+BANNED_WORDS = ["мат", "оскорбление", "непристойность", "идиот", "damn", "плохое слово"]
+# Запрещенные слова в том виде, в котором они встречаются в отзывах: в других формах,
+# с заглавной буквы и вплотную к знакам препинания
+BANNED_FORMS = [
+    "мат",
+    "матом",
+    "Оскорбления",
+    "оскорблением!",
+    "непристойностью,",
+    "идиоты",
+    "«идиот»",
+    "Damn",
+    "damned...",
+    "плохое слово",
+    "плохие слова",
+]
+SENTENCES = [
+    "Фильм оставил очень приятное впечатление, актеры играют убедительно.",
+    "Сюжет держит в напряжении до самого конца, а музыка подчеркивает атмосферу.",
+    "Немного затянута середина, но в целом рекомендую посмотреть всей семьей.",
+    "Режиссер снова удивил: операторская работа - на высоте, диалоги живые.",
+    "Спецэффекты (особенно в финале) выглядят дешево, а 2-я часть вышла слабее.",
+    "The cast is great and the soundtrack is memorable.",
+    "Смотрел в кинотеатре 3D-версию - не стоит переплаты в 500 руб.",
+    "Кто-то скажет, что это шедевр; по-моему, обычный середнячок.",
+]
+
+
+def build_review(rng: random.Random, banned_form: str | None) -> str:
+    """Собирает отзыв из случайных предложений, при необходимости вставляя запрещенное слово."""
+    sentences: list[str] = []
+    while sum(len(sentence) + 1 for sentence in sentences) < rng.randint(200, MAX_REVIEW_LENGTH - 100):
+        sentences.append(rng.choice(SENTENCES))
+    if banned_form is not None:
+        words = rng.choice(sentences).split()
+        words.insert(rng.randint(0, len(words)), banned_form)
+        sentences[rng.randrange(len(sentences))] = " ".join(words)
+    return f"Review title: Отзыв. Review text: {' '.join(sentences)}"
+
+
+def main() -> None:
+    rng = random.Random(42)
+    corpus = [(build_review(rng, form), True) for form in rng.choices(BANNED_FORMS, k=REVIEWS // 2)]
+    corpus += [(build_review(rng, None), False) for _ in range(REVIEWS - len(corpus))]
+    rng.shuffle(corpus)
+    lowered = [text.lower() for text, _ in corpus]
+    average_length = sum(len(text) for text in lowered) / len(lowered)
+    print(f"Отзывов: {len(corpus)}, средняя длина: {average_length:.0f} символов")
+
+    print("Время указано в миллисекундах на отзыв")
+    print(f"{'Токенизатор':>11} | {'Разбиение':>9} | {'Проверка':>8} | {'Полнота':>7} | {'Ложные':>6}")
+    for name, tokenizer in TOKENIZERS.items():
+        started = time.perf_counter()
+        tokenized = [tokenizer(text) for text in lowered]
+        tokenize_ms = (time.perf_counter() - started) / len(lowered) * 1000
+
+        matcher = BannedWordsMatcher(BANNED_WORDS, tokenizer)
+        started = time.perf_counter()
+        found = [matcher.contains(words) for words in tokenized]
+        check_ms = (time.perf_counter() - started) / len(tokenized) * 1000
+
+        detected = sum(hit for hit, (_, banned) in zip(found, corpus, strict=True) if banned)
+        false_positives = sum(hit for hit, (_, banned) in zip(found, corpus, strict=True) if not banned)
+        recall = detected / sum(banned for _, banned in corpus)
+        print(f"{name:>11} | {tokenize_ms:>9.3f} | {check_ms:>8.3f} | {recall:>7.1%} | {false_positives:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""Обучение локального классификатора на вердиктах AI-модерации.
+
+Обучающие данные - выгрузка коллекции отзывов UGC API, где в `moderation_comment`
+сохранен результат автомодерации (`auto_moderation_result`):
+
+    mongoexport --db Movies --collection reviews --out reviews.jsonl
+
+Отзывы делятся на обучающую, калибровочную и тестовую выборки. На калибровочной выборке
+подбираются пороги, при которых решения классификатора совпадают с решениями AI с заданной
+точностью, а на отложенной тестовой выборке, не участвовавшей в подборе порогов, считается,
+какую долю обращений к AI классификатор снимет и как часто он расходится с AI.
+
+Запуск из каталога automated_moderation_service:
+
+    PYTHONPATH=src:.. python scripts/train_classifier.py reviews.jsonl classifier.json
+
+Путь к модели передается сервису в MODERATION_CLASSIFIER_MODEL_PATH.
+"""
+
+# stdlib
+import argparse
+import random
+from pathlib import Path
+
+# thirdparty
+import orjson
+
+# project
+from core.constants import COMBINED_TEXT_TEMPLATE, ModerationStatus
+from services.classifier import LocalClassifier, extract_features, sigmoid
+
+Sample = tuple[dict[int, float], int]
+
+
+def load_samples(path: str, num_features: int) -> list[Sample]:
+    """Читает отзывы с вердиктом AI и преобразует их в признаки.
+
+    Отзывы без результата автомодерации (решения быстрой модерации, классификатора,
+    ручной модерации) и отзывы, отправленные AI на ручную модерацию, пропускаются.
+
+    Returns:
+        Признаки отзыва и метка: 1 - отклонен, 0 - одобрен
+    """
+    samples: list[Sample] = []
+    for line in Path(path).read_bytes().splitlines():
+        if not line.strip():
+            continue
+        review = orjson.loads(line)
+        try:
+            verdict = orjson.loads(review.get("moderation_comment") or "")
+        except orjson.JSONDecodeError:
+            continue
+        if not isinstance(verdict, dict) or "confidence" not in verdict:
+            continue
+        if review.get("status") not in {ModerationStatus.APPROVED, ModerationStatus.REJECTED}:
+            continue
+        text = COMBINED_TEXT_TEMPLATE.format(title=review["title"], text=review["review_text"])
+        samples.append((extract_features(text, num_features), int(review["status"] == ModerationStatus.REJECTED)))
+    return samples
+
+
+def train(
+    samples: list[Sample], epochs: int, learning_rate: float, l2: float, seed: int
+) -> tuple[dict[int, float], float]:
+    """Обучает логистическую регрессию стохастическим градиентным спуском.
+
+    Returns:
+        Веса признаков и свободный член
+    """
+    rng = random.Random(seed)
+    weights: dict[int, float] = {}
+    bias = 0.0
+    order = list(range(len(samples)))
+    for epoch in range(epochs):
+        rng.shuffle(order)
+        rate = learning_rate / (1 + epoch)
+        for position in order:
+            features, label = samples[position]
+            logit = bias + sum(weights.get(index, 0.0) * value for index, value in features.items())
+            error = sigmoid(logit) - label
+            bias -= rate * error
+            for index, value in features.items():
+                weight = weights.get(index, 0.0)
+                weights[index] = weight - rate * (error * value + l2 * weight)
+    return weights, bias
+
+
+def pick_thresholds(scored: list[tuple[float, int]], precision: float) -> tuple[float, float]:
+    """Подбирает самые широкие пороги, при которых решения совпадают с AI с заданной точностью.
+
+    Returns:
+        Порог одобрения и порог отклонения
+    """
+    approve_threshold, reject_threshold = 0.0, 1.0
+    ascending = sorted(scored)
+    approved = 0
+    for taken, (score, label) in enumerate(ascending, start=1):
+        approved += 1 - label
+        # Граница зоны проходит по одобренному отзыву, иначе зона захватывает лишние ошибки
+        if not label and approved / taken >= precision:
+            approve_threshold = score
+    rejected = 0
+    for taken, (score, label) in enumerate(reversed(ascending), start=1):
+        rejected += label
+        if label and rejected / taken >= precision:
+            reject_threshold = score
+    if approve_threshold >= reject_threshold:
+        # Зоны решений не должны пересекаться: спорные отзывы остаются за AI
+        return 0.0, 1.0
+    return approve_threshold, reject_threshold
+
+
+def report(classifier: LocalClassifier, samples: list[Sample]) -> dict[str, float]:
+    """Считает долю решений классификатора и их расхождения с AI на выборке."""
+    approved = rejected = wrong = 0
+    for features, label in samples:
+        score = classifier.score_features(features)
+        if score <= classifier.approve_threshold:
+            approved += 1
+            wrong += label
+        elif score >= classifier.reject_threshold:
+            rejected += 1
+            wrong += 1 - label
+    total = len(samples) or 1
+    return {
+        "samples": len(samples),
+        "auto_approved": approved / total,
+        "auto_rejected": rejected / total,
+        "llm_call_reduction": (approved + rejected) / total,
+        "disagreement_with_llm": wrong / max(approved + rejected, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("reviews", help="Выгрузка отзывов в формате JSON Lines")
+    parser.add_argument("model", help="Файл для сохранения модели")
+    parser.add_argument("--num-features", type=int, default=2**18)
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--learning-rate", type=float, default=0.5)
+    parser.add_argument("--l2", type=float, default=1e-6)
+    parser.add_argument("--precision", type=float, default=0.99, help="Требуемая точность решений классификатора")
+    parser.add_argument("--calibration", type=float, default=0.2, help="Доля выборки для подбора порогов")
+    parser.add_argument("--test", type=float, default=0.2, help="Доля отложенной выборки для отчета")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--report", help="Файл для сохранения отчета в JSON")
+    args = parser.parse_args()
+
+    samples = load_samples(args.reviews, args.num_features)
+    random.Random(args.seed).shuffle(samples)
+    test_split = int(len(samples) * (1 - args.test))
+    calibration_split = int(len(samples) * (1 - args.test - args.calibration))
+    train_samples = samples[:calibration_split]
+    calibration_samples = samples[calibration_split:test_split]
+    test_samples = samples[test_split:]
+    if not train_samples or not calibration_samples or not test_samples:
+        parser.error("Недостаточно отзывов с вердиктами AI для обучения, подбора порогов и проверки")
+
+    weights, bias = train(train_samples, args.epochs, args.learning_rate, args.l2, args.seed)
+    classifier = LocalClassifier(weights, bias, args.num_features, approve_threshold=0.0, reject_threshold=1.0)
+    # Пороги подбираются на калибровочной выборке, а качество оценивается на тестовой:
+    # на выборке подбора порогов точность завышена
+    scored = [(classifier.score_features(features), label) for features, label in calibration_samples]
+    classifier.approve_threshold, classifier.reject_threshold = pick_thresholds(scored, args.precision)
+    classifier.save(args.model)
+
+    result = {
+        "train_samples": len(train_samples),
+        "calibration_samples": len(calibration_samples),
+        "approve_threshold": classifier.approve_threshold,
+        "reject_threshold": classifier.reject_threshold,
+        **report(classifier, test_samples),
+    }
+    for name, value in result.items():
+        print(f"{name:>22}: {value:.4f}" if isinstance(value, float) else f"{name:>22}: {value}")
+    if args.report:
+        Path(args.report).write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,3 @@
-from .config import settings, stemmer_en, stemmer_ru
+from .config import settings
 
-__all__ = ["settings", "stemmer_en", "stemmer_ru"]
+__all__ = ["settings"]
@@ -3,18 +3,26 @@ import logging
 from typing import Any
 
 # thirdparty
-import nltk
 import orjson
-from nltk.stem.snowball import SnowballStemmer
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# project
+from core.constants import AIProvider, Tokenizer
+
 
 class KafkaSettings(BaseSettings):
     """Настройки для подключения к Kafka."""
 
     topic: str = Field(default="ugc_reviews")
     bootstrap_servers: str = Field(default="kafka-0:9092")
+    max_concurrency: int = Field(default=10, ge=1, description="Максимум сообщений в обработке одновременно")
+    batch_enabled: bool = Field(default=False, description="Читать сообщения пакетами через getmany")
+    batch_max_records: int = Field(default=100, ge=1, description="Максимальный размер пакета")
+    batch_timeout_ms: int = Field(default=500, gt=0, description="Максимальное время набора пакета")
+    commit_interval: float = Field(
+        default=1.0, ge=0, description="Минимальный интервал между коммитами в пакетном режиме"
+    )
 
     model_config = SettingsConfigDict(env_prefix="MODERATION_KAFKA_")
 
@@ -28,7 +36,17 @@ class ModerationSettings(BaseSettings):
         json_schema_extra={"decoder": orjson.loads},  # type: ignore
     )
     check_links: bool = Field(default=False)
+    max_repeated_chars: int | None = Field(default=None, ge=1, description="Максимум повторов символа подряд")
+    max_caps_ratio: float | None = Field(default=None, gt=0, le=1, description="Максимальная доля заглавных букв")
+    caps_min_letters: int = Field(default=20, ge=1, description="Минимум букв для проверки доли заглавных")
+    check_phone_numbers: bool = Field(default=False)
+    check_obfuscated_words: bool = Field(default=False)
+    rule_costs: dict[str, float] = Field(default_factory=dict, description="Стоимости правил по имени правила")
     confidence: float = Field(default=0.7)
+    llm_provider: AIProvider = Field(default=AIProvider.GIGACHAT, description="Поставщик LLM для AI-модерации")
+    stem_cache_size: int = Field(default=100_000, ge=0, description="Размер LRU-кэша основ слов")
+    tokenizer: Tokenizer = Field(default=Tokenizer.REGEX, description="Токенизатор быстрой модерации")
+    classifier_model_path: str | None = Field(default=None, description="Файл модели локального классификатора")
 
     model_config = SettingsConfigDict(env_prefix="MODERATION_")
 
@@ -42,6 +60,66 @@ class LoggingSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="MODERATION_LOGGING_")
 
 
+class MetricsSettings(BaseSettings):
+    """Настройки вывода метрик."""
+
+    report_interval: float = Field(default=60.0, gt=0)
+
+    model_config = SettingsConfigDict(env_prefix="MODERATION_METRICS_")
+
+
+class VerdictCacheSettings(BaseSettings):
+    """Настройки кэша вердиктов AI-модерации."""
+
+    enabled: bool = Field(default=True)
+    max_size: int = Field(default=10_000, ge=0, description="Максимум вердиктов в памяти процесса")
+    ttl: float = Field(default=24 * 60 * 60, gt=0, description="Время жизни вердикта, с")
+    sqlite_path: str | None = Field(default=None, description="Файл SQLite для хранения вердиктов между запусками")
+    sqlite_max_size: int = Field(default=100_000, ge=1, description="Максимум вердиктов в SQLite")
+
+    model_config = SettingsConfigDict(env_prefix="MODERATION_VERDICT_CACHE_")
+
+
+class CircuitBreakerSettings(BaseSettings):
+    """Настройки предохранителя запросов к AI."""
+
+    enabled: bool = Field(default=True)
+    window: float = Field(default=60.0, gt=0, description="Окно статистики запросов, с")
+    min_requests: int = Field(default=20, ge=1, description="Минимум запросов в окне для срабатывания")
+    error_rate: float = Field(default=0.5, gt=0, le=1, description="Доля ошибок, при которой цепь размыкается")
+    slow_call_ms: float = Field(default=15_000, gt=0, description="Время ответа, начиная с которого запрос медленный")
+    slow_call_rate: float = Field(default=0.8, gt=0, le=1, description="Доля медленных запросов для размыкания")
+    open_duration: float = Field(default=30.0, gt=0, description="Время до пробного запроса, с")
+
+    model_config = SettingsConfigDict(env_prefix="MODERATION_CIRCUIT_BREAKER_")
+
+
+class NearDuplicateSettings(BaseSettings):
+    """Настройки поиска почти одинаковых отзывов."""
+
+    enabled: bool = Field(default=True)
+    threshold: float = Field(default=0.85, gt=0, le=1, description="Минимальное сходство Жаккара")
+    num_perm: int = Field(default=64, ge=1, description="Длина MinHash-сигнатуры")
+    bands: int = Field(default=16, ge=1, description="Количество полос LSH")
+    max_entries: int = Field(default=50_000, ge=0, description="Максимум отзывов в индексе")
+    max_memory_mb: int | None = Field(default=64, ge=1, description="Максимум памяти записей индекса, МБ")
+    reuse_approved: bool = Field(default=False, description="Переиспользовать вердикты approved, а не только rejected")
+    snapshot_path: str | None = Field(default=None, description="Файл снимка индекса")
+    snapshot_interval: float = Field(default=300.0, gt=0, description="Интервал сохранения снимка, с")
+
+    model_config = SettingsConfigDict(env_prefix="MODERATION_NEAR_DUPLICATES_")
+
+
+class ManualModerationSettings(BaseSettings):
+    """Настройки передачи отзывов на ручную модерацию."""
+
+    batch_enabled: bool = Field(default=False, description="Передавать отзывы пакетами через CreateReviewBatch")
+    batch_max_items: int = Field(default=100, ge=1, description="Максимум отзывов в одном пакете")
+    batch_window_ms: int = Field(default=50, ge=0, description="Время набора пакета отзывов, мс")
+
+    model_config = SettingsConfigDict(env_prefix="MODERATION_MANUAL_")
+
+
 class GigaChatSettings(BaseSettings):
     """Настройки для интеграции с GigaChat API."""
 
@@ -49,11 +127,35 @@ class GigaChatSettings(BaseSettings):
     chat_url: str = Field(default="https://gigachat.devices.sberbank.ru/api/v1/chat/completions")
     auth_header: str = Field(default="Bearer TOKEN")
     scope: str = Field(default="GIGACHAT_API_PERS")
+    token_refresh_margin: float = Field(default=60.0, description="За сколько секунд до истечения обновлять токен")
     model: str = Field(default="GigaChat")
     temperature: float = Field(default=0.0)
     max_tokens: int = Field(default=4096)
-    timeout: float = Field(default=10.0)
+    timeout: float = Field(default=10.0, description="Таймаут записи запроса и ожидания соединения из пула")
+    connect_timeout: float = Field(default=5.0)
+    read_timeout: float = Field(default=30.0)
+    max_connections: int = Field(default=20)
+    max_keepalive_connections: int = Field(default=10)
+    keepalive_expiry: float = Field(default=60.0)
     ssl_verify: bool = Field(default=False)
+    batch_enabled: bool = Field(default=False, description="Модерировать несколько отзывов одним запросом")
+    batch_max_items: int = Field(default=10, ge=1, description="Максимум отзывов в одном запросе")
+    batch_token_budget: int = Field(default=3000, ge=1, description="Оценка токенов отзывов в одном запросе")
+    batch_window_ms: int = Field(default=50, ge=0, description="Время набора пакета отзывов, мс")
+    rpm: int | None = Field(default=None, ge=1, description="Квота запросов в минуту, не задана - без ограничения")
+    tpm: int | None = Field(default=None, ge=1, description="Квота токенов в минуту, не задана - без ограничения")
+    rate_limit_burst_seconds: float = Field(default=5.0, gt=0, description="Емкость корзин лимитера в секундах квоты")
+    rate_limit_state_path: str | None = Field(default=None, description="Файл общего для процессов лимитера")
+    rate_limit_max_retries: int = Field(default=5, ge=0, description="Повторы запроса после ответа 429")
+    stream_enabled: bool = Field(default=False, description="Получать ответ потоком и выносить вердикт досрочно")
+    stream_early_statuses: list[str] = Field(
+        default_factory=lambda: ["approved"],
+        description="Статусы, при которых вердикт выносится до окончания ответа",
+    )
+    hedge_enabled: bool = Field(default=False, description="Дублировать запросы, не ответившие вовремя")
+    hedge_percentile: float = Field(default=95.0, gt=0, lt=100, description="Перцентиль времени ответа для дубля")
+    hedge_max_ratio: float = Field(default=0.05, ge=0, le=1, description="Максимальная доля дублирующих запросов")
+    hedge_min_samples: int = Field(default=100, ge=1, description="Минимум замеров времени ответа для дублей")
 
     model_config = SettingsConfigDict(env_prefix="GIGACHAT_")
 
@@ -65,6 +167,7 @@ class GigaChatSettings(BaseSettings):
             "credentials": {
                 "auth_header": self.auth_header,
                 "scope": self.scope,
+                "token_refresh_margin": self.token_refresh_margin,
             },
             "model_params": {
                 "model": self.model,
@@ -72,9 +175,33 @@ class GigaChatSettings(BaseSettings):
                 "stream": False,
                 "update_interval": 0,
                 "max_tokens": self.max_tokens,
+            },
+            "connection": {
                 "timeout": self.timeout,
+                "connect_timeout": self.connect_timeout,
+                "read_timeout": self.read_timeout,
+                "max_connections": self.max_connections,
+                "max_keepalive_connections": self.max_keepalive_connections,
+                "keepalive_expiry": self.keepalive_expiry,
             },
             "security": {"ssl_verify": self.ssl_verify},
+            "rate_limit": {
+                "rpm": self.rpm,
+                "tpm": self.tpm,
+                "burst_seconds": self.rate_limit_burst_seconds,
+                "state_path": self.rate_limit_state_path,
+                "max_retries": self.rate_limit_max_retries,
+            },
+            "streaming": {
+                "enabled": self.stream_enabled,
+                "early_statuses": set(self.stream_early_statuses),
+            },
+            "hedging": {
+                "enabled": self.hedge_enabled,
+                "percentile": self.hedge_percentile,
+                "max_ratio": self.hedge_max_ratio,
+                "min_samples": self.hedge_min_samples,
+            },
         }
 
 
@@ -84,9 +211,15 @@ class Settings(BaseSettings):
     kafka: KafkaSettings = KafkaSettings()
     moderation: ModerationSettings = ModerationSettings()  # type: ignore
     logging: LoggingSettings = LoggingSettings()
+    metrics: MetricsSettings = MetricsSettings()
+    verdict_cache: VerdictCacheSettings = VerdictCacheSettings()
+    near_duplicates: NearDuplicateSettings = NearDuplicateSettings()
+    circuit_breaker: CircuitBreakerSettings = CircuitBreakerSettings()
+    manual_moderation: ManualModerationSettings = ManualModerationSettings()
     gigachat: GigaChatSettings | None = None
     ugc_grpc_server_url: str = Field(default="ugc-grpc-server:50051")
     moderator_grpc_server_url: str = Field(default="moderation-grpc-server:50051")
+    grpc_channel_pool_size: int = Field(default=1, ge=1, description="Количество gRPC-соединений с каждым сервером")
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -102,11 +235,6 @@ try:
 except Exception as e:
     logging.warning(f"Не удалось загрузить настройки GigaChat: {e}")
 
-# Инициализация стеммеров для обработки текста
-nltk.download("punkt_tab")
-stemmer_ru = SnowballStemmer("russian")
-stemmer_en = SnowballStemmer("english")
-
 # Настройка логирования
 logging.basicConfig(
     level=getattr(logging, settings.logging.level.upper()),
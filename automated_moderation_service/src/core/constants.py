@@ -18,8 +18,34 @@ class ModerationStatus(StrEnum):
     PENDING = "pending"
 
 
+class Tokenizer(StrEnum):
+    """Токенизаторы текста для быстрой модерации."""
+
+    REGEX = "regex"
+    NLTK = "nltk"
+
+
+class AIProvider(StrEnum):
+    """Поставщики LLM для AI-модерации."""
+
+    GIGACHAT = "gigachat"
+
+
+class CircuitState(StrEnum):
+    """Состояния предохранителя запросов к AI."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
 # Сообщения при модерации
 FAST_MODERATION_FAIL_MESSAGE = "Текст не прошел быструю модерацию"
+LOCAL_CLASSIFIER_MESSAGE = "Решение принято локальным классификатором, вероятность нарушения: {score:.3f}"
+CIRCUIT_OPEN_MESSAGE = "AI-модерация временно недоступна"
+
+# Текст отзыва, передаваемый на модерацию
+COMBINED_TEXT_TEMPLATE = "Review title: {title}. Review text: {text}"
 
 
 # Системный промпт для GigaChat API
@@ -74,3 +100,22 @@ MODERATION_SYSTEM_PROMPT = """Представь,
 - confidence (от 0 до 1).
 
 Будь максимально строгим и внимательным к любым потенциальным нарушениям законодательства РФ."""
+
+
+# Дополнение системного промпта для модерации нескольких отзывов одним запросом
+MODERATION_BATCH_INSTRUCTIONS = """
+
+Тебе передается JSON-массив отзывов вида [{"id": 1, "text": "..."}].
+Оцени каждый отзыв независимо от остальных и верни JSON-объект
+{"results": [{"id": 1, "status": ..., "tags": ..., "issues": ..., "confidence": ...}]},
+в котором для каждого отзыва есть ровно один результат с тем же id и полями, описанными выше."""
+
+MODERATION_BATCH_SYSTEM_PROMPT = MODERATION_SYSTEM_PROMPT + MODERATION_BATCH_INSTRUCTIONS
+
+# Дополнение системного промпта для потоковой модерации: поля вердикта выводятся первыми,
+# чтобы решение можно было принять до окончания генерации списка нарушений
+MODERATION_STREAM_INSTRUCTIONS = """
+
+Поля status и confidence выводи первыми, перед tags и issues."""
+
+MODERATION_STREAM_SYSTEM_PROMPT = MODERATION_SYSTEM_PROMPT + MODERATION_STREAM_INSTRUCTIONS
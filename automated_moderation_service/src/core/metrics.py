@@ -0,0 +1,145 @@
+# stdlib
+import asyncio
+import logging
+import math
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+# thirdparty
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Количество последних наблюдений, по которым считаются перцентили гистограммы
+HISTOGRAM_WINDOW = 1024
+
+
+class Counter:
+    """Монотонно возрастающий счетчик."""
+
+    def __init__(self) -> None:
+        """Инициализирует счетчик."""
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        """Увеличивает значение счетчика.
+
+        Args:
+            amount: Величина увеличения
+        """
+        self.value += amount
+
+    def snapshot(self) -> int:
+        """Возвращает текущее значение счетчика."""
+        return self.value
+
+
+class Histogram:
+    """Распределение значений по скользящему окну последних наблюдений."""
+
+    def __init__(self, window: int = HISTOGRAM_WINDOW) -> None:
+        """Инициализирует гистограмму.
+
+        Args:
+            window: Количество последних наблюдений для расчета перцентилей
+        """
+        self.count = 0
+        self.total = 0.0
+        self._window: deque[float] = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        """Добавляет наблюдение.
+
+        Args:
+            value: Наблюдаемое значение
+        """
+        self.count += 1
+        self.total += value
+        self._window.append(value)
+
+    def percentile(self, percent: float) -> float:
+        """Возвращает перцентиль по окну последних наблюдений.
+
+        Args:
+            percent: Перцентиль от 0 до 100
+
+        Returns:
+            Значение перцентиля или 0, если наблюдений нет
+        """
+        if not self._window:
+            return 0.0
+        values = sorted(self._window)
+        index = min(len(values) - 1, max(0, math.ceil(percent / 100 * len(values)) - 1))
+        return values[index]
+
+    def snapshot(self) -> dict[str, float]:
+        """Возвращает сводку по распределению."""
+        return {
+            "count": self.count,
+            "avg": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": max(self._window, default=0.0),
+        }
+
+
+class MetricsRegistry:
+    """Реестр метрик процесса.
+
+    Метрики создаются при первом обращении по имени и периодически выводятся в лог
+    в формате JSON, откуда их забирает система сбора логов.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует реестр."""
+        self._counters: dict[str, Counter] = {}
+        self._histograms: dict[str, Histogram] = {}
+        self._gauges: dict[str, Callable[[], Any]] = {}
+
+    def counter(self, name: str) -> Counter:
+        """Возвращает счетчик по имени, создавая его при необходимости.
+
+        Args:
+            name: Имя метрики
+        """
+        return self._counters.setdefault(name, Counter())
+
+    def histogram(self, name: str) -> Histogram:
+        """Возвращает гистограмму по имени, создавая ее при необходимости.
+
+        Args:
+            name: Имя метрики
+        """
+        return self._histograms.setdefault(name, Histogram())
+
+    def gauge(self, name: str, collect: Callable[[], Any]) -> None:
+        """Регистрирует метрику, значение которой вычисляется в момент вывода.
+
+        Args:
+            name: Имя метрики
+            collect: Функция, возвращающая текущее значение метрики
+        """
+        self._gauges[name] = collect
+
+    def snapshot(self) -> dict[str, Any]:
+        """Возвращает текущие значения всех метрик."""
+        return {
+            **{name: counter.snapshot() for name, counter in self._counters.items()},
+            **{name: histogram.snapshot() for name, histogram in self._histograms.items()},
+            **{name: collect() for name, collect in self._gauges.items()},
+        }
+
+    async def report_periodically(self, interval: float) -> None:
+        """Периодически выводит значения метрик в лог.
+
+        Args:
+            interval: Интервал между выводами в секундах
+        """
+        while True:
+            await asyncio.sleep(interval)
+            logger.info(f"Метрики: {orjson.dumps(self.snapshot()).decode()}")
+
+
+metrics = MetricsRegistry()
@@ -1,8 +1,15 @@
-from .ai_service import GigaChatServiceError, InvalidAPIResponseError
+from .ai_service import (
+    CircuitOpenError,
+    GigaChatServiceError,
+    InvalidAPIResponseError,
+)
 from .base import ModerationServiceError
+from .manual_moderation import ManualModerationError
 
 __all__ = [
+    "CircuitOpenError",
     "GigaChatServiceError",
     "InvalidAPIResponseError",
+    "ManualModerationError",
     "ModerationServiceError",
 ]
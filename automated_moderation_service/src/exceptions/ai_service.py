@@ -11,3 +11,9 @@ class InvalidAPIResponseError(GigaChatServiceError):
     """Исключение для невалидных ответов API."""
 
     pass
+
+
+class CircuitOpenError(GigaChatServiceError):
+    """Исключение для запросов, остановленных разомкнутым предохранителем."""
+
+    pass
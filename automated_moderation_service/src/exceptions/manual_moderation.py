@@ -0,0 +1,7 @@
+from .base import ModerationServiceError
+
+
+class ManualModerationError(ModerationServiceError):
+    """Исключение для ошибок передачи отзывов на ручную модерацию."""
+
+    pass
@@ -1,37 +1,57 @@
 # stdlib
 import asyncio
 import logging
+import time
 
 # thirdparty
 import orjson
-from aiokafka import AIOKafkaConsumer
+from aiokafka import AIOKafkaConsumer, ConsumerRecord, TopicPartition
+from aiokafka.abc import ConsumerRebalanceListener
 
 # project
 from core.config import settings
 from core.constants import EventType, ModerationStatus
+from core.metrics import metrics
+from grpc_services.grpc_client.channel_pool import channel_pool
 from schemas.review_data import ReviewData
+from services.ai_service import AIModerationService
 from services.moderator import Moderator
+from services.near_duplicates import get_near_duplicate_index
+from services.offset_tracker import OffsetTracker
 from services.review_service import ReviewService
 
 logger = logging.getLogger(__name__)
 
 
 class KafkaReviewConsumer:
-    """Консьюмер для получения отзывов из Kafka."""
+    """Консьюмер для получения отзывов из Kafka.
+
+    Сообщения читаются по одному или пакетами (`batch_enabled`) и обрабатываются
+    конкурентно, но не более `max_concurrency` одновременно.
+    Сообщения с одинаковым ключом (идентификатором отзыва) обрабатываются строго
+    в порядке поступления, а смещения коммитятся только до последнего сообщения
+    непрерывно обработанного префикса каждой партиции.
+    """
 
     def __init__(self) -> None:
         """Инициализирует консьюмер Kafka."""
         self.consumer: AIOKafkaConsumer | None = None
+        self.offsets = OffsetTracker()
+        self._semaphore = asyncio.Semaphore(settings.kafka.max_concurrency)
+        self._commit_lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._key_tails: dict[bytes, asyncio.Task[None]] = {}
+        self._failure: BaseException | None = None
 
     async def setup_consumer(self) -> None:
         """Настраивает подключение к Kafka."""
         self.consumer = AIOKafkaConsumer(
-            settings.kafka.topic,
             bootstrap_servers=settings.kafka.bootstrap_servers,
             group_id="automated_moderation_service",
             auto_offset_reset="earliest",
             enable_auto_commit=False,
         )
+        self.consumer.subscribe([settings.kafka.topic], listener=RevocationListener(self))
         await self.consumer.start()
 
     @staticmethod
@@ -61,17 +81,177 @@ class KafkaReviewConsumer:
         elif event_type == EventType.REVIEW_DELETED and message.get("status") == ModerationStatus.PENDING:
             await ReviewService.delete_from_manual_moderation(review_id)
 
+    @staticmethod
+    def warm_up() -> None:
+        """Подготавливает обработку сообщений до подключения к Kafka."""
+        started = time.perf_counter()
+        Moderator.warm_up()
+        logger.info(f"Быстрая модерация подготовлена за {time.perf_counter() - started:.3f} с")
+
     async def consume(self) -> None:
         """Запускает процесс потребления сообщений из Kafka."""
+        channel_pool.configure(settings.grpc_channel_pool_size)
+        self.warm_up()
         await self.setup_consumer()
         assert self.consumer is not None
+        background = [asyncio.create_task(metrics.report_periodically(settings.metrics.report_interval))]
+        near_duplicate_index = get_near_duplicate_index()
+        snapshot_path = settings.near_duplicates.snapshot_path
+        if near_duplicate_index is not None and snapshot_path:
+            snapshots = near_duplicate_index.snapshot_periodically(
+                snapshot_path, settings.near_duplicates.snapshot_interval
+            )
+            background.append(asyncio.create_task(snapshots))
         try:
-            async for msg in self.consumer:
-                message = orjson.loads(msg.value)
-                await self.handle_message(message)
-                await self.consumer.commit()
+            if settings.kafka.batch_enabled:
+                await self._consume_batches()
+            else:
+                await self._consume_stream()
         finally:
+            for task in background:
+                task.cancel()
+            await self.drain()
             await self.consumer.stop()
+            await AIModerationService.close()
+            await channel_pool.close()
+            if near_duplicate_index is not None and snapshot_path:
+                near_duplicate_index.save(snapshot_path)
+
+    async def _consume_stream(self) -> None:
+        """Обрабатывает сообщения по одному, коммитя смещения после каждого сообщения."""
+        assert self.consumer is not None
+        async for msg in self.consumer:
+            await self._semaphore.acquire()
+            self._raise_on_failure()
+            self.dispatch(msg, orjson.loads(msg.value), commit=True)
+
+    async def _consume_batches(self) -> None:
+        """Обрабатывает сообщения пакетами, коммитя смещения не чаще `commit_interval`."""
+        loop = asyncio.get_running_loop()
+        last_commit = loop.time()
+        while True:
+            records = await self.fetch_batch()
+            if records:
+                metrics.histogram("kafka_batch_size").observe(len(records))
+                messages = [orjson.loads(msg.value) for msg in records]
+                for msg, message in zip(records, messages, strict=True):
+                    await self._semaphore.acquire()
+                    self._raise_on_failure()
+                    self.dispatch(msg, message, commit=False)
+            self._raise_on_failure()
+            if loop.time() - last_commit >= settings.kafka.commit_interval:
+                await self.commit()
+                last_commit = loop.time()
+
+    async def fetch_batch(self) -> list[ConsumerRecord]:
+        """Набирает пакет сообщений, ограниченный по размеру и времени ожидания.
+
+        Returns:
+            Сообщения пакета в порядке смещений внутри каждой партиции
+        """
+        assert self.consumer is not None
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.kafka.batch_timeout_ms / 1000
+        records: list[ConsumerRecord] = []
+        while len(records) < settings.kafka.batch_max_records:
+            remaining_ms = int((deadline - loop.time()) * 1000)
+            if remaining_ms <= 0 and records:
+                break
+            batches = await self.consumer.getmany(
+                timeout_ms=max(remaining_ms, 0),
+                max_records=settings.kafka.batch_max_records - len(records),
+            )
+            for partition_records in batches.values():
+                records.extend(partition_records)
+            if remaining_ms <= 0:
+                break
+        return records
+
+    def dispatch(self, msg: ConsumerRecord, message: dict[str, str], commit: bool) -> None:
+        """Запускает обработку сообщения в отдельной задаче.
+
+        Слот семафора должен быть захвачен заранее, он освобождается по завершении задачи.
+
+        Args:
+            msg: Сообщение из Kafka
+            message: Декодированное содержимое сообщения
+            commit: Коммитить смещения сразу после обработки сообщения
+        """
+        metrics.counter("kafka_messages_consumed").inc()
+        tp = TopicPartition(msg.topic, msg.partition)
+        self.offsets.add(tp, msg.offset)
+
+        # Сообщения об одном отзыве выстраиваются в цепочку за предыдущим
+        previous = self._key_tails.get(msg.key) if msg.key is not None else None
+        task = asyncio.create_task(self._process(message, tp, msg.offset, previous, commit))
+        self._tasks.add(task)
+        if msg.key is not None:
+            self._key_tails[msg.key] = task
+        task.add_done_callback(lambda done: self._on_task_done(done, msg.key))
+
+    async def _process(
+        self,
+        message: dict[str, str],
+        tp: TopicPartition,
+        offset: int,
+        previous: asyncio.Task[None] | None,
+        commit: bool,
+    ) -> None:
+        """Обрабатывает сообщение после завершения предыдущего сообщения с тем же ключом.
+
+        Args:
+            message: Декодированное содержимое сообщения
+            tp: Партиция сообщения
+            offset: Смещение сообщения
+            previous: Задача обработки предыдущего сообщения с тем же ключом
+            commit: Коммитить смещения сразу после обработки
+        """
+        if previous is not None:
+            await asyncio.wait([previous])
+        # После ошибки новые сообщения не обрабатываются, чтобы не нарушить порядок событий отзыва
+        self._raise_on_failure()
+        await self.handle_message(message)
+        self.offsets.complete(tp, offset)
+        if commit:
+            await self.commit()
+
+    def _on_task_done(self, task: asyncio.Task[None], key: bytes | None) -> None:
+        """Освобождает слот обработки и запоминает ошибку задачи.
+
+        Args:
+            task: Завершенная задача
+            key: Ключ сообщения
+        """
+        self._semaphore.release()
+        self._tasks.discard(task)
+        if key is not None and self._key_tails.get(key) is task:
+            del self._key_tails[key]
+        if not task.cancelled() and task.exception() is not None and self._failure is None:
+            # Смещение упавшего сообщения не коммитится, после перезапуска оно будет обработано повторно
+            self._failure = task.exception()
+
+    def _raise_on_failure(self) -> None:
+        """Прерывает потребление, если обработка одного из сообщений завершилась ошибкой."""
+        if self._failure is not None:
+            raise self._failure
+
+    async def commit(self) -> None:
+        """Коммитит смещения непрерывно обработанных сообщений."""
+        assert self.consumer is not None
+        async with self._commit_lock:
+            offsets = self.offsets.committable()
+            if not offsets:
+                return
+            await self.consumer.commit(offsets)
+            self.offsets.mark_committed(offsets)
+            metrics.counter("kafka_commits").inc()
+
+    async def drain(self) -> None:
+        """Дожидается завершения сообщений, взятых в обработку, и коммитит их смещения."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self.consumer is not None and self.consumer.assignment():
+            await self.commit()
 
     async def shutdown(self) -> None:
         """Закрывает подключение к Kafka."""
@@ -79,6 +259,34 @@ class KafkaReviewConsumer:
             await self.consumer.stop()
 
 
+class RevocationListener(ConsumerRebalanceListener):
+    """Завершает обработку сообщений отзываемых партиций до ребалансировки."""
+
+    def __init__(self, review_consumer: KafkaReviewConsumer) -> None:
+        """Инициализирует слушатель.
+
+        Args:
+            review_consumer: Консьюмер, обрабатывающий сообщения
+        """
+        self.review_consumer = review_consumer
+
+    async def on_partitions_revoked(self, revoked: set[TopicPartition]) -> None:
+        """Дожидается обработки сообщений и коммитит смещения до передачи партиций.
+
+        Args:
+            revoked: Отзываемые партиции
+        """
+        await self.review_consumer.drain()
+        self.review_consumer.offsets.forget(revoked)
+
+    async def on_partitions_assigned(self, assigned: set[TopicPartition]) -> None:
+        """Ничего не делает: позиции новых партиций берутся из закоммиченных смещений.
+
+        Args:
+            assigned: Назначенные партиции
+        """
+
+
 async def main() -> None:
     """Основная функция приложения."""
     logger.info("Запуск сервиса автоматической модерации")
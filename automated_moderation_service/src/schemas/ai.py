@@ -1,8 +1,9 @@
 # stdlib
+import asyncio
 from typing import Literal
 
 # thirdparty
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ModerationIssue(BaseModel):
@@ -14,12 +15,56 @@ class ModerationIssue(BaseModel):
 
 
 class ModerationResponse(BaseModel):
-    """Модель для представления результата модерации."""
+    """Модель для представления результата модерации.
+
+    Досрочный вердикт, вынесенный до окончания потокового ответа, не содержит тегов
+    и нарушений: полный результат возвращает `complete` после получения всего ответа.
+    """
 
     status: Literal["approved", "rejected", "pending"]
     tags: str | list[str]
     issues: list[dict[str, str | int | float]]
     confidence: float | int = Field(ge=0, le=1)
+    # Задача, дочитывающая ответ модели после досрочного вердикта
+    _details: "asyncio.Task[ModerationResponse] | None" = PrivateAttr(default=None)
+    # Системный промпт запроса, по ответу на который вынесен вердикт
+    _system_prompt: str | None = PrivateAttr(default=None)
+
+    @property
+    def is_complete(self) -> bool:
+        """Проверяет, что результат содержит весь ответ модели."""
+        return self._details is None
+
+    @property
+    def system_prompt(self) -> str | None:
+        """Возвращает системный промпт запроса, по ответу на который вынесен вердикт."""
+        return self._system_prompt
+
+    def set_system_prompt(self, system_prompt: str) -> "ModerationResponse":
+        """Запоминает системный промпт запроса, по ответу на который вынесен вердикт.
+
+        Args:
+            system_prompt: Системный промпт, отправленный в API
+
+        Returns:
+            Этот же результат модерации
+        """
+        self._system_prompt = system_prompt
+        return self
+
+    def defer_details(self, details: "asyncio.Task[ModerationResponse]") -> None:
+        """Отмечает результат как досрочный вердикт.
+
+        Args:
+            details: Задача, возвращающая полный результат модерации
+        """
+        self._details = details
+
+    async def complete(self) -> "ModerationResponse":
+        """Возвращает полный результат модерации, при необходимости дождавшись окончания ответа."""
+        if self._details is None:
+            return self
+        return await asyncio.shield(self._details)
 
 
 class ChatMessage(BaseModel):
@@ -0,0 +1,95 @@
+# stdlib
+import asyncio
+import logging
+
+# project
+from core.metrics import metrics
+from schemas import ModerationResponse
+from services.ai_service.rate_limiter import estimate_tokens
+from services.ai_service.service import ModerationService
+
+logger = logging.getLogger(__name__)
+
+
+class ModerationBatcher:
+    """Собирает одновременные запросы на модерацию в пакеты.
+
+    Тексты, поступившие в течение `window` секунд, отправляются одним запросом.
+    Пакет отправляется раньше, если набралось `max_items` текстов или их суммарная
+    оценка токенов достигла `token_budget`. При разборе отставания в Kafka запросов
+    много и пакеты заполняются, а одиночный отзыв ждет не дольше `window`.
+    """
+
+    def __init__(self, service: ModerationService, max_items: int, token_budget: int, window: float) -> None:
+        """Инициализирует сборщик пакетов.
+
+        Args:
+            service: Сервис модерации
+            max_items: Максимальное количество текстов в пакете
+            token_budget: Максимальная оценка токенов текстов пакета
+            window: Время ожидания текстов для пакета в секундах
+        """
+        self.service = service
+        self.max_items = max_items
+        self.token_budget = token_budget
+        self.window = window
+        self._pending: list[tuple[str, asyncio.Future[ModerationResponse]]] = []
+        self._pending_tokens = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, text: str) -> ModerationResponse:
+        """Добавляет текст в пакет и дожидается результата его модерации.
+
+        Args:
+            text: Текст для модерации
+
+        Returns:
+            Результат модерации
+        """
+        tokens = estimate_tokens(text)
+        if self._pending and self._pending_tokens + tokens > self.token_budget:
+            self._flush()
+        future: asyncio.Future[ModerationResponse] = asyncio.get_running_loop().create_future()
+        self._pending.append((text, future))
+        self._pending_tokens += tokens
+        if len(self._pending) >= self.max_items or self._pending_tokens >= self.token_budget:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Отправляет накопленный пакет в отдельной задаче."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending, self._pending_tokens = self._pending, [], 0
+        if not batch:
+            return
+        task = asyncio.create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: list[tuple[str, asyncio.Future[ModerationResponse]]]) -> None:
+        """Модерирует пакет и передает результаты ожидающим задачам.
+
+        Args:
+            batch: Тексты пакета и их ожидающие результаты
+        """
+        metrics.histogram("llm_batch_size").observe(len(batch))
+        texts = [text for text, _ in batch]
+        try:
+            if len(batch) == 1:
+                results: list[ModerationResponse | Exception] = [await self.service.moderate_text(texts[0])]
+            else:
+                results = await self.service.moderate_batch(texts)
+        except Exception as error:
+            results = [error] * len(batch)
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
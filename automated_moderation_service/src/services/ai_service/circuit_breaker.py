@@ -0,0 +1,138 @@
+# stdlib
+import logging
+import time
+from collections import deque
+
+# project
+from core.constants import CircuitState
+from core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Предохранитель запросов к AI по доле ошибок и медленных ответов.
+
+    Пока цепь замкнута, результаты запросов собираются в скользящем окне `window` секунд.
+    Если в окне не меньше `min_requests` запросов и доля ошибок или медленных ответов
+    достигла порога, цепь размыкается: запросы не выполняются в течение `open_duration`
+    секунд. Затем цепь становится полуоткрытой и пропускает один пробный запрос:
+    успешный быстрый ответ замыкает цепь, ошибка или медленный ответ снова размыкает.
+
+    Результат передается вместе с поколением `generation`, прочитанным сразу после
+    `allow_request`. Поколение меняется при каждой смене состояния и при допуске
+    пробного запроса, поэтому результаты запросов, начатых до размыкания цепи или до
+    нового пробного запроса, не учитываются: в полуоткрытом состоянии цепь переключает
+    только результат допущенного пробного запроса.
+    """
+
+    def __init__(
+        self,
+        window: float,
+        min_requests: int,
+        error_rate: float,
+        slow_call_seconds: float,
+        slow_call_rate: float,
+        open_duration: float,
+    ) -> None:
+        """Инициализирует предохранитель.
+
+        Args:
+            window: Окно статистики запросов в секундах
+            min_requests: Минимум запросов в окне для размыкания
+            error_rate: Доля ошибок для размыкания
+            slow_call_seconds: Время ответа, начиная с которого запрос считается медленным
+            slow_call_rate: Доля медленных запросов для размыкания
+            open_duration: Время в разомкнутом состоянии до пробного запроса в секундах
+        """
+        self.window = window
+        self.min_requests = min_requests
+        self.error_rate = error_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_duration = open_duration
+        self.state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe_started_at: float | None = None
+        self.generation = 0
+        # Результаты запросов в окне: время завершения, ошибка, медленный ответ
+        self._calls: deque[tuple[float, bool, bool]] = deque()
+        self._failures = 0
+        self._slow_calls = 0
+        self._rejected = metrics.counter("circuit_breaker_rejected")
+        metrics.gauge("circuit_breaker_state", lambda: self.state)
+
+    def allow_request(self) -> bool:
+        """Проверяет, можно ли выполнить запрос к AI.
+
+        Returns:
+            True, если запрос можно выполнить, иначе False
+        """
+        now = time.monotonic()
+        if self.state == CircuitState.OPEN and now - self._opened_at >= self.open_duration:
+            self._transition(CircuitState.HALF_OPEN)
+        if self.state == CircuitState.CLOSED:
+            return True
+        # Пробный запрос, не вернувший результат за open_duration (например, отмененный), заменяется новым
+        if self.state == CircuitState.HALF_OPEN and (
+            self._probe_started_at is None or now - self._probe_started_at >= self.open_duration
+        ):
+            self._probe_started_at = now
+            self.generation += 1
+            return True
+        self._rejected.inc()
+        return False
+
+    def record_success(self, duration: float, generation: int) -> None:
+        """Учитывает успешный запрос.
+
+        Args:
+            duration: Время выполнения запроса в секундах
+            generation: Поколение предохранителя на момент допуска запроса
+        """
+        self._record(generation, failed=False, slow=duration >= self.slow_call_seconds)
+
+    def record_failure(self, generation: int) -> None:
+        """Учитывает запрос, завершившийся ошибкой.
+
+        Args:
+            generation: Поколение предохранителя на момент допуска запроса
+        """
+        self._record(generation, failed=True, slow=False)
+
+    def _record(self, generation: int, failed: bool, slow: bool) -> None:
+        """Обновляет окно статистики и состояние цепи по результату запроса."""
+        if generation != self.generation:
+            # Запрос начат до смены состояния цепи или до нового пробного запроса
+            return
+        if self.state == CircuitState.HALF_OPEN:
+            self._probe_started_at = None
+            self._transition(CircuitState.OPEN if failed or slow else CircuitState.CLOSED)
+            return
+        now = time.monotonic()
+        self._calls.append((now, failed, slow))
+        self._failures += failed
+        self._slow_calls += slow
+        while self._calls and now - self._calls[0][0] > self.window:
+            _, old_failed, old_slow = self._calls.popleft()
+            self._failures -= old_failed
+            self._slow_calls -= old_slow
+        total = len(self._calls)
+        if total >= self.min_requests and (
+            self._failures / total >= self.error_rate or self._slow_calls / total >= self.slow_call_rate
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        """Переводит цепь в новое состояние."""
+        if state == CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        self.generation += 1
+        self._calls.clear()
+        self._failures = self._slow_calls = 0
+        if state == self.state:
+            return
+        log = logger.warning if state == CircuitState.OPEN else logger.info
+        log(f"Предохранитель запросов к AI: {self.state} -> {state}")
+        self.state = state
+        metrics.counter(f"circuit_breaker_{state}").inc()
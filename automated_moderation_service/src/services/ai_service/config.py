@@ -3,6 +3,14 @@ from typing import Any
 
 # project
 from core.config import settings
+from core.constants import AIProvider
+from services.ai_service.provider import LLMProvider
+from services.ai_service.repository import GigaChatRepository
+
+# Реализации поставщиков LLM по значению MODERATION_LLM_PROVIDER
+PROVIDERS: dict[AIProvider, type[LLMProvider]] = {
+    AIProvider.GIGACHAT: GigaChatRepository,
+}
 
 
 def get_api_config() -> dict[str, Any]:
@@ -18,3 +26,12 @@ def get_api_config() -> dict[str, Any]:
         raise ValueError("Настройки GigaChat не были загружены")
 
     return settings.gigachat.get_config()
+
+
+def create_provider() -> LLMProvider:
+    """Создает поставщика LLM, выбранного в настройках.
+
+    Returns:
+        Поставщик LLM с конфигурацией API из настроек приложения
+    """
+    return PROVIDERS[settings.moderation.llm_provider](get_api_config())
@@ -0,0 +1,313 @@
+"""Локальная имитация GigaChat API для нагрузочного тестирования.
+
+Сервер отвечает на запросы авторизации и чата в формате GigaChat, включая потоковые
+ответы (SSE) и пакетные запросы, с заданным распределением задержек, долей ошибок
+и ответов 429 и распределением вердиктов. Генератор случайных чисел инициализируется
+зерном, поэтому при одинаковой нагрузке прогоны воспроизводимы.
+
+Запуск из каталога automated_moderation_service:
+
+    PYTHONPATH=src:.. python -m services.ai_service.fake_server --port 8090 --latency-ms 800
+
+Сервис направляется на имитацию настройками:
+
+    GIGACHAT_AUTH_URL=http://127.0.0.1:8090/api/v2/oauth
+    GIGACHAT_CHAT_URL=http://127.0.0.1:8090/api/v1/chat/completions
+"""
+
+# stdlib
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+AUTH_PATH = "/api/v2/oauth"
+CHAT_PATH = "/api/v1/chat/completions"
+# Количество символов ответа в одном событии потока
+STREAM_CHUNK_SIZE = 16
+# Грубая оценка количества символов на один токен для поля usage
+CHARS_PER_TOKEN = 3
+
+
+@dataclass
+class FakeServerConfig:
+    """Поведение имитации GigaChat API."""
+
+    latency_ms: float = 500.0
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: float = 1.0
+    verdicts: dict[str, float] = field(default_factory=lambda: {"approved": 0.8, "rejected": 0.15, "pending": 0.05})
+    token_ttl: float = 30 * 60
+    seed: int = 42
+
+
+class FakeGigaChatServer:
+    """HTTP-сервер, имитирующий эндпоинты авторизации и чата GigaChat.
+
+    Задержка ответа на запрос чата имеет логнормальное распределение с медианой
+    `latency_ms` и параметром `latency_sigma`, что дает длинный хвост, как у реального API.
+    """
+
+    def __init__(self, config: FakeServerConfig) -> None:
+        """Инициализирует сервер.
+
+        Args:
+            config: Поведение имитации
+        """
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def port(self) -> int:
+        """Порт, на котором сервер принимает соединения."""
+        if self._server is None:
+            raise RuntimeError("Сервер не запущен")
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """Запускает сервер.
+
+        Args:
+            host: Адрес для приема соединений
+            port: Порт, 0 - любой свободный
+        """
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+
+    async def close(self) -> None:
+        """Останавливает сервер."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Обслуживает запросы одного keep-alive соединения."""
+        try:
+            while request := await self._read_request(reader):
+                method, path, body = request
+                if method == "POST" and path == AUTH_PATH:
+                    await self._send_json(writer, HTTPStatus.OK, self._auth_response())
+                elif method == "POST" and path == CHAT_PATH:
+                    await self._handle_chat(writer, json.loads(body))
+                else:
+                    await self._send_json(writer, HTTPStatus.NOT_FOUND, {"message": "Not found"})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, bytes] | None:
+        """Читает HTTP-запрос.
+
+        Returns:
+            Метод, путь и тело запроса или None, если клиент закрыл соединение
+        """
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        method, path, _ = request_line.decode().split(" ", 2)
+        content_length = 0
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode().partition(":")
+            if name.strip().lower() == "content-length":
+                content_length = int(value)
+        body = await reader.readexactly(content_length) if content_length else b""
+        return method, path.split("?", 1)[0], body
+
+    def _auth_response(self) -> dict[str, Any]:
+        """Возвращает ответ на запрос токена в формате GigaChat."""
+        return {
+            "access_token": uuid.uuid4().hex,
+            "expires_at": int((time.time() + self.config.token_ttl) * 1000),
+        }
+
+    async def _handle_chat(self, writer: asyncio.StreamWriter, request: dict[str, Any]) -> None:
+        """Отвечает на запрос чата с заданными задержкой, ошибками и вердиктами."""
+        self.requests += 1
+        roll = self.rng.random()
+        if roll < self.config.rate_limit_rate:
+            await self._send_json(
+                writer,
+                HTTPStatus.TOO_MANY_REQUESTS,
+                {"message": "Too many requests"},
+                headers={"Retry-After": str(self.config.retry_after)},
+            )
+            return
+        latency = self.config.latency_ms / 1000 * math.exp(self.config.latency_sigma * self.rng.gauss(0, 1))
+        if roll < self.config.rate_limit_rate + self.config.error_rate:
+            await asyncio.sleep(latency)
+            await self._send_json(writer, HTTPStatus.INTERNAL_SERVER_ERROR, {"message": "Internal error"})
+            return
+
+        messages = request.get("messages", [])
+        user_content = messages[-1]["content"] if messages else ""
+        content = json.dumps(self._moderation_content(user_content), ensure_ascii=False)
+        usage = {
+            "prompt_tokens": sum(len(message["content"]) for message in messages) // CHARS_PER_TOKEN,
+            "completion_tokens": len(content) // CHARS_PER_TOKEN,
+        }
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+        if request.get("stream"):
+            await self._send_stream(writer, content, usage, latency, request.get("model", "GigaChat"))
+            return
+        await asyncio.sleep(latency)
+        await self._send_json(
+            writer,
+            HTTPStatus.OK,
+            {
+                "choices": [
+                    {"message": {"role": "assistant", "content": content}, "index": 0, "finish_reason": "stop"}
+                ],
+                "created": int(time.time()),
+                "model": request.get("model", "GigaChat"),
+                "object": "chat.completion",
+                "usage": usage,
+            },
+        )
+
+    def _moderation_content(self, user_content: str) -> dict[str, Any]:
+        """Формирует ответ модели: вердикт одного текста или результаты пакета."""
+        try:
+            batch = json.loads(user_content)
+        except json.JSONDecodeError:
+            batch = None
+        if isinstance(batch, list):
+            return {"results": [{"id": item.get("id"), **self._verdict()} for item in batch if isinstance(item, dict)]}
+        return self._verdict()
+
+    def _verdict(self) -> dict[str, Any]:
+        """Выбирает вердикт по заданному распределению."""
+        statuses = list(self.config.verdicts)
+        status = self.rng.choices(statuses, weights=[self.config.verdicts[name] for name in statuses])[0]
+        issues = []
+        if status == "rejected":
+            issues.append(
+                {
+                    "code": "6",
+                    "category": "Законы о противодействии кибербулингу",
+                    "description": "Оскорбления и унижения в интернете",
+                    "law": "ст. 5.61.1 КоАП РФ",
+                }
+            )
+        return {
+            "status": status,
+            "confidence": round(self.rng.uniform(0.5, 0.7) if status == "pending" else self.rng.uniform(0.75, 1.0), 2),
+            "tags": ["risky"] if issues else ["legal"],
+            "issues": issues,
+        }
+
+    async def _send_json(
+        self,
+        writer: asyncio.StreamWriter,
+        status: HTTPStatus,
+        body: dict[str, Any],
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Отправляет ответ в формате JSON."""
+        payload = json.dumps(body, ensure_ascii=False).encode()
+        head = [f"HTTP/1.1 {status.value} {status.phrase}", "Content-Type: application/json"]
+        head += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        head.append(f"Content-Length: {len(payload)}")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + payload)
+        await writer.drain()
+
+    async def _send_stream(
+        self,
+        writer: asyncio.StreamWriter,
+        content: str,
+        usage: dict[str, int],
+        latency: float,
+        model: str,
+    ) -> None:
+        """Отправляет ответ потоком событий SSE, равномерно распределяя задержку по событиям."""
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nTransfer-Encoding: chunked\r\n\r\n",
+        )
+        chunks = [content[start : start + STREAM_CHUNK_SIZE] for start in range(0, len(content), STREAM_CHUNK_SIZE)]
+        delay = latency / max(len(chunks), 1)
+        for chunk in chunks:
+            await asyncio.sleep(delay)
+            event = {
+                "choices": [{"delta": {"content": chunk}, "index": 0}],
+                "created": int(time.time()),
+                "model": model,
+            }
+            self._write_chunk(writer, f"data: {json.dumps(event, ensure_ascii=False)}\n\n")
+            await writer.drain()
+        final = {"choices": [{"delta": {}, "index": 0, "finish_reason": "stop"}], "usage": usage, "model": model}
+        self._write_chunk(writer, f"data: {json.dumps(final)}\n\n")
+        self._write_chunk(writer, "data: [DONE]\n\n")
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    @staticmethod
+    def _write_chunk(writer: asyncio.StreamWriter, data: str) -> None:
+        """Записывает фрагмент ответа с кодированием chunked."""
+        encoded = data.encode()
+        writer.write(f"{len(encoded):x}\r\n".encode() + encoded + b"\r\n")
+
+
+def parse_verdicts(value: str) -> dict[str, float]:
+    """Разбирает распределение вердиктов вида approved:0.8,rejected:0.15,pending:0.05."""
+    verdicts = {}
+    for item in value.split(","):
+        status, _, weight = item.partition(":")
+        verdicts[status.strip()] = float(weight)
+    return verdicts
+
+
+async def serve(config: FakeServerConfig, host: str, port: int) -> None:
+    """Запускает сервер и обслуживает запросы до остановки процесса."""
+    server = FakeGigaChatServer(config)
+    await server.start(host, port)
+    logger.info(f"Имитация GigaChat API запущена на http://{host}:{server.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency-ms", type=float, default=500.0, help="Медиана задержки ответа, мс")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Разброс логнормальной задержки")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Доля ответов 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Доля ответов 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After ответов 429, с")
+    parser.add_argument("--verdicts", type=parse_verdicts, default="approved:0.8,rejected:0.15,pending:0.05")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    config = FakeServerConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        verdicts=args.verdicts,
+        seed=args.seed,
+    )
+    try:
+        asyncio.run(serve(config, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
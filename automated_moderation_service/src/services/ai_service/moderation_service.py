@@ -1,13 +1,33 @@
 # stdlib
+import asyncio
+import hashlib
 import json
 import logging
+from typing import ClassVar
 
 # project
 from core.config import settings
-from core.constants import ModerationStatus
-from services.ai_service.config import get_api_config
-from services.ai_service.repository import GigaChatRepository
+from core.constants import (
+    CIRCUIT_OPEN_MESSAGE,
+    MODERATION_BATCH_SYSTEM_PROMPT,
+    MODERATION_STREAM_SYSTEM_PROMPT,
+    MODERATION_SYSTEM_PROMPT,
+    ModerationStatus,
+)
+from core.metrics import metrics
+from exceptions import CircuitOpenError
+from schemas import ModerationResponse
+from services.ai_service.batcher import ModerationBatcher
+from services.ai_service.circuit_breaker import CircuitBreaker
+from services.ai_service.config import create_provider, get_api_config
+from services.ai_service.provider import LLMProvider
 from services.ai_service.service import ModerationService
+from services.ai_service.verdict_cache import (
+    MemoryVerdictStore,
+    SQLiteVerdictStore,
+    VerdictCache,
+    normalize_text,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,34 +35,223 @@ logger = logging.getLogger(__name__)
 class AIModerationService:
     """Сервис автоматической модерации контента через AI."""
 
-    @staticmethod
-    async def moderate_text(text: str) -> tuple[ModerationStatus, str]:
+    _repository: LLMProvider | None = None
+    _verdict_cache: VerdictCache | None = None
+    _batcher: ModerationBatcher | None = None
+    _circuit_breaker: CircuitBreaker | None = None
+    # Выполняющиеся запросы к API по хэшу нормализованного текста
+    _in_flight: ClassVar[dict[str, asyncio.Task[ModerationResponse]]] = {}
+    # Задачи, дочитывающие ответы после досрочных вердиктов
+    _details_tasks: ClassVar[set[asyncio.Task[str]]] = set()
+
+    @classmethod
+    def get_repository(cls) -> LLMProvider:
+        """Возвращает общего для процесса поставщика LLM с пулом соединений.
+
+        Returns:
+            Поставщик LLM, выбранный в настройках
+        """
+        if cls._repository is None:
+            cls._repository = create_provider()
+        return cls._repository
+
+    @classmethod
+    def get_batcher(cls) -> ModerationBatcher | None:
+        """Возвращает общий для процесса сборщик пакетов запросов.
+
+        Returns:
+            Сборщик пакетов или None, если пакетная модерация отключена
+        """
+        gigachat = settings.gigachat
+        if gigachat is None or not gigachat.batch_enabled:
+            return None
+        if cls._batcher is None:
+            cls._batcher = ModerationBatcher(
+                ModerationService(cls.get_repository(), cls.get_circuit_breaker()),
+                max_items=gigachat.batch_max_items,
+                token_budget=gigachat.batch_token_budget,
+                window=gigachat.batch_window_ms / 1000,
+            )
+        return cls._batcher
+
+    @classmethod
+    def get_verdict_cache(cls) -> VerdictCache | None:
+        """Возвращает общий для процесса кэш вердиктов.
+
+        Returns:
+            Кэш вердиктов или None, если кэширование отключено
+        """
+        cache_settings = settings.verdict_cache
+        if not cache_settings.enabled:
+            return None
+        if cls._verdict_cache is None:
+            persistent = None
+            if cache_settings.sqlite_path:
+                persistent = SQLiteVerdictStore(
+                    cache_settings.sqlite_path,
+                    max_size=cache_settings.sqlite_max_size,
+                    ttl=cache_settings.ttl,
+                )
+            api_config = get_api_config()
+            # Промпты запросов, которыми сервис может получить вердикт при текущих настройках
+            prompts = [
+                MODERATION_STREAM_SYSTEM_PROMPT if api_config["streaming"]["enabled"] else MODERATION_SYSTEM_PROMPT
+            ]
+            if settings.gigachat is not None and settings.gigachat.batch_enabled:
+                prompts.append(MODERATION_BATCH_SYSTEM_PROMPT)
+            cls._verdict_cache = VerdictCache(
+                prompts=prompts,
+                model=api_config["model_params"]["model"],
+                memory=MemoryVerdictStore(max_size=cache_settings.max_size, ttl=cache_settings.ttl),
+                persistent=persistent,
+            )
+        return cls._verdict_cache
+
+    @classmethod
+    def get_circuit_breaker(cls) -> CircuitBreaker | None:
+        """Возвращает общий для процесса предохранитель запросов к API.
+
+        Returns:
+            Предохранитель или None, если он отключен
+        """
+        breaker_settings = settings.circuit_breaker
+        if not breaker_settings.enabled:
+            return None
+        if cls._circuit_breaker is None:
+            cls._circuit_breaker = CircuitBreaker(
+                window=breaker_settings.window,
+                min_requests=breaker_settings.min_requests,
+                error_rate=breaker_settings.error_rate,
+                slow_call_seconds=breaker_settings.slow_call_ms / 1000,
+                slow_call_rate=breaker_settings.slow_call_rate,
+                open_duration=breaker_settings.open_duration,
+            )
+        return cls._circuit_breaker
+
+    @classmethod
+    async def close(cls) -> None:
+        """Закрывает соединения с API GigaChat и хранилище вердиктов."""
+        cls._batcher = None
+        if cls._repository is not None:
+            await cls._repository.close()
+            cls._repository = None
+        if cls._verdict_cache is not None:
+            cls._verdict_cache.close()
+            cls._verdict_cache = None
+
+    @classmethod
+    async def moderate_text(cls, text: str) -> tuple[ModerationStatus, str, asyncio.Task[str] | None]:
         """Выполняет модерацию текста через AI сервис.
 
+        Повторяющиеся тексты берутся из кэша вердиктов без обращения к API, а одновременные
+        запросы с одинаковым текстом объединяются в один запрос. Пока API недоступно или
+        отвечает слишком медленно, предохранитель сразу отправляет текст на ручную модерацию,
+        не дожидаясь повторных попыток.
+
+        Если вердикт вынесен досрочно по потоковому ответу, комментарий содержит только
+        статус и уверенность, а комментарий с тегами и нарушениями возвращает задача,
+        завершающаяся после получения всего ответа. Для ручной модерации ответ всегда
+        дочитывается, чтобы модераторы видели найденные нарушения.
+
         Args:
             text: Текст для модерации
 
         Returns:
-            Кортеж из статуса модерации и комментария
+            Кортеж из статуса модерации, комментария и задачи с полным комментарием
+            или None, если комментарий уже полный
         """
         try:
-            api_config = get_api_config()
-            repository = GigaChatRepository(api_config)
-            service = ModerationService(repository)
+            verdict_cache = cls.get_verdict_cache()
+            result = await verdict_cache.get(text) if verdict_cache is not None else None
+            if result is None:
+                result = await cls._moderate_once(text)
 
-            result = service.moderate_text(text)
-            auto_moderation_result = json.dumps(
-                result.model_dump(),
-                ensure_ascii=False,
-            )
             status = result.status
             # Проверяем уровень уверенности для определения необходимости ручной модерации
             if result.confidence < settings.moderation.confidence:
                 status = ModerationStatus.PENDING
+            if status == ModerationStatus.PENDING:
+                result = await result.complete()
 
-            return status, auto_moderation_result
+            details = None
+            if not result.is_complete:
+                details = asyncio.create_task(cls._complete_verdict(text, result))
+                cls._details_tasks.add(details)
+                details.add_done_callback(cls._details_tasks.discard)
+            return status, cls._format_comment(result), details
 
+        except CircuitOpenError:
+            # Предохранитель не допустил запрос к API: отзыв сразу уходит на ручную модерацию
+            return ModerationStatus.PENDING, CIRCUIT_OPEN_MESSAGE, None
         except Exception as error:
             logger.error(f"Ошибка при модерации текста: {error}", exc_info=True)
             # В случае ошибки отправляем на ручную модерацию
-            return ModerationStatus.PENDING, f"Ошибка AI-модерации: {error}"
+            return ModerationStatus.PENDING, f"Ошибка AI-модерации: {error}", None
+
+    @classmethod
+    async def _complete_verdict(cls, text: str, result: ModerationResponse) -> str:
+        """Дожидается полного результата досрочного вердикта и сохраняет его в кэш.
+
+        Args:
+            text: Текст для модерации
+            result: Досрочный вердикт
+
+        Returns:
+            Комментарий с полным результатом модерации
+        """
+        result = await result.complete()
+        verdict_cache = cls.get_verdict_cache()
+        if verdict_cache is not None:
+            await verdict_cache.set(text, result)
+        return cls._format_comment(result)
+
+    @staticmethod
+    def _format_comment(result: ModerationResponse) -> str:
+        """Возвращает результат модерации в виде комментария к отзыву."""
+        return json.dumps(result.model_dump(), ensure_ascii=False)
+
+    @classmethod
+    async def _moderate_once(cls, text: str) -> ModerationResponse:
+        """Модерирует текст, присоединяясь к уже выполняющемуся запросу с тем же текстом.
+
+        Запрос выполняется в отдельной задаче, поэтому отмена одного из ожидающих
+        не прерывает запрос для остальных.
+
+        Args:
+            text: Текст для модерации
+
+        Returns:
+            Результат модерации
+        """
+        key = hashlib.sha256(normalize_text(text).encode()).hexdigest()
+        task = cls._in_flight.get(key)
+        if task is not None:
+            metrics.counter("llm_calls_coalesced").inc()
+        else:
+            task = asyncio.create_task(cls._request_moderation(text))
+            cls._in_flight[key] = task
+            task.add_done_callback(lambda _: cls._in_flight.pop(key, None))
+        return await asyncio.shield(task)
+
+    @classmethod
+    async def _request_moderation(cls, text: str) -> ModerationResponse:
+        """Запрашивает модерацию текста у API и сохраняет вердикт в кэш.
+
+        Args:
+            text: Текст для модерации
+
+        Returns:
+            Результат модерации
+        """
+        # Предохранитель учитывает каждую попытку запроса внутри ModerationService,
+        # а не итог всех повторов
+        batcher = cls.get_batcher()
+        if batcher is not None:
+            result = await batcher.submit(text)
+        else:
+            result = await ModerationService(cls.get_repository(), cls.get_circuit_breaker()).moderate_text(text)
+        # Досрочный вердикт сохраняется в кэш после получения всего ответа
+        verdict_cache = cls.get_verdict_cache()
+        if verdict_cache is not None and result.is_complete:
+            await verdict_cache.set(text, result)
+        return result
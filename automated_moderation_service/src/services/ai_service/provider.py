@@ -0,0 +1,42 @@
+# stdlib
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from typing import Any
+
+
+class LLMProvider(ABC):
+    """Поставщик LLM для модерации текстов.
+
+    Ответы возвращаются в формате chat completions, который разбирает `ModerationService`.
+    Поставщик владеет соединениями с API и закрывается через `close`.
+    """
+
+    config: dict[str, Any]
+
+    @abstractmethod
+    async def send_moderation_request(self, text: str, system_prompt: str) -> dict[str, Any]:
+        """Отправка запроса на модерацию.
+
+        Args:
+            text: Текст для модерации
+            system_prompt: Системный промпт для AI
+
+        Returns:
+            Ответ API в формате chat completions
+        """
+
+    @abstractmethod
+    def stream_moderation_request(self, text: str, system_prompt: str) -> AsyncIterator[str]:
+        """Отправка запроса на модерацию с получением ответа потоком.
+
+        Args:
+            text: Текст для модерации
+            system_prompt: Системный промпт для AI
+
+        Yields:
+            Фрагменты текста ответа модели по мере генерации
+        """
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Закрывает соединения с API."""
@@ -0,0 +1,261 @@
+# stdlib
+import asyncio
+import fcntl
+import logging
+import os
+import struct
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Any, NamedTuple
+
+# project
+from core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Грубая оценка количества символов русского текста на один токен
+CHARS_PER_TOKEN = 3
+# Пауза по умолчанию после ответа 429 без заголовка Retry-After, с
+DEFAULT_RETRY_AFTER = 1.0
+
+
+class LimiterWait:
+    """Суммарное время ожидания лимитера за одну попытку запроса."""
+
+    def __init__(self) -> None:
+        """Инициализирует нулевое время ожидания."""
+        self.seconds = 0.0
+
+
+# Ожидание лимитера текущей попытки: вычитается из времени ответа, которое видит предохранитель
+limiter_wait: ContextVar[LimiterWait | None] = ContextVar("limiter_wait", default=None)
+
+
+def estimate_tokens(text: str) -> int:
+    """Оценивает количество токенов в тексте.
+
+    Args:
+        text: Текст
+    """
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def parse_retry_after(value: str | None) -> float:
+    """Возвращает паузу из заголовка Retry-After в секундах.
+
+    Args:
+        value: Значение заголовка: количество секунд или HTTP-дата
+    """
+    if not value:
+        return DEFAULT_RETRY_AFTER
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+class BucketState(NamedTuple):
+    """Состояние корзин лимитера."""
+
+    requests: float
+    tokens: float
+    updated_at: float
+    blocked_until: float
+
+
+class MemoryLimiterState:
+    """Состояние лимитера в памяти процесса."""
+
+    def __init__(self) -> None:
+        """Инициализирует пустое состояние."""
+        self._state: BucketState | None = None
+
+    def update(self, apply: Callable[[BucketState | None], tuple[BucketState, float]]) -> float:
+        """Атомарно изменяет состояние.
+
+        Args:
+            apply: Функция, возвращающая новое состояние и результат по текущему состоянию
+
+        Returns:
+            Результат функции
+        """
+        self._state, result = apply(self._state)
+        return result
+
+    def close(self) -> None:
+        """Ничего не освобождает: состояние живет вместе с процессом."""
+
+
+class FileLimiterState:
+    """Состояние лимитера в файле, общее для процессов одного хоста.
+
+    Изменения выполняются под исключительной блокировкой файла (flock), поэтому
+    процессы консьюмера расходуют один общий бюджет запросов и токенов.
+    """
+
+    FORMAT = struct.Struct("dddd")
+
+    def __init__(self, path: str) -> None:
+        """Открывает файл состояния, создавая его при необходимости.
+
+        Args:
+            path: Путь к файлу состояния
+        """
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+    def update(self, apply: Callable[[BucketState | None], tuple[BucketState, float]]) -> float:
+        """Атомарно изменяет состояние для всех процессов.
+
+        Args:
+            apply: Функция, возвращающая новое состояние и результат по текущему состоянию
+
+        Returns:
+            Результат функции
+        """
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            data = os.pread(self._fd, self.FORMAT.size, 0)
+            state = BucketState(*self.FORMAT.unpack(data)) if len(data) == self.FORMAT.size else None
+            new_state, result = apply(state)
+            os.pwrite(self._fd, self.FORMAT.pack(*new_state), 0)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return result
+
+    def close(self) -> None:
+        """Закрывает файл состояния."""
+        os.close(self._fd)
+
+
+class RateLimiter:
+    """Лимитер запросов и токенов в минуту на основе двух корзин токенов.
+
+    Корзины пополняются равномерно, а их емкость равна расходу за `burst_seconds`,
+    поэтому всплески сглаживаются, и запросы идут с темпом квоты, а не пачками.
+    Пауза из Retry-After останавливает все запросы, использующие то же состояние.
+    """
+
+    def __init__(
+        self,
+        rpm: int | None,
+        tpm: int | None,
+        burst_seconds: float,
+        state: MemoryLimiterState | FileLimiterState,
+    ) -> None:
+        """Инициализирует лимитер.
+
+        Args:
+            rpm: Квота запросов в минуту, None - без ограничения
+            tpm: Квота токенов в минуту, None - без ограничения
+            burst_seconds: Емкость корзин в секундах расхода квоты
+            state: Хранилище состояния корзин
+        """
+        self.requests_rate = rpm / 60 if rpm else None
+        self.tokens_rate = tpm / 60 if tpm else None
+        self.requests_capacity = max(self.requests_rate * burst_seconds, 1.0) if self.requests_rate else 0.0
+        self.tokens_capacity = max(self.tokens_rate * burst_seconds, 1.0) if self.tokens_rate else 0.0
+        self.state = state
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "RateLimiter":
+        """Создает лимитер по разделу `rate_limit` конфигурации API.
+
+        Args:
+            config: Настройки лимитера
+        """
+        state_path = config["state_path"]
+        return cls(
+            rpm=config["rpm"],
+            tpm=config["tpm"],
+            burst_seconds=config["burst_seconds"],
+            state=FileLimiterState(state_path) if state_path else MemoryLimiterState(),
+        )
+
+    def close(self) -> None:
+        """Освобождает хранилище состояния."""
+        self.state.close()
+
+    async def acquire(self, tokens: int) -> None:
+        """Дожидается бюджета на один запрос с указанной оценкой токенов.
+
+        Args:
+            tokens: Оценка токенов запроса
+        """
+        started = time.monotonic()
+        # Ожидающие запросы процесса обслуживаются по очереди, а не наперегонки
+        async with self._lock:
+            while (wait := self.state.update(lambda state: self._take(state, tokens))) > 0:
+                await asyncio.sleep(wait)
+        waited = time.monotonic() - started
+        metrics.histogram("llm_rate_limit_wait_ms").observe(waited * 1000)
+        attempt_wait = limiter_wait.get()
+        if attempt_wait is not None:
+            attempt_wait.seconds += waited
+
+    def record_usage(self, estimated: int, actual: int) -> None:
+        """Учитывает разницу между оценкой токенов запроса и фактическим расходом.
+
+        Args:
+            estimated: Оценка токенов, списанная при получении бюджета
+            actual: Фактический расход токенов по ответу API
+        """
+        if self.tokens_rate is None or actual == estimated:
+            return
+
+        def apply(state: BucketState | None) -> tuple[BucketState, float]:
+            state = self._refill(state)
+            return state._replace(tokens=state.tokens - (actual - estimated)), 0.0
+
+        self.state.update(apply)
+
+    def penalize(self, delay: float) -> None:
+        """Приостанавливает запросы после ответа 429.
+
+        Args:
+            delay: Пауза из заголовка Retry-After в секундах
+        """
+        logger.warning(f"Превышена квота GigaChat, запросы приостановлены на {delay:.1f} с")
+        metrics.counter("llm_rate_limited").inc()
+        blocked_until = time.time() + delay
+
+        def apply(state: BucketState | None) -> tuple[BucketState, float]:
+            state = self._refill(state)
+            return state._replace(blocked_until=max(state.blocked_until, blocked_until)), 0.0
+
+        self.state.update(apply)
+
+    def _refill(self, state: BucketState | None) -> BucketState:
+        """Пополняет корзины за время, прошедшее с последнего изменения."""
+        now = time.time()
+        if state is None:
+            return BucketState(self.requests_capacity, self.tokens_capacity, now, 0.0)
+        elapsed = max(now - state.updated_at, 0.0)
+        requests = min(self.requests_capacity, state.requests + elapsed * (self.requests_rate or 0.0))
+        tokens = min(self.tokens_capacity, state.tokens + elapsed * (self.tokens_rate or 0.0))
+        return BucketState(requests, tokens, now, state.blocked_until)
+
+    def _take(self, state: BucketState | None, tokens: int) -> tuple[BucketState, float]:
+        """Списывает бюджет запроса или возвращает время ожидания его пополнения."""
+        state = self._refill(state)
+        if state.blocked_until > state.updated_at:
+            return state, state.blocked_until - state.updated_at
+        wait = 0.0
+        if self.requests_rate is not None and state.requests < 1:
+            wait = (1 - state.requests) / self.requests_rate
+        # Запрос больше емкости корзины ждет полной корзины и уводит ее в минус
+        needed = min(tokens, self.tokens_capacity)
+        if self.tokens_rate is not None and state.tokens < needed:
+            wait = max(wait, (needed - state.tokens) / self.tokens_rate)
+        if wait > 0:
+            return state, wait
+        return state._replace(
+            requests=state.requests - (1 if self.requests_rate is not None else 0),
+            tokens=state.tokens - (tokens if self.tokens_rate is not None else 0),
+        ), 0.0
@@ -1,22 +1,46 @@
 # stdlib
+import asyncio
 import json
 import logging
+import time
 import uuid
+from collections.abc import AsyncIterator
+from contextvars import copy_context
+from http import HTTPStatus
 from typing import Any
 
 # thirdparty
 import backoff
-import requests
-from requests.exceptions import HTTPError, RequestException
+import httpx
 
 # project
+from core.metrics import metrics
 from exceptions import GigaChatServiceError, InvalidAPIResponseError
+from services.ai_service.provider import LLMProvider
+from services.ai_service.rate_limiter import (
+    RateLimiter,
+    estimate_tokens,
+    limiter_wait,
+    parse_retry_after,
+)
 
 logger = logging.getLogger(__name__)
 
+# Время жизни токена GigaChat, если API не вернул срок его действия
+DEFAULT_TOKEN_TTL = 30 * 60
+# Значения expires_at больше этого порога считаются переданными в миллисекундах
+MILLISECONDS_TIMESTAMP_THRESHOLD = 10**11
 
-class GigaChatRepository:
-    """Репозиторий для взаимодействия с GigaChat API."""
+
+class GigaChatRepository(LLMProvider):
+    """Репозиторий для взаимодействия с GigaChat API.
+
+    Использует один пул HTTP-соединений с keep-alive на всё время жизни репозитория,
+    поэтому экземпляр следует переиспользовать и закрывать через `close`.
+    Запросы к чату проходят через лимитер квот запросов и токенов в минуту.
+    Если включено дублирование, запрос, не ответивший за заданный перцентиль времени
+    ответа, дублируется, и используется ответ, пришедший первым.
+    """
 
     def __init__(self, config: dict[str, Any]) -> None:
         """Инициализирует репозиторий.
@@ -25,21 +49,92 @@ class GigaChatRepository:
             config: Конфигурация для работы с API
         """
         self.config = config
+        self._token: str | None = None
+        self._token_expires_at: float = 0.0
+        self._token_refresh_margin: float = config["credentials"]["token_refresh_margin"]
+        self._token_lock = asyncio.Lock()
+        self.rate_limiter = RateLimiter.from_config(config["rate_limit"])
+        self._rate_limit_retries: int = config["rate_limit"]["max_retries"]
+        self._hedging: dict[str, Any] = config["hedging"]
+        self._chat_latency = metrics.histogram("llm_chat_request_ms")
+        self._chat_requests = metrics.counter("llm_chat_requests")
+        self._hedged_requests = metrics.counter("llm_hedged_requests")
+        connection = config["connection"]
+        self.client = httpx.AsyncClient(
+            verify=config["security"]["ssl_verify"],
+            timeout=httpx.Timeout(
+                connection["timeout"],
+                connect=connection["connect_timeout"],
+                read=connection["read_timeout"],
+            ),
+            limits=httpx.Limits(
+                max_connections=connection["max_connections"],
+                max_keepalive_connections=connection["max_keepalive_connections"],
+                keepalive_expiry=connection["keepalive_expiry"],
+            ),
+        )
+
+    async def close(self) -> None:
+        """Закрывает пул HTTP-соединений и состояние лимитера."""
+        await self.client.aclose()
+        self.rate_limiter.close()
+
+    async def get_auth_token(self) -> str:
+        """Возвращает действующий bearer-токен, при необходимости обновляя его.
+
+        Токен кэшируется до момента незадолго до истечения срока действия. Если токен
+        нужно обновить, конкурентные задачи дожидаются одного общего запроса к API.
+
+        Returns:
+            Токен для авторизации
+
+        Raises:
+            GigaChatServiceError: При ошибке авторизации
+        """
+        token = self._get_cached_token()
+        if token is not None:
+            return token
+
+        async with self._token_lock:
+            # Токен мог быть обновлен другой задачей, пока мы ждали блокировку
+            token = self._get_cached_token()
+            if token is not None:
+                return token
+            token, self._token_expires_at = await self._request_auth_token()
+            self._token = token
+            return token
+
+    def invalidate_token(self, token: str) -> None:
+        """Сбрасывает кэшированный токен, если он был отклонен API.
+
+        Args:
+            token: Токен, с которым был получен ответ 401
+        """
+        # Токен мог быть уже обновлен другой задачей, его сбрасывать не нужно
+        if self._token == token:
+            self._token = None
+            self._token_expires_at = 0.0
+
+    def _get_cached_token(self) -> str | None:
+        """Возвращает кэшированный токен, если он не истечет в ближайшее время."""
+        if time.time() < self._token_expires_at - self._token_refresh_margin:
+            return self._token
+        return None
 
     @backoff.on_exception(
         backoff.expo,
-        (RequestException, HTTPError),
+        httpx.HTTPError,
         max_tries=1,
         jitter=backoff.full_jitter,
         on_backoff=lambda details: logger.warning(
             f"Повторная попытка {details['tries']} из-за ошибки: {details['exception']}"
         ),
     )
-    def get_auth_token(self) -> str:
-        """Получение bearer-токена для аутентификации.
+    async def _request_auth_token(self) -> tuple[str, float]:
+        """Запрос нового bearer-токена у API.
 
         Returns:
-            Токен для авторизации
+            Токен и время истечения его действия (unix-время в секундах)
 
         Raises:
             GigaChatServiceError: При ошибке авторизации
@@ -52,50 +147,53 @@ class GigaChatRepository:
                 "Authorization": self.config["credentials"]["auth_header"],
             }
 
-            response = requests.post(
+            response = await self.client.post(
                 self.config["auth_url"],
                 headers=headers,
-                data=f"scope={self.config['credentials']['scope']}",
-                verify=self.config["security"]["ssl_verify"],
-                timeout=self.config["model_params"]["timeout"],
+                content=f"scope={self.config['credentials']['scope']}",
             )
             response.raise_for_status()
-            return response.json()["access_token"]
+            response_json = response.json()
+            logger.info("Получен новый токен авторизации GigaChat")
+            return response_json["access_token"], self._parse_expires_at(response_json)
 
-        except requests.exceptions.RequestException as error:
+        except httpx.HTTPError as error:
             logger.error(f"Ошибка аутентификации: {error}")
             raise GigaChatServiceError("Не удалось получить токен авторизации") from error
 
-    @backoff.on_exception(
-        backoff.expo,
-        (RequestException, HTTPError, InvalidAPIResponseError),
-        max_tries=3,
-        jitter=backoff.full_jitter,
-        on_backoff=lambda details: logger.warning(
-            f"Повторная попытка {details['tries']} из-за ошибки: {details['exception']}"
-        ),
-    )
-    def send_moderation_request(self, text: str, system_prompt: str) -> str:
+    @staticmethod
+    def _parse_expires_at(response_json: dict[str, Any]) -> float:
+        """Определяет время истечения токена по ответу API.
+
+        GigaChat возвращает `expires_at` в миллисекундах, поэтому большие значения
+        переводятся в секунды. Если поле отсутствует, используется время жизни токена по умолчанию.
+        """
+        expires_at = response_json.get("expires_at")
+        if expires_at is None:
+            return time.time() + DEFAULT_TOKEN_TTL
+        expires_at = float(expires_at)
+        if expires_at > MILLISECONDS_TIMESTAMP_THRESHOLD:
+            expires_at /= 1000
+        return expires_at
+
+    async def send_moderation_request(self, text: str, system_prompt: str) -> dict[str, Any]:
         """Отправка запроса на модерацию.
 
+        Повторные попытки при ошибках выполняет `ModerationService`, здесь повторяются
+        только ответы 401 и 429.
+
         Args:
             text: Текст для модерации
             system_prompt: Системный промпт для AI
 
         Returns:
-            Ответ от API в виде строки JSON, которую можно сохранить как auto_moderation_result
+            Ответ от API в виде словаря, который можно сохранить как auto_moderation_result
 
         Raises:
             InvalidAPIResponseError: При ошибке в ответе API
             GigaChatServiceError: При ошибке взаимодействия с API
         """
         try:
-            token = self.get_auth_token()
-            headers = {
-                "Content-Type": "application/json",
-                "Accept": "application/json",
-                "Authorization": f"Bearer {token}",
-            }
             logger.debug(f"Text: {text}, System prompt: {system_prompt}, Config: {self.config}")
             payload = json.dumps(
                 {
@@ -106,17 +204,21 @@ class GigaChatRepository:
                     ],
                 }
             )
-            response = requests.post(
-                self.config["chat_url"],
-                headers=headers,
-                data=payload,
-                verify=self.config["security"]["ssl_verify"],
-            )
+            estimated_tokens = estimate_tokens(payload)
+            token = await self.get_auth_token()
+            response = await self._post_hedged_chat_request(payload, token, estimated_tokens)
+            if response.status_code == HTTPStatus.UNAUTHORIZED:
+                # Токен отозван или истек раньше срока: обновляем и повторяем запрос один раз
+                logger.warning("API отклонило токен авторизации, запрашиваем новый")
+                self.invalidate_token(token)
+                token = await self.get_auth_token()
+                response = await self._post_hedged_chat_request(payload, token, estimated_tokens)
             response.raise_for_status()
             response_json = response.json()
             logger.debug(f"Ответ от API: {response_json}")
             # Проверяем структуру ответа
             self.validate_api_response(response_json)
+            self._record_usage(response_json, estimated_tokens)
             return response_json
 
         except json.JSONDecodeError as error:
@@ -124,6 +226,202 @@ class GigaChatRepository:
             logger.error(f"Ошибка декодирования JSON: {error}. Ответ: {response.text}")
             raise InvalidAPIResponseError("Ответ API не содержит ожидаемого JSON") from error
 
+    async def _post_hedged_chat_request(self, payload: str, token: str, estimated_tokens: int) -> httpx.Response:
+        """Отправляет запрос к чату, дублируя его, если ответ задерживается.
+
+        Дубль отправляется, если первый запрос не ответил за перцентиль `percentile`
+        времени последних ответов. Используется ответ, пришедший первым, второй запрос
+        отменяется. Дубли проходят через лимитер и составляют не более `max_ratio`
+        от всех запросов.
+
+        Args:
+            payload: Тело запроса в формате JSON
+            token: Bearer-токен для авторизации
+            estimated_tokens: Оценка токенов запроса
+
+        Returns:
+            Ответ API
+        """
+        primary = asyncio.create_task(self._post_limited_chat_request(payload, token, estimated_tokens))
+        tasks = {primary}
+        try:
+            delay = self._hedge_delay()
+            if delay is None:
+                return await primary
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._can_hedge():
+                return await primary
+            self._hedged_requests.inc()
+            # Дубль ждет лимитер, пока основной запрос уже выполняется: это ожидание не вычитается
+            # из времени ответа попытки
+            hedge_context = copy_context()
+            hedge_context.run(limiter_wait.set, None)
+            hedge = asyncio.create_task(
+                self._post_limited_chat_request(payload, token, estimated_tokens), context=hedge_context
+            )
+            tasks.add(hedge)
+            while True:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tasks.discard(task)
+                    # Ошибка одного из запросов не важна, пока второй может ответить
+                    if task.exception() is None or not tasks:
+                        if task is hedge:
+                            metrics.counter("llm_hedge_wins").inc()
+                        return task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _hedge_delay(self) -> float | None:
+        """Возвращает задержку перед дублем в секундах или None, если запрос не дублируется."""
+        if not self._hedging["enabled"] or self._chat_latency.count < self._hedging["min_samples"]:
+            return None
+        return self._chat_latency.percentile(self._hedging["percentile"]) / 1000
+
+    def _can_hedge(self) -> bool:
+        """Проверяет, что еще один дубль не превысит допустимую долю дублирующих запросов."""
+        return self._hedged_requests.value + 1 <= self._hedging["max_ratio"] * self._chat_requests.value
+
+    async def _post_limited_chat_request(self, payload: str, token: str, estimated_tokens: int) -> httpx.Response:
+        """Отправляет запрос к чату в пределах квот API.
+
+        Ответ 429 не передается в backoff: его случайные паузы не учитывают Retry-After
+        и вместе с повторами других задач только продлевают превышение квоты. Вместо
+        этого лимитер приостанавливает все запросы на время из Retry-After, после чего
+        запрос повторяется не более `max_retries` раз.
+
+        Args:
+            payload: Тело запроса в формате JSON
+            token: Bearer-токен для авторизации
+            estimated_tokens: Оценка токенов запроса
+
+        Returns:
+            Ответ API
+        """
+        for _ in range(self._rate_limit_retries):
+            await self.rate_limiter.acquire(estimated_tokens)
+            response = await self._post_chat_request(payload, token)
+            if response.status_code != HTTPStatus.TOO_MANY_REQUESTS:
+                return response
+            self.rate_limiter.penalize(parse_retry_after(response.headers.get("Retry-After")))
+        await self.rate_limiter.acquire(estimated_tokens)
+        return await self._post_chat_request(payload, token)
+
+    async def stream_moderation_request(self, text: str, system_prompt: str) -> AsyncIterator[str]:
+        """Отправка запроса на модерацию с получением ответа потоком (SSE).
+
+        Args:
+            text: Текст для модерации
+            system_prompt: Системный промпт для AI
+
+        Yields:
+            Фрагменты текста ответа модели по мере генерации
+
+        Raises:
+            httpx.HTTPError: При ошибке взаимодействия с API
+            InvalidAPIResponseError: При ошибке в событии потока
+        """
+        payload = json.dumps(
+            {
+                **self.config["model_params"],
+                "stream": True,
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": text},
+                ],
+            }
+        )
+        estimated_tokens = estimate_tokens(payload)
+        token = await self.get_auth_token()
+        token_refreshed = False
+        rate_limit_retries = 0
+        while True:
+            await self.rate_limiter.acquire(estimated_tokens)
+            self._chat_requests.inc()
+            started = time.monotonic()
+            async with self.client.stream(
+                "POST",
+                self.config["chat_url"],
+                headers=self._chat_headers(token, accept="text/event-stream"),
+                content=payload,
+            ) as response:
+                if response.status_code == HTTPStatus.UNAUTHORIZED and not token_refreshed:
+                    logger.warning("API отклонило токен авторизации, запрашиваем новый")
+                    self.invalidate_token(token)
+                    token = await self.get_auth_token()
+                    token_refreshed = True
+                    continue
+                if (
+                    response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+                    and rate_limit_retries < self._rate_limit_retries
+                ):
+                    # Как и для обычных запросов, 429 повторяется после паузы лимитера по Retry-After
+                    self.rate_limiter.penalize(parse_retry_after(response.headers.get("Retry-After")))
+                    rate_limit_retries += 1
+                    continue
+                response.raise_for_status()
+                # Расход токенов приходит в последних событиях и учитывается один раз
+                last_chunk: dict[str, Any] = {}
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line.removeprefix("data:").strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        last_chunk = json.loads(data)
+                    except json.JSONDecodeError as error:
+                        raise InvalidAPIResponseError("Событие потока не содержит JSON") from error
+                    for choice in last_chunk.get("choices", []):
+                        content = choice.get("delta", {}).get("content")
+                        if content:
+                            yield content
+                self._chat_latency.observe((time.monotonic() - started) * 1000)
+                self._record_usage(last_chunk, estimated_tokens)
+                return
+
+    def _record_usage(self, response_json: dict[str, Any], estimated_tokens: int) -> None:
+        """Передает лимитеру фактический расход токенов из ответа API."""
+        usage = response_json.get("usage")
+        if isinstance(usage, dict) and isinstance(usage.get("total_tokens"), int):
+            self.rate_limiter.record_usage(estimated_tokens, usage["total_tokens"])
+
+    async def _post_chat_request(self, payload: str, token: str) -> httpx.Response:
+        """Отправляет запрос к чату с указанным токеном.
+
+        Args:
+            payload: Тело запроса в формате JSON
+            token: Bearer-токен для авторизации
+
+        Returns:
+            Ответ API
+        """
+        self._chat_requests.inc()
+        started = time.monotonic()
+        response = await self.client.post(
+            self.config["chat_url"],
+            headers=self._chat_headers(token),
+            content=payload,
+        )
+        if response.is_success:
+            self._chat_latency.observe((time.monotonic() - started) * 1000)
+        return response
+
+    @staticmethod
+    def _chat_headers(token: str, accept: str = "application/json") -> dict[str, str]:
+        """Возвращает заголовки запроса к чату.
+
+        Args:
+            token: Bearer-токен для авторизации
+            accept: Ожидаемый формат ответа
+        """
+        return {
+            "Content-Type": "application/json",
+            "Accept": accept,
+            "Authorization": f"Bearer {token}",
+        }
+
     def validate_api_response(self, response_json: dict[str, Any]) -> None:
         """Базовая проверка ответа API"""
         if not isinstance(response_json, dict):
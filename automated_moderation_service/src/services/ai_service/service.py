@@ -1,30 +1,58 @@
 # stdlib
+import asyncio
 import json
 import logging
-from typing import Any
+import re
+import time
+from collections.abc import Awaitable, Callable
+from http import HTTPStatus
+from typing import Any, TypeVar
 
 # thirdparty
 import backoff
+import httpx
+from pydantic import ValidationError
 
 # project
-from core.constants import MODERATION_SYSTEM_PROMPT
-from exceptions import InvalidAPIResponseError
+from core.constants import (
+    CIRCUIT_OPEN_MESSAGE,
+    MODERATION_BATCH_SYSTEM_PROMPT,
+    MODERATION_STREAM_SYSTEM_PROMPT,
+    MODERATION_SYSTEM_PROMPT,
+)
+from core.metrics import metrics
+from exceptions import CircuitOpenError, InvalidAPIResponseError
 from schemas import ChatResponse, ModerationResponse
-from services.ai_service.repository import GigaChatRepository
+from services.ai_service.circuit_breaker import CircuitBreaker
+from services.ai_service.provider import LLMProvider
+from services.ai_service.rate_limiter import LimiterWait, limiter_wait
 
 logger = logging.getLogger(__name__)
 
+# Завершенные поля вердикта в частично полученном JSON: число считается полным после разделителя
+STATUS_FIELD_PATTERN = re.compile(r'"status"\s*:\s*"(approved|rejected|pending)"')
+CONFIDENCE_FIELD_PATTERN = re.compile(r'"confidence"\s*:\s*(\d+(?:\.\d+)?)\s*[,}\n]')
+
+T = TypeVar("T")
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """Проверяет, что запрос отклонен по квоте после повторов лимитера и повторять его не нужно."""
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+
 
 class ModerationService:
     """Сервис для взаимодействия с API модерации контента."""
 
-    def __init__(self, repository: GigaChatRepository) -> None:
+    def __init__(self, repository: LLMProvider, circuit_breaker: CircuitBreaker | None = None) -> None:
         """Инициализирует сервис.
 
         Args:
-            repository: Репозиторий для работы с API
+            repository: Поставщик LLM
+            circuit_breaker: Предохранитель, учитывающий каждую попытку запроса к API
         """
         self.repository = repository
+        self.circuit_breaker = circuit_breaker
 
     def get_system_prompt(self) -> str:
         """Возвращает системный промт для модерации.
@@ -36,16 +64,22 @@ class ModerationService:
 
     @backoff.on_exception(
         backoff.expo,
-        InvalidAPIResponseError,
+        (httpx.HTTPError, InvalidAPIResponseError),
         max_tries=3,
         jitter=backoff.full_jitter,
+        giveup=is_rate_limited,
         on_backoff=lambda details: logger.warning(
-            f"Повторная попытка {details['tries']} из-за ошибки валидации: {details['exception']}"
+            f"Повторная попытка {details['tries']} из-за ошибки: {details['exception']}"
         ),
     )
-    def moderate_text(self, text: str) -> ModerationResponse:
+    async def moderate_text(self, text: str) -> ModerationResponse:
         """Модерация текста через GigaChat API с повторными попытками.
 
+        Это единственный уровень повторов запроса модерации: поставщик LLM сам повторяет
+        только ответы 401 и 429, а ответ 429, оставшийся после его повторов, здесь
+        не повторяется. Каждая попытка учитывается предохранителем, и после его
+        размыкания попытки прекращаются.
+
         Args:
             text: Текст для модерации
 
@@ -54,15 +88,175 @@ class ModerationService:
 
         Raises:
             InvalidAPIResponseError: При ошибке обработки ответа от API
+            CircuitOpenError: Если предохранитель не допустил очередную попытку
+        """
+        return await self._record_attempt(lambda: self._moderate_text_attempt(text))
+
+    async def _moderate_text_attempt(self, text: str) -> ModerationResponse:
+        """Выполняет одну попытку модерации текста.
+
+        Args:
+            text: Текст для модерации
+
+        Returns:
+            Результат модерации
         """
+        if self.repository.config["streaming"]["enabled"]:
+            return await self.moderate_text_streaming(text)
         system_prompt = self.get_system_prompt()
-        raw_response = self.repository.send_moderation_request(text, system_prompt)
+        raw_response = await self.repository.send_moderation_request(text, system_prompt)
         response = ChatResponse(**raw_response)
+        return self._parse_message_content(response.choices[0].message.content).set_system_prompt(system_prompt)
+
+    async def _record_attempt(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        """Выполняет попытку запроса к API, если ее допускает предохранитель, и передает ему результат.
+
+        Время ожидания в лимитере запросов не входит во время ответа: очередь к
+        собственной квоте не означает, что API отвечает медленно.
+
+        Args:
+            attempt: Функция, начинающая попытку запроса
+
+        Returns:
+            Результат попытки
+
+        Raises:
+            CircuitOpenError: Если предохранитель не допускает попытку
+        """
+        if self.circuit_breaker is None:
+            return await attempt()
+        if not self.circuit_breaker.allow_request():
+            raise CircuitOpenError(CIRCUIT_OPEN_MESSAGE)
+        generation = self.circuit_breaker.generation
+        wait = LimiterWait()
+        wait_token = limiter_wait.set(wait)
+        started = time.monotonic()
         try:
-            message_content = response.choices[0].message.content.strip("```json\n")  # noqa: B005
-            content = json.loads(message_content)
+            result = await attempt()
+        except Exception:
+            self.circuit_breaker.record_failure(generation)
+            raise
+        finally:
+            limiter_wait.reset(wait_token)
+        self.circuit_breaker.record_success(time.monotonic() - started - wait.seconds, generation)
+        return result
+
+    async def moderate_text_streaming(self, text: str) -> ModerationResponse:
+        """Модерация текста с получением ответа потоком.
+
+        Ответ разбирается по мере генерации. Если модель вывела завершенные поля `status`
+        и `confidence` и статус входит в `early_statuses`, вердикт возвращается сразу,
+        а ответ дочитывается в отдельной задаче: теги и нарушения доступны через
+        `ModerationResponse.complete`. Для остальных статусов возвращается полный ответ.
+
+        Args:
+            text: Текст для модерации
+
+        Returns:
+            Результат модерации
+
+        Raises:
+            InvalidAPIResponseError: При ошибке обработки ответа от API
+        """
+        verdict: asyncio.Future[ModerationResponse] = asyncio.get_running_loop().create_future()
+        reading = asyncio.create_task(self._read_stream(text, verdict))
+        try:
+            await asyncio.wait({reading, verdict}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            reading.cancel()
+            raise
+        if not verdict.done():
+            return reading.result()
+        early_verdict = verdict.result()
+        early_verdict.defer_details(reading)
+        return early_verdict
+
+    async def _read_stream(self, text: str, verdict: asyncio.Future[ModerationResponse]) -> ModerationResponse:
+        """Читает потоковый ответ модели до конца, вынося вердикт досрочно, когда это возможно.
+
+        Если после досрочного вердикта ответ не удалось дочитать или разобрать, полным
+        результатом считается досрочный вердикт.
+
+        Args:
+            text: Текст для модерации
+            verdict: Досрочный вердикт, заполняется, как только его можно вынести
+
+        Returns:
+            Результат модерации по всему ответу
+        """
+        started = time.monotonic()
+        early_statuses = self.repository.config["streaming"]["early_statuses"]
+        message_content = ""
+        system_prompt = MODERATION_STREAM_SYSTEM_PROMPT
+        stream = self.repository.stream_moderation_request(text, system_prompt)
+        try:
+            async for fragment in stream:
+                message_content += fragment
+                if verdict.done():
+                    continue
+                early_verdict = self._extract_early_verdict(message_content, early_statuses)
+                if early_verdict is not None:
+                    metrics.counter("llm_stream_early_verdicts").inc()
+                    metrics.histogram("llm_time_to_verdict_ms").observe((time.monotonic() - started) * 1000)
+                    verdict.set_result(early_verdict.set_system_prompt(system_prompt))
+            result = self._parse_message_content(message_content).set_system_prompt(system_prompt)
+        except Exception as error:
+            if not verdict.done():
+                raise
+            logger.warning(f"Не удалось получить нарушения после досрочного вердикта: {error}")
+            return verdict.result()
+        finally:
+            await stream.aclose()
+        if not verdict.done():
+            metrics.histogram("llm_time_to_verdict_ms").observe((time.monotonic() - started) * 1000)
+        elif result.status != verdict.result().status:
+            logger.warning(f"Полный ответ со статусом {result.status} расходится с досрочным вердиктом")
+            return verdict.result()
+        return result
+
+    def _extract_early_verdict(self, message_content: str, early_statuses: set[str]) -> ModerationResponse | None:
+        """Извлекает вердикт из начала ответа, если его можно вынести досрочно.
+
+        Args:
+            message_content: Полученная часть ответа модели
+            early_statuses: Статусы, при которых вердикт выносится досрочно
+
+        Returns:
+            Результат модерации без тегов и нарушений или None, если вердикт еще не получен
+        """
+        status = STATUS_FIELD_PATTERN.search(message_content)
+        if status is None or status.group(1) not in early_statuses:
+            return None
+        confidence = CONFIDENCE_FIELD_PATTERN.search(message_content)
+        if confidence is None:
+            return None
+        content: dict[str, Any] = {
+            "status": status.group(1),
+            "tags": [],
+            "issues": [],
+            "confidence": float(confidence.group(1)),
+        }
+        self._validate_moderation_response(content)
+        return ModerationResponse(**content)
+
+    def _parse_message_content(self, message_content: str) -> ModerationResponse:
+        """Разбирает полный ответ модели на запрос модерации одного текста.
+
+        Ответ без JSON передается на ручную модерацию с текстом ответа в описании нарушения.
+
+        Args:
+            message_content: Текст ответа модели
+
+        Returns:
+            Результат модерации
+
+        Raises:
+            InvalidAPIResponseError: Если ответ не соответствует ожидаемому формату
+        """
+        try:
+            content = json.loads(message_content.strip("```json\n"))  # noqa: B005, PLE1310
         except Exception as error:
-            logger.error(f"Ответ от API не содержит JSON:{error} {response.choices[0].message.content}")
+            logger.error(f"Ответ от API не содержит JSON:{error} {message_content}")
             content = {
                 "status": "pending",
                 "tags": [],
@@ -70,7 +264,7 @@ class ModerationService:
                     {
                         "code": "0",
                         "category": "Неизвестная ошибка",
-                        "description": response.choices[0].message.content,
+                        "description": message_content,
                         "law": "Неизвестная ошибка",
                     }
                 ],
@@ -80,6 +274,78 @@ class ModerationService:
         self._validate_moderation_response(content)
         return ModerationResponse(**content)
 
+    async def moderate_batch(self, texts: list[str]) -> list[ModerationResponse | Exception]:
+        """Модерация нескольких текстов одним запросом к GigaChat API.
+
+        Системный промпт передается один раз на все тексты. Если результат какого-либо
+        текста отсутствует или не проходит валидацию, этот текст модерируется отдельным
+        запросом. Ошибка модерации одного текста не влияет на остальные.
+
+        Args:
+            texts: Тексты для модерации
+
+        Returns:
+            Результаты модерации или ошибки в порядке текстов
+        """
+        items: dict[str, Any] = {}
+        try:
+            payload = json.dumps(
+                [{"id": index, "text": text} for index, text in enumerate(texts, start=1)],
+                ensure_ascii=False,
+            )
+            raw_response = await self._record_attempt(
+                lambda: self.repository.send_moderation_request(payload, MODERATION_BATCH_SYSTEM_PROMPT)
+            )
+            message_content = ChatResponse(**raw_response).choices[0].message.content
+            items = self._parse_batch_content(message_content)
+        except Exception as error:
+            logger.warning(f"Пакетная модерация не удалась, {len(texts)} текстов будут проверены по одному: {error}")
+
+        results: list[ModerationResponse | Exception | None] = []
+        for index in range(1, len(texts) + 1):
+            item = items.get(str(index))
+            try:
+                if not isinstance(item, dict):
+                    raise InvalidAPIResponseError(f"В пакетном ответе нет результата для текста {index}")
+                item = {field: value for field, value in item.items() if field != "id"}
+                self._validate_moderation_response(item)
+                results.append(ModerationResponse(**item).set_system_prompt(MODERATION_BATCH_SYSTEM_PROMPT))
+            except (InvalidAPIResponseError, ValidationError) as error:
+                logger.warning(f"Результат текста {index} из пакета отклонен: {error}")
+                results.append(None)
+
+        fallback = [index for index, result in enumerate(results) if result is None]
+        if fallback:
+            single_results = await asyncio.gather(
+                *(self.moderate_text(texts[index]) for index in fallback),
+                return_exceptions=True,
+            )
+            for index, result in zip(fallback, single_results, strict=True):
+                results[index] = result
+        return results  # type: ignore[return-value]
+
+    @staticmethod
+    def _parse_batch_content(message_content: str) -> dict[str, Any]:
+        """Разбирает ответ на пакетный запрос.
+
+        Args:
+            message_content: Текст ответа модели
+
+        Returns:
+            Результаты по идентификаторам текстов
+
+        Raises:
+            InvalidAPIResponseError: Если ответ не является JSON с результатами
+        """
+        try:
+            content = json.loads(message_content.strip().removeprefix("```json").removesuffix("```"))
+        except json.JSONDecodeError as error:
+            raise InvalidAPIResponseError("Пакетный ответ не содержит JSON") from error
+        items = content.get("results") if isinstance(content, dict) else content
+        if not isinstance(items, list):
+            raise InvalidAPIResponseError("Пакетный ответ не содержит списка результатов")
+        return {str(item["id"]): item for item in items if isinstance(item, dict) and "id" in item}
+
     def _validate_moderation_response(self, response: dict[str, Any]) -> None:
         """Полная валидация ответа модерации.
 
@@ -0,0 +1,255 @@
+# stdlib
+import asyncio
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Sequence
+
+# project
+from core.constants import ModerationStatus
+from core.metrics import metrics
+from schemas import ModerationResponse
+
+# Количество записей в SQLite, после которого запускается вытеснение устаревших
+SQLITE_EVICTION_INTERVAL = 100
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Приводит текст к виду, в котором копии одного отзыва совпадают.
+
+    Args:
+        text: Текст отзыва
+
+    Returns:
+        Текст в нормальной форме NFKC, в нижнем регистре и с одинарными пробелами
+    """
+    return WHITESPACE_PATTERN.sub(" ", unicodedata.normalize("NFKC", text)).strip().lower()
+
+
+class MemoryVerdictStore:
+    """Хранилище вердиктов в памяти процесса с TTL и вытеснением по LRU."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        """Инициализирует хранилище.
+
+        Args:
+            max_size: Максимальное количество вердиктов
+            ttl: Время жизни вердикта в секундах
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, ModerationResponse]] = OrderedDict()
+
+    def get(self, key: str) -> ModerationResponse | None:
+        """Возвращает вердикт, если он есть и не устарел.
+
+        Args:
+            key: Ключ вердикта
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: ModerationResponse, expires_at: float | None = None) -> None:
+        """Сохраняет вердикт, вытесняя давно не использованные.
+
+        Args:
+            key: Ключ вердикта
+            response: Результат модерации
+            expires_at: Время устаревания, по умолчанию через TTL
+        """
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (expires_at or time.time() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Возвращает количество вердиктов в хранилище."""
+        return len(self._entries)
+
+
+class SQLiteVerdictStore:
+    """Локальное хранилище вердиктов в SQLite, переживающее перезапуск процесса.
+
+    Запросы выполняются в потоке, чтобы не блокировать цикл событий записью на диск.
+    """
+
+    def __init__(self, path: str, max_size: int, ttl: float) -> None:
+        """Открывает базу и создает таблицу вердиктов.
+
+        Args:
+            path: Путь к файлу базы данных
+            max_size: Максимальное количество вердиктов
+            ttl: Время жизни вердикта в секундах
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS verdicts ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS verdicts_accessed_at ON verdicts (accessed_at)")
+
+    async def get(self, key: str) -> tuple[ModerationResponse, float] | None:
+        """Возвращает вердикт и время его устаревания, если вердикт есть и не устарел.
+
+        Args:
+            key: Ключ вердикта
+        """
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, response: ModerationResponse) -> None:
+        """Сохраняет вердикт.
+
+        Args:
+            key: Ключ вердикта
+            response: Результат модерации
+        """
+        await asyncio.to_thread(self._set, key, response)
+
+    def close(self) -> None:
+        """Закрывает соединение с базой."""
+        with self._lock:
+            self._connection.close()
+
+    def _get(self, key: str) -> tuple[ModerationResponse, float] | None:
+        """Читает вердикт и отмечает время обращения к нему."""
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, expires_at FROM verdicts WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE verdicts SET accessed_at = ? WHERE key = ?", (now, key))
+        return ModerationResponse.model_validate_json(row[0]), row[1]
+
+    def _set(self, key: str, response: ModerationResponse) -> None:
+        """Записывает вердикт и периодически вытесняет лишние."""
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO verdicts (key, response, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, response.model_dump_json(), now + self.ttl, now),
+            )
+            self._writes += 1
+            if self._writes % SQLITE_EVICTION_INTERVAL == 0:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Удаляет устаревшие вердикты и давно не использованные сверх лимита."""
+        self._connection.execute("DELETE FROM verdicts WHERE expires_at <= ?", (now,))
+        self._connection.execute(
+            "DELETE FROM verdicts WHERE key IN (SELECT key FROM verdicts ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_size,),
+        )
+
+
+class VerdictCache:
+    """Кэш вердиктов AI-модерации по хэшу содержимого отзыва.
+
+    Ключ строится из нормализованного текста, версии системного промпта, с которым
+    получен вердикт, и модели, поэтому смена промпта или модели не возвращает вердикты,
+    полученные со старыми. Одиночный, потоковый и пакетный запросы отправляют разные
+    промпты, поэтому вердикт ищется по каждому из промптов, которые отправляет сервис.
+    Поиск идет сначала в памяти процесса, затем в необязательном хранилище SQLite.
+    """
+
+    def __init__(
+        self,
+        prompts: Sequence[str],
+        model: str,
+        memory: MemoryVerdictStore,
+        persistent: SQLiteVerdictStore | None = None,
+    ) -> None:
+        """Инициализирует кэш.
+
+        Args:
+            prompts: Системные промпты, с которыми сервис запрашивает вердикты
+            model: Модель, выносящая вердикты
+            memory: Хранилище в памяти процесса
+            persistent: Локальное хранилище, переживающее перезапуск
+        """
+        self.prompts = list(prompts)
+        self.model = model
+        self.memory = memory
+        self.persistent = persistent
+        metrics.gauge("verdict_cache_size", lambda: len(self.memory))
+
+    def key(self, text: str, prompt: str) -> str:
+        """Возвращает ключ вердикта для текста.
+
+        Args:
+            text: Текст отзыва
+            prompt: Системный промпт, с которым получен вердикт
+        """
+        prompt_version = hashlib.sha256(prompt.encode()).hexdigest()[:16]
+        content = "\0".join((prompt_version, self.model, normalize_text(text)))
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    async def get(self, text: str) -> ModerationResponse | None:
+        """Возвращает сохраненный вердикт для текста.
+
+        Args:
+            text: Текст отзыва
+
+        Returns:
+            Результат модерации или None, если вердикта нет
+        """
+        keys = [self.key(text, prompt) for prompt in self.prompts]
+        for key in keys:
+            response = self.memory.get(key)
+            if response is not None:
+                metrics.counter("verdict_cache_memory_hits").inc()
+                return response
+        if self.persistent is not None:
+            for key in keys:
+                stored = await self.persistent.get(key)
+                if stored is not None:
+                    metrics.counter("verdict_cache_sqlite_hits").inc()
+                    response, expires_at = stored
+                    self.memory.set(key, response, expires_at)
+                    return response
+        metrics.counter("verdict_cache_misses").inc()
+        return None
+
+    async def set(self, text: str, response: ModerationResponse) -> None:
+        """Сохраняет вердикт для текста.
+
+        Неуверенные вердикты не сохраняются: такой отзыв все равно уйдет на ручную
+        модерацию, а повторный запрос к модели может дать определенный ответ.
+        Не сохраняются и вердикты, для которых неизвестен отправленный промпт.
+
+        Args:
+            text: Текст отзыва
+            response: Результат модерации
+        """
+        if response.status == ModerationStatus.PENDING or response.system_prompt is None:
+            return
+        key = self.key(text, response.system_prompt)
+        self.memory.set(key, response)
+        if self.persistent is not None:
+            await self.persistent.set(key, response)
+
+    def close(self) -> None:
+        """Закрывает локальное хранилище."""
+        if self.persistent is not None:
+            self.persistent.close()
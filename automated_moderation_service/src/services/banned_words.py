@@ -0,0 +1,154 @@
+# stdlib
+from collections.abc import Callable, Iterable, Sequence
+from functools import cache, lru_cache
+
+# thirdparty
+from nltk.stem.snowball import SnowballStemmer
+
+# project
+from core.config import settings
+from core.metrics import metrics
+from services.tokenizer import tokenize
+
+# Ключ, отмечающий в префиксном дереве конец запрещенной фразы
+PHRASE_END = ""
+
+# Языки стеммеров Snowball по коду языка
+STEMMER_LANGUAGES = {"ru": "russian", "en": "english"}
+
+
+@cache
+def get_stemmer(language: str) -> SnowballStemmer:
+    """Возвращает стеммер языка, создавая его при первом обращении.
+
+    Args:
+        language: Код языка
+
+    Returns:
+        Стеммер Snowball
+    """
+    return SnowballStemmer(STEMMER_LANGUAGES[language])
+
+
+@lru_cache(maxsize=settings.moderation.stem_cache_size)
+def stem(language: str, word: str) -> str:
+    """Возвращает основу слова с кэшированием результата.
+
+    Стеммеры Snowball написаны на чистом Python, а словарь отзывов сильно повторяется,
+    поэтому основы запоминаются в общем для процесса LRU-кэше.
+
+    Args:
+        language: Язык стеммера
+        word: Слово в нижнем регистре
+
+    Returns:
+        Основа слова
+    """
+    return get_stemmer(language).stem(word)
+
+
+def stem_variants(word: str) -> set[str]:
+    """Возвращает основы слова для всех поддерживаемых языков.
+
+    Args:
+        word: Слово в нижнем регистре
+
+    Returns:
+        Множество основ слова
+    """
+    return {stem(language, word) for language in STEMMER_LANGUAGES}
+
+
+def stem_cache_stats() -> dict[str, float]:
+    """Возвращает статистику кэша основ слов."""
+    info = stem.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "hit_rate": info.hits / lookups if lookups else 0.0,
+    }
+
+
+metrics.gauge("stem_cache", stem_cache_stats)
+
+
+class BannedWordsMatcher:
+    """Предварительно скомпилированный поиск запрещенных слов и фраз.
+
+    Однословные записи хранятся как множество основ, многословные фразы - как префиксное
+    дерево по последовательностям основ, по которому текст проходится за один проход.
+    Стоимость проверки зависит от длины текста и не зависит от размера списка.
+    """
+
+    def __init__(
+        self,
+        banned_words: Iterable[str],
+        tokenizer: Callable[[str], list[str]] = tokenize,
+    ) -> None:
+        """Компилирует список запрещенных слов.
+
+        Записи списка разбиваются тем же токенизатором, что и проверяемый текст,
+        иначе фраза может не совпасть с токенами отзыва.
+
+        Args:
+            banned_words: Запрещенные слова и фразы
+            tokenizer: Токенизатор текста
+        """
+        self.stems: set[str] = set()
+        # Узел дерева: переходы по основе слова и признак конца фразы
+        self._phrase_root: dict[str, dict] = {}
+        for entry in banned_words:
+            words = tokenizer(entry.lower())
+            if len(words) == 1:
+                self.stems |= stem_variants(words[0])
+            elif words:
+                self._add_phrase([stem_variants(word) for word in words])
+
+    def _add_phrase(self, phrase: list[set[str]]) -> None:
+        """Добавляет фразу в префиксное дерево.
+
+        Args:
+            phrase: Варианты основ для каждого слова фразы
+        """
+        nodes = [self._phrase_root]
+        for variants in phrase:
+            nodes = [node.setdefault(stem, {}) for node in nodes for stem in variants]
+        for node in nodes:
+            node[PHRASE_END] = {}
+
+    def contains(self, words: Sequence[str]) -> bool:
+        """Проверяет наличие запрещенных слов или фраз в тексте.
+
+        Args:
+            words: Слова текста в нижнем регистре по порядку
+
+        Returns:
+            True, если найдено запрещенное слово или фраза, иначе False
+        """
+        active: list[dict[str, dict]] = []
+        for word in words:
+            variants = stem_variants(word)
+            if not variants.isdisjoint(self.stems):
+                return True
+            if not self._phrase_root:
+                continue
+            active.append(self._phrase_root)
+            next_active = []
+            for node in active:
+                for stem in variants:
+                    child = node.get(stem)
+                    if child is None:
+                        continue
+                    if PHRASE_END in child:
+                        return True
+                    next_active.append(child)
+            active = next_active
+        return False
+
+
+@cache
+def get_banned_words_matcher() -> BannedWordsMatcher:
+    """Возвращает список запрещенных слов из настроек, компилируя его один раз на процесс."""
+    return BannedWordsMatcher(settings.moderation.banned_words)
@@ -0,0 +1,178 @@
+# stdlib
+import logging
+import math
+import zlib
+from collections import Counter
+from functools import cache
+from itertools import pairwise
+from pathlib import Path
+
+# thirdparty
+import orjson
+
+# project
+from core.config import settings
+from core.constants import ModerationStatus
+from core.metrics import metrics
+from services.ai_service.verdict_cache import normalize_text
+from services.tokenizer import regex_tokenize
+
+logger = logging.getLogger(__name__)
+
+# Версия формата признаков: модель, обученная с другой версией, не загружается
+FEATURES_VERSION = 1
+# Ограничение логита, при котором экспонента не переполняется
+MAX_LOGIT = 30.0
+
+
+def sigmoid(logit: float) -> float:
+    """Переводит логит в вероятность."""
+    return 1 / (1 + math.exp(-max(min(logit, MAX_LOGIT), -MAX_LOGIT)))
+
+
+def extract_features(text: str, num_features: int) -> dict[int, float]:
+    """Преобразует текст в разреженный вектор признаков методом хэширования.
+
+    Признаки - униграммы и биграммы слов нормализованного текста. Номер признака
+    берется из хэша n-граммы, знак значения - из старшего бита хэша, что уменьшает
+    смещение от коллизий. Вектор нормируется по длине.
+
+    Args:
+        text: Текст отзыва
+        num_features: Размерность пространства признаков
+
+    Returns:
+        Ненулевые признаки: номер признака и его значение
+    """
+    words = regex_tokenize(normalize_text(text))
+    ngrams = Counter(words)
+    ngrams.update(f"{left} {right}" for left, right in pairwise(words))
+    features: dict[int, float] = {}
+    for ngram, count in ngrams.items():
+        digest = zlib.crc32(ngram.encode())
+        index = digest % num_features
+        features[index] = features.get(index, 0.0) + (count if digest & 0x80000000 else -count)
+    norm = math.sqrt(sum(value * value for value in features.values()))
+    if norm:
+        features = {index: value / norm for index, value in features.items()}
+    return features
+
+
+class LocalClassifier:
+    """Линейный классификатор отзывов на хэшированных признаках.
+
+    Оценивает вероятность того, что AI отклонит отзыв. Отзывы с оценкой не выше
+    `approve_threshold` одобряются, не ниже `reject_threshold` - отклоняются,
+    остальные передаются AI.
+    """
+
+    def __init__(
+        self,
+        weights: dict[int, float],
+        bias: float,
+        num_features: int,
+        approve_threshold: float,
+        reject_threshold: float,
+    ) -> None:
+        """Инициализирует классификатор.
+
+        Args:
+            weights: Ненулевые веса признаков
+            bias: Свободный член
+            num_features: Размерность пространства признаков
+            approve_threshold: Максимальная вероятность отклонения для одобрения
+            reject_threshold: Минимальная вероятность отклонения для отклонения
+        """
+        self.weights = weights
+        self.bias = bias
+        self.num_features = num_features
+        self.approve_threshold = approve_threshold
+        self.reject_threshold = reject_threshold
+
+    def score(self, text: str) -> float:
+        """Возвращает вероятность отклонения отзыва.
+
+        Args:
+            text: Текст отзыва
+        """
+        return self.score_features(extract_features(text, self.num_features))
+
+    def score_features(self, features: dict[int, float]) -> float:
+        """Возвращает вероятность отклонения по вектору признаков.
+
+        Args:
+            features: Ненулевые признаки отзыва
+        """
+        weights = self.weights
+        return sigmoid(self.bias + sum(weights.get(index, 0.0) * value for index, value in features.items()))
+
+    def classify(self, text: str) -> tuple[ModerationStatus | None, float]:
+        """Выносит вердикт, если классификатор уверен.
+
+        Args:
+            text: Текст отзыва
+
+        Returns:
+            Статус модерации или None, если отзыв нужно проверить через AI, и вероятность отклонения
+        """
+        score = self.score(text)
+        if score >= self.reject_threshold:
+            metrics.counter("classifier_rejected").inc()
+            return ModerationStatus.REJECTED, score
+        if score <= self.approve_threshold:
+            metrics.counter("classifier_approved").inc()
+            return ModerationStatus.APPROVED, score
+        metrics.counter("classifier_uncertain").inc()
+        return None, score
+
+    def save(self, path: str) -> None:
+        """Сохраняет модель в JSON.
+
+        Args:
+            path: Путь к файлу модели
+        """
+        model = {
+            "features_version": FEATURES_VERSION,
+            "num_features": self.num_features,
+            "bias": self.bias,
+            "approve_threshold": self.approve_threshold,
+            "reject_threshold": self.reject_threshold,
+            "weights": {str(index): weight for index, weight in self.weights.items() if weight},
+        }
+        Path(path).write_bytes(orjson.dumps(model))
+
+    @classmethod
+    def load(cls, path: str) -> "LocalClassifier":
+        """Загружает модель из JSON.
+
+        Args:
+            path: Путь к файлу модели
+
+        Raises:
+            ValueError: Если модель обучена с другой версией признаков
+        """
+        model = orjson.loads(Path(path).read_bytes())
+        if model["features_version"] != FEATURES_VERSION:
+            raise ValueError(f"Модель обучена с версией признаков {model['features_version']}")
+        return cls(
+            weights={int(index): weight for index, weight in model["weights"].items()},
+            bias=model["bias"],
+            num_features=model["num_features"],
+            approve_threshold=model["approve_threshold"],
+            reject_threshold=model["reject_threshold"],
+        )
+
+
+@cache
+def get_local_classifier() -> LocalClassifier | None:
+    """Возвращает общий для процесса локальный классификатор.
+
+    Returns:
+        Классификатор или None, если модель не задана в настройках
+    """
+    model_path = settings.moderation.classifier_model_path
+    if not model_path:
+        return None
+    classifier = LocalClassifier.load(model_path)
+    logger.info(f"Загружен локальный классификатор: {len(classifier.weights)} ненулевых весов")
+    return classifier
@@ -0,0 +1,136 @@
+# stdlib
+import asyncio
+import logging
+from functools import cache
+
+# project
+from core.config import settings
+from core.metrics import metrics
+from exceptions import ManualModerationError
+from grpc_services.generated import moderator_pb2
+from grpc_services.grpc_client.moderator_client import ModeratorGRPCClient
+
+logger = logging.getLogger(__name__)
+
+
+class ManualModerationBatcher:
+    """Собирает отзывы для ручной модерации в пакеты.
+
+    Отзывы, поступившие в течение `window` секунд, передаются сервису ручной модерации
+    одним вызовом `CreateReviewBatch`, который добавляет их одной многострочной вставкой.
+    Пакет отправляется раньше, если набралось `max_items` отзывов.
+    """
+
+    def __init__(self, max_items: int, window: float) -> None:
+        """Инициализирует сборщик пакетов.
+
+        Args:
+            max_items: Максимальное количество отзывов в пакете
+            window: Время ожидания отзывов для пакета в секундах
+        """
+        self.max_items = max_items
+        self.window = window
+        self._pending: list[tuple[moderator_pb2.CreateReviewRequest, asyncio.Future[None]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, review: moderator_pb2.CreateReviewRequest) -> None:
+        """Добавляет отзыв в пакет и дожидается его передачи.
+
+        Args:
+            review: Отзыв для ручной модерации
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending.append((review, future))
+        if len(self._pending) >= self.max_items:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.window, self._flush)
+        await future
+
+    def _flush(self) -> None:
+        """Отправляет накопленный пакет в отдельной задаче."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _send(batch: list[tuple[moderator_pb2.CreateReviewRequest, asyncio.Future[None]]]) -> None:
+        """Передает пакет сервису ручной модерации и сообщает результат ожидающим задачам.
+
+        Пакет добавляется одной вставкой, поэтому один некорректный отзыв отклоняет его
+        целиком. В этом случае отзывы передаются по одному, и `ManualModerationError`
+        получают только задачи отзывов, которые сервис не принял и отдельно.
+
+        Args:
+            batch: Отзывы пакета и их ожидающие результаты
+        """
+        metrics.histogram("manual_moderation_batch_size").observe(len(batch))
+        results: list[BaseException | None]
+        try:
+            response = await ModeratorGRPCClient(settings.moderator_grpc_server_url).create_reviews(
+                review for review, _ in batch
+            )
+            if response.success:
+                results = [None] * len(batch)
+            else:
+                logger.warning(
+                    f"Пакет из {len(batch)} отзывов не принят ({response.message}), отзывы передаются по одному"
+                )
+                metrics.counter("manual_moderation_batch_fallbacks").inc()
+                results = await asyncio.gather(
+                    *(create_manual_review(review) for review, _ in batch), return_exceptions=True
+                )
+        except Exception as error:
+            results = [error] * len(batch)
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if result is not None:
+                future.set_exception(result)
+            else:
+                future.set_result(None)
+
+
+async def create_manual_review(review: moderator_pb2.CreateReviewRequest) -> None:
+    """Передает один отзыв сервису ручной модерации.
+
+    Args:
+        review: Отзыв для ручной модерации
+
+    Raises:
+        ManualModerationError: Если сервис не добавил отзыв
+    """
+    response = await ModeratorGRPCClient(settings.moderator_grpc_server_url).create_review(
+        user_id=review.user_id,
+        movie_id=review.movie_id,
+        review_id=review.review_id,
+        review_title=review.review_title,
+        review_text=review.review_text,
+        auto_moderation_result=review.auto_moderation_result,
+    )
+    if not response.success:
+        logger.error(f"Не удалось передать отзыв {review.review_id} на ручную модерацию: {response.message}")
+        raise ManualModerationError(response.message)
+
+
+@cache
+def get_manual_moderation_batcher() -> ManualModerationBatcher | None:
+    """Возвращает общий для процесса сборщик пакетов ручной модерации.
+
+    Returns:
+        Сборщик пакетов или None, если пакетная передача отключена
+    """
+    manual_settings = settings.manual_moderation
+    if not manual_settings.batch_enabled:
+        return None
+    return ManualModerationBatcher(
+        max_items=manual_settings.batch_max_items,
+        window=manual_settings.batch_window_ms / 1000,
+    )
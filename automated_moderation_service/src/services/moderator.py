@@ -1,19 +1,29 @@
 # stdlib
+import asyncio
 import logging
-import re
-
-# thirdparty
-from nltk import word_tokenize
 
 # project
-from core.config import settings, stemmer_en, stemmer_ru
-from core.constants import FAST_MODERATION_FAIL_MESSAGE, ModerationStatus
+from core.config import settings
+from core.constants import (
+    COMBINED_TEXT_TEMPLATE,
+    FAST_MODERATION_FAIL_MESSAGE,
+    LOCAL_CLASSIFIER_MESSAGE,
+    ModerationStatus,
+)
 from schemas.review_data import ReviewData
 from services.ai_service import AIModerationService
+from services.banned_words import get_banned_words_matcher
+from services.classifier import get_local_classifier
+from services.near_duplicates import Verdict, get_near_duplicate_index
 from services.review_service import ReviewService
+from services.rules import get_rule_pipeline
+from services.tokenizer import tokenize
 
 logger = logging.getLogger(__name__)
 
+# Текст, на котором прогревается быстрая модерация при запуске
+WARM_UP_TEXT = "Прогрев быстрой модерации. Fast moderation warm-up."
+
 
 class Moderator:
     """Сервис для модерации отзывов."""
@@ -24,17 +34,16 @@ class Moderator:
         Args:
             review_data: Данные отзыва
         """
-        self.combined_text = f"Review title: {review_data.title}. Review text: {review_data.text}"
+        self.combined_text = COMBINED_TEXT_TEMPLATE.format(title=review_data.title, text=review_data.text)
         self.review_data = review_data
-        self.banned_stems: set[str] = {stemmer_ru.stem(word) for word in settings.moderation.banned_words} | {
-            stemmer_en.stem(word) for word in settings.moderation.banned_words
-        }
 
     async def moderate_review(self) -> None:
         """Модерирует отзыв и обновляет его статус.
 
         Процесс включает быструю модерацию текста и заголовка совместно,
-        а затем, если нужно, модерацию через AI.
+        а затем, если нужно, модерацию через AI. Почти одинаковые отзывы получают
+        вердикт, уже вынесенный AI для ранее проверенного отзыва, а отзывы, в которых
+        уверен локальный классификатор, до AI не доходят.
         """
         # Выполняем быструю модерацию всего текста (заголовок + содержание)
         if not self.fast_moderate(self.combined_text):
@@ -45,8 +54,35 @@ class Moderator:
             )
             return None
 
+        # Переиспользуем уверенный вердикт почти такого же отзыва
+        near_duplicate_index = get_near_duplicate_index()
+        signature = None
+        if near_duplicate_index is not None:
+            # Сигнатура считается один раз и вне цикла событий, чтобы не задерживать другие отзывы
+            signature = await asyncio.to_thread(near_duplicate_index.signature, self.combined_text)
+            verdict = near_duplicate_index.lookup(signature)
+            if verdict is not None:
+                await ReviewService.update_status(
+                    review_id=self.review_data.review_id,
+                    status=verdict.status,
+                    comment=verdict.comment,
+                )
+                return None
+
+        # Очевидные случаи решает локальный классификатор
+        classifier = get_local_classifier()
+        if classifier is not None:
+            classifier_status, score = classifier.classify(self.combined_text)
+            if classifier_status is not None:
+                await ReviewService.update_status(
+                    review_id=self.review_data.review_id,
+                    status=classifier_status,
+                    comment=LOCAL_CLASSIFIER_MESSAGE.format(score=score),
+                )
+                return None
+
         # Если быстрая модерация пройдена, проверяем текст через AI
-        ai_status, ai_comment = await AIModerationService.moderate_text(self.combined_text)
+        ai_status, ai_comment, ai_details = await AIModerationService.moderate_text(self.combined_text)
         if ai_status in (
             ModerationStatus.APPROVED,
             ModerationStatus.REJECTED,
@@ -56,6 +92,20 @@ class Moderator:
                 status=ai_status,
                 comment=ai_comment,
             )
+            # Досрочный вердикт дополняется тегами и нарушениями после получения всего ответа
+            if ai_details is not None:
+                ai_comment = await ai_details
+                await ReviewService.update_status(
+                    review_id=self.review_data.review_id,
+                    status=ai_status,
+                    comment=ai_comment,
+                )
+            if (
+                near_duplicate_index is not None
+                and signature is not None
+                and (ai_status == ModerationStatus.REJECTED or settings.near_duplicates.reuse_approved)
+            ):
+                near_duplicate_index.add(signature, Verdict(ai_status, ai_comment))
             return None
 
         # Если AI не уверен, отправляем на ручную модерацию
@@ -77,36 +127,16 @@ class Moderator:
         Returns:
             True, если текст прошел быструю модерацию, иначе False
         """
-        if len(text) > settings.moderation.max_length:
-            return False
-        if self.contains_banned_words(text):
-            return False
-        if settings.moderation.check_links and self.contains_links(text):
-            return False
-        return True
-
-    def contains_banned_words(self, text: str) -> bool:
-        """Проверяет наличие запрещенных слов в тексте.
-
-        Args:
-            text: Текст для проверки
-
-        Returns:
-            True, если в тексте есть запрещенные слова, иначе False
-        """
-        words = word_tokenize(text.lower())
-        word_stems = {stemmer_ru.stem(word) for word in words} | {stemmer_en.stem(word) for word in words}
-        return any(stem in self.banned_stems for stem in word_stems)
+        return get_rule_pipeline().check(text) is None
 
     @staticmethod
-    def contains_links(text: str) -> bool:
-        """Проверяет наличие ссылок в тексте.
+    def warm_up() -> None:
+        """Подготавливает быструю модерацию до получения первого отзыва.
 
-        Args:
-            text: Текст для проверки
-
-        Returns:
-            True, если в тексте есть ссылки, иначе False
+        Собирает цепочку правил, компилирует список запрещенных слов, загружает данные
+        токенизатора и модель классификатора, чтобы первый отзыв не ждал инициализации,
+        а отсутствие данных обнаружилось при запуске.
         """
-        url_pattern = r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+"
-        return bool(re.search(url_pattern, text))
+        get_rule_pipeline()
+        get_banned_words_matcher().contains(tokenize(WARM_UP_TEXT.lower()))
+        get_local_classifier()
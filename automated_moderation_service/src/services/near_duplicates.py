@@ -0,0 +1,280 @@
+# stdlib
+import asyncio
+import logging
+import random
+import sys
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+# thirdparty
+import orjson
+
+# project
+from core.config import settings
+from core.constants import ModerationStatus
+from core.metrics import metrics
+from services.ai_service.verdict_cache import normalize_text
+from services.tokenizer import regex_tokenize
+
+logger = logging.getLogger(__name__)
+
+# Простое число Мерсенна 2^61 - 1 для универсального хэширования
+MERSENNE_PRIME = (1 << 61) - 1
+# Зерно генератора хэш-функций: одинаковое во всех процессах, чтобы снимки оставались совместимыми
+HASH_SEED = 20250301
+SHINGLE_SIZE = 5
+# Оценка памяти на одну полосу записи: ключ полосы, элемент словаря и множество отзывов, байт
+BAND_ENTRY_BYTES = 128
+
+
+@dataclass(frozen=True, slots=True)
+class Verdict:
+    """Вердикт модерации, который можно переиспользовать для похожего отзыва."""
+
+    status: ModerationStatus
+    comment: str
+
+
+def shingles(text: str) -> set[int]:
+    """Возвращает хэши символьных шинглов текста.
+
+    Текст нормализуется и очищается от знаков препинания, поэтому вставка пробелов,
+    знаков и смена регистра не меняют отпечаток.
+
+    Args:
+        text: Текст отзыва
+    """
+    words = " ".join(regex_tokenize(normalize_text(text)))
+    if len(words) <= SHINGLE_SIZE:
+        return {zlib.crc32(words.encode())}
+    return {zlib.crc32(words[i : i + SHINGLE_SIZE].encode()) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+class NearDuplicateIndex:
+    """Индекс почти одинаковых отзывов на MinHash с LSH-разбиением на полосы.
+
+    Отпечаток отзыва - MinHash-сигнатура его шинглов. Сигнатура режется на полосы,
+    и кандидатами считаются отзывы, совпавшие хотя бы в одной полосе. Из кандидатов
+    выбирается отзыв с наибольшей оценкой сходства Жаккара не ниже порога.
+    Индекс хранит не более `max_entries` отзывов и не больше `max_memory` байт
+    по оценке размера записей и вытесняет давно не найденные.
+
+    Сигнатура вычисляется на чистом Python за единицы миллисекунд, поэтому ее считают
+    один раз на отзыв и передают в `lookup` и `add`.
+    """
+
+    def __init__(
+        self,
+        num_perm: int,
+        bands: int,
+        threshold: float,
+        max_entries: int,
+        max_memory: int | None = None,
+    ) -> None:
+        """Инициализирует индекс.
+
+        Args:
+            num_perm: Длина MinHash-сигнатуры
+            bands: Количество полос LSH, должно делить длину сигнатуры
+            threshold: Минимальное сходство Жаккара для переиспользования вердикта
+            max_entries: Максимальное количество отзывов в индексе
+            max_memory: Максимальная оценка памяти записей индекса в байтах, None - без ограничения
+        """
+        if num_perm % bands:
+            raise ValueError("Длина сигнатуры должна делиться на количество полос")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        rng = random.Random(HASH_SEED)
+        self._permutations = [
+            (rng.randrange(1, MERSENNE_PRIME), rng.randrange(MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+        self._entries: OrderedDict[int, tuple[tuple[int, ...], Verdict]] = OrderedDict()
+        self._buckets: dict[tuple[int, tuple[int, ...]], set[int]] = {}
+        self._next_id = 0
+        self._memory = 0
+        metrics.gauge("near_duplicate_index_size", lambda: len(self._entries))
+        metrics.gauge("near_duplicate_index_bytes", lambda: self._memory)
+
+    def signature(self, text: str) -> tuple[int, ...]:
+        """Вычисляет MinHash-сигнатуру текста.
+
+        Args:
+            text: Текст отзыва
+        """
+        hashes = shingles(text)
+        return tuple(min((a * h + b) % MERSENNE_PRIME for h in hashes) for a, b in self._permutations)
+
+    def lookup(self, signature: tuple[int, ...]) -> Verdict | None:
+        """Ищет вердикт отзыва, почти совпадающего с отзывом с данной сигнатурой.
+
+        Args:
+            signature: MinHash-сигнатура текста отзыва
+
+        Returns:
+            Вердикт самого похожего отзыва или None, если похожих нет
+        """
+        started = time.perf_counter()
+        best_id, best_similarity = None, self.threshold
+        for entry_id in self._candidates(signature):
+            similarity = self._similarity(signature, self._entries[entry_id][0])
+            if similarity >= best_similarity:
+                best_id, best_similarity = entry_id, similarity
+        metrics.histogram("near_duplicate_lookup_ms").observe((time.perf_counter() - started) * 1000)
+        if best_id is None:
+            metrics.counter("near_duplicate_misses").inc()
+            return None
+        metrics.counter("near_duplicate_hits").inc()
+        self._entries.move_to_end(best_id)
+        return self._entries[best_id][1]
+
+    def add(self, signature: tuple[int, ...], verdict: Verdict) -> None:
+        """Добавляет отзыв и его вердикт в индекс.
+
+        Args:
+            signature: MinHash-сигнатура текста отзыва
+            verdict: Вердикт модерации
+        """
+        self._insert(signature, verdict)
+
+    def _insert(self, signature: tuple[int, ...], verdict: Verdict) -> None:
+        """Добавляет сигнатуру в индекс, вытесняя давно не найденные отзывы."""
+        if self.max_entries <= 0:
+            return
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = (signature, verdict)
+        self._memory += self._entry_size(signature, verdict)
+        for band in self._bands(signature):
+            self._buckets.setdefault(band, set()).add(entry_id)
+        while len(self._entries) > self.max_entries or (
+            self.max_memory is not None and self._memory > self.max_memory
+        ):
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, entry_id: int) -> None:
+        """Удаляет отзыв из индекса и его полос."""
+        signature, verdict = self._entries.pop(entry_id)
+        self._memory -= self._entry_size(signature, verdict)
+        for band in self._bands(signature):
+            bucket = self._buckets[band]
+            bucket.discard(entry_id)
+            if not bucket:
+                del self._buckets[band]
+
+    def _entry_size(self, signature: tuple[int, ...], verdict: Verdict) -> int:
+        """Оценивает память, занимаемую записью индекса, в байтах."""
+        return (
+            sys.getsizeof(signature)
+            + sum(sys.getsizeof(value) for value in signature)
+            + sys.getsizeof(verdict.comment)
+            + self.bands * BAND_ENTRY_BYTES
+        )
+
+    def _bands(self, signature: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+        """Режет сигнатуру на полосы LSH."""
+        return [(band, signature[band * self.rows : (band + 1) * self.rows]) for band in range(self.bands)]
+
+    def _candidates(self, signature: tuple[int, ...]) -> set[int]:
+        """Возвращает отзывы, совпавшие с сигнатурой хотя бы в одной полосе."""
+        candidates: set[int] = set()
+        for band in self._bands(signature):
+            candidates |= self._buckets.get(band, set())
+        return candidates
+
+    @staticmethod
+    def _similarity(left: tuple[int, ...], right: tuple[int, ...]) -> float:
+        """Оценивает сходство Жаккара по доле совпавших позиций сигнатур."""
+        return sum(a == b for a, b in zip(left, right, strict=True)) / len(left)
+
+    def save(self, path: str) -> None:
+        """Сохраняет снимок индекса на диск.
+
+        Args:
+            path: Путь к файлу снимка
+        """
+        self._write_snapshot(path, self._snapshot())
+
+    def _snapshot(self) -> dict:
+        """Копирует содержимое индекса для сохранения."""
+        return {
+            "num_perm": self.num_perm,
+            "seed": HASH_SEED,
+            "shingle_size": SHINGLE_SIZE,
+            "entries": [[signature, verdict.status, verdict.comment] for signature, verdict in self._entries.values()],
+        }
+
+    @staticmethod
+    def _write_snapshot(path: str, snapshot: dict) -> None:
+        """Записывает снимок, атомарно заменяя файл, чтобы прерванная запись не портила прежний."""
+        tmp_path = Path(f"{path}.tmp")
+        tmp_path.write_bytes(orjson.dumps(snapshot))
+        tmp_path.replace(path)
+
+    def load(self, path: str) -> None:
+        """Загружает снимок индекса, если он существует и совместим с параметрами индекса.
+
+        Args:
+            path: Путь к файлу снимка
+        """
+        try:
+            snapshot = orjson.loads(Path(path).read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, orjson.JSONDecodeError) as error:
+            logger.warning(f"Не удалось прочитать снимок индекса похожих отзывов: {error}")
+            return
+        if (snapshot["num_perm"], snapshot["seed"], snapshot["shingle_size"]) != (
+            self.num_perm,
+            HASH_SEED,
+            SHINGLE_SIZE,
+        ):
+            logger.warning("Снимок индекса похожих отзывов построен с другими параметрами и пропущен")
+            return
+        for signature, status, comment in snapshot["entries"]:
+            self._insert(tuple(signature), Verdict(ModerationStatus(status), comment))
+        logger.info(f"Загружен снимок индекса похожих отзывов: {len(self._entries)} записей")
+
+    async def snapshot_periodically(self, path: str, interval: float) -> None:
+        """Периодически сохраняет снимок индекса на диск.
+
+        Args:
+            path: Путь к файлу снимка
+            interval: Интервал между снимками в секундах
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                # Копия снимается в цикле событий, сериализация и запись идут в потоке
+                await asyncio.to_thread(self._write_snapshot, path, self._snapshot())
+            except OSError as error:
+                logger.error(f"Не удалось сохранить снимок индекса похожих отзывов: {error}")
+
+
+@cache
+def get_near_duplicate_index() -> NearDuplicateIndex | None:
+    """Возвращает общий для процесса индекс похожих отзывов.
+
+    Returns:
+        Индекс, восстановленный из снимка, или None, если поиск похожих отзывов отключен
+    """
+    index_settings = settings.near_duplicates
+    if not index_settings.enabled:
+        return None
+    index = NearDuplicateIndex(
+        num_perm=index_settings.num_perm,
+        bands=index_settings.bands,
+        threshold=index_settings.threshold,
+        max_entries=index_settings.max_entries,
+        max_memory=index_settings.max_memory_mb * 1024 * 1024 if index_settings.max_memory_mb else None,
+    )
+    if index_settings.snapshot_path:
+        index.load(index_settings.snapshot_path)
+    return index
@@ -0,0 +1,82 @@
+# stdlib
+from collections import deque
+
+# thirdparty
+from aiokafka import TopicPartition
+
+
+class OffsetTracker:
+    """Учет обработанных сообщений Kafka для безопасного коммита смещений.
+
+    Сообщения одной партиции могут завершаться не по порядку, поэтому коммитить
+    можно только смещение, следующее за последним сообщением непрерывного
+    префикса обработанных сообщений. Так сохраняется семантика at-least-once:
+    после перезапуска повторно будут обработаны только незавершенные сообщения.
+    """
+
+    def __init__(self) -> None:
+        """Инициализирует трекер."""
+        self._in_flight: dict[TopicPartition, deque[int]] = {}
+        self._completed: dict[TopicPartition, set[int]] = {}
+        self._positions: dict[TopicPartition, int] = {}
+        self._committed: dict[TopicPartition, int] = {}
+
+    def add(self, tp: TopicPartition, offset: int) -> None:
+        """Регистрирует сообщение, взятое в обработку.
+
+        Args:
+            tp: Партиция сообщения
+            offset: Смещение сообщения
+        """
+        self._in_flight.setdefault(tp, deque()).append(offset)
+        self._completed.setdefault(tp, set())
+
+    def complete(self, tp: TopicPartition, offset: int) -> None:
+        """Отмечает сообщение как обработанное и сдвигает позицию коммита.
+
+        Args:
+            tp: Партиция сообщения
+            offset: Смещение сообщения
+        """
+        in_flight = self._in_flight.get(tp)
+        if in_flight is None:
+            # Партиция уже была отозвана при ребалансировке
+            return
+        completed = self._completed[tp]
+        completed.add(offset)
+        while in_flight and in_flight[0] in completed:
+            done = in_flight.popleft()
+            completed.discard(done)
+            self._positions[tp] = done + 1
+
+    def committable(self) -> dict[TopicPartition, int]:
+        """Возвращает смещения, которые можно закоммитить.
+
+        Returns:
+            Позиции партиций, сдвинувшиеся с момента последнего коммита
+        """
+        return {tp: position for tp, position in self._positions.items() if self._committed.get(tp) != position}
+
+    def mark_committed(self, offsets: dict[TopicPartition, int]) -> None:
+        """Запоминает закоммиченные смещения.
+
+        Args:
+            offsets: Закоммиченные позиции партиций
+        """
+        self._committed.update(offsets)
+
+    def pending(self) -> int:
+        """Возвращает количество сообщений, взятых в обработку, но не завершенных."""
+        return sum(len(in_flight) for in_flight in self._in_flight.values())
+
+    def forget(self, partitions: set[TopicPartition]) -> None:
+        """Удаляет состояние отозванных партиций.
+
+        Args:
+            partitions: Отозванные партиции
+        """
+        for tp in partitions:
+            self._in_flight.pop(tp, None)
+            self._completed.pop(tp, None)
+            self._positions.pop(tp, None)
+            self._committed.pop(tp, None)
@@ -4,8 +4,13 @@ import logging
 # project
 from core.config import settings
 from core.constants import ModerationStatus
+from grpc_services.generated import moderator_pb2
 from grpc_services.grpc_client.moderator_client import ModeratorGRPCClient
 from grpc_services.grpc_client.review_client import ReviewGRPCClient
+from services.manual_moderation import (
+    create_manual_review,
+    get_manual_moderation_batcher,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +42,8 @@ class ReviewService:
         """
         Отправляет отзыв на ручную модерацию.
 
+        При `MODERATION_MANUAL_BATCH_ENABLED` отзыв передается в пакете с другими отзывами.
+
         Args:
             review_id: Идентификатор отзыва
             review_title: Заголовок отзыва
@@ -44,8 +51,11 @@ class ReviewService:
             user_id: Идентификатор пользователя, оставившего отзыв
             movie_id: Идентификатор фильма, на который оставлен отзыв
             comment: Комментарий модератора
+
+        Raises:
+            ManualModerationError: Если сервис ручной модерации не добавил отзыв
         """
-        await ModeratorGRPCClient(settings.moderator_grpc_server_url).create_review(
+        review = moderator_pb2.CreateReviewRequest(
             review_id=review_id,
             review_title=review_title,
             review_text=review_text,
@@ -53,6 +63,11 @@ class ReviewService:
             movie_id=movie_id,
             auto_moderation_result=comment,
         )
+        batcher = get_manual_moderation_batcher()
+        if batcher is not None:
+            await batcher.submit(review)
+        else:
+            await create_manual_review(review)
         logger.info(f'Sending review {review_id} to manual moderation with comment "{comment}"')
 
     @staticmethod
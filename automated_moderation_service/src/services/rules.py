@@ -0,0 +1,262 @@
+# stdlib
+import logging
+import re
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from functools import cache
+
+# project
+from core.config import settings
+from core.metrics import metrics
+from services.banned_words import get_banned_words_matcher
+from services.tokenizer import tokenize
+
+logger = logging.getLogger(__name__)
+
+URL_PATTERN = re.compile(r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+")
+# Российские и международные номера: +7 (999) 123-45-67, 8 999 123 45 67, 89991234567
+PHONE_PATTERN = re.compile(r"(?<!\d)(?:\+\d{1,3}|8)[\s\-(]*\d{3}[\s\-)]*\d{3}[\s\-]*\d{2}[\s\-]*\d{2}(?!\d)")
+# Латинские буквы и цифры, которыми подменяют похожие кириллические
+HOMOGLYPHS = str.maketrans(
+    {
+        "a": "а",
+        "b": "в",
+        "c": "с",
+        "e": "е",
+        "k": "к",
+        "m": "м",
+        "h": "н",
+        "o": "о",
+        "p": "р",
+        "t": "т",
+        "x": "х",
+        "y": "у",
+        "0": "о",
+        "3": "з",
+        "4": "ч",
+        "6": "б",
+        "@": "а",
+    }
+)
+# Разделители, которыми разбивают слово на буквы: м.а.т, м-а-т, м*а*т
+LETTER_SEPARATORS = re.compile(r"(?<=\w)[.\-*_]+(?=\w)")
+# Слово с возможной маскировкой: буквы вперемешку с цифрами и @
+OBFUSCATED_WORD_PATTERN = re.compile(r"[\w@]+")
+CYRILLIC_LETTER = re.compile(r"[а-яё]")
+LATIN_LETTER = re.compile(r"[a-z]")
+MASK_CHARACTER = re.compile(r"[\d@]")
+
+
+class Rule(ABC):
+    """Правило быстрой модерации.
+
+    Стоимость правила - относительная оценка времени проверки: правила
+    выполняются от дешевых к дорогим, чтобы дорогие проверки запускались
+    только для текстов, прошедших дешевые.
+    """
+
+    name: str
+    cost: float
+
+    @abstractmethod
+    def violated(self, text: str) -> bool:
+        """Проверяет, нарушает ли текст правило.
+
+        Args:
+            text: Текст для проверки
+
+        Returns:
+            True, если текст нужно отклонить, иначе False
+        """
+
+
+class MaxLengthRule(Rule):
+    """Отклоняет слишком длинные тексты."""
+
+    name = "max_length"
+    cost = 1
+
+    def __init__(self, max_length: int) -> None:
+        """Инициализирует правило.
+
+        Args:
+            max_length: Максимальная длина текста
+        """
+        self.max_length = max_length
+
+    def violated(self, text: str) -> bool:
+        return len(text) > self.max_length
+
+
+class RepeatedCharactersRule(Rule):
+    """Отклоняет тексты с длинными повторами одного символа, например «ааааааааа!!!!!!!»."""
+
+    name = "repeated_characters"
+    cost = 2
+
+    def __init__(self, max_repeats: int) -> None:
+        """Инициализирует правило.
+
+        Args:
+            max_repeats: Максимальное допустимое количество повторов символа подряд
+        """
+        self.pattern = re.compile(rf"(\S)\1{{{max_repeats},}}")
+
+    def violated(self, text: str) -> bool:
+        return self.pattern.search(text) is not None
+
+
+class CapsRatioRule(Rule):
+    """Отклоняет тексты, написанные преимущественно заглавными буквами."""
+
+    name = "caps_ratio"
+    cost = 2
+
+    def __init__(self, max_ratio: float, min_letters: int) -> None:
+        """Инициализирует правило.
+
+        Args:
+            max_ratio: Максимальная доля заглавных букв
+            min_letters: Минимальное количество букв, начиная с которого проверяется доля
+        """
+        self.max_ratio = max_ratio
+        self.min_letters = min_letters
+
+    def violated(self, text: str) -> bool:
+        letters = sum(char.isalpha() for char in text)
+        if letters < self.min_letters:
+            return False
+        return sum(char.isupper() for char in text) / letters > self.max_ratio
+
+
+class LinksRule(Rule):
+    """Отклоняет тексты со ссылками."""
+
+    name = "links"
+    cost = 3
+
+    def violated(self, text: str) -> bool:
+        return URL_PATTERN.search(text) is not None
+
+
+class PhoneNumbersRule(Rule):
+    """Отклоняет тексты с номерами телефонов."""
+
+    name = "phone_numbers"
+    cost = 3
+
+    def violated(self, text: str) -> bool:
+        return PHONE_PATTERN.search(text) is not None
+
+
+class BannedWordsRule(Rule):
+    """Отклоняет тексты с запрещенными словами и фразами."""
+
+    name = "banned_words"
+    cost = 4
+
+    def violated(self, text: str) -> bool:
+        return get_banned_words_matcher().contains(tokenize(text.lower()))
+
+
+class ObfuscatedBannedWordsRule(Rule):
+    """Отклоняет тексты с замаскированными запрещенными словами.
+
+    Разделители внутри слов (м.а.т, м-а-т) удаляются. В словах, где кириллица смешана
+    с латиницей или буквы - с цифрами и @, похожие символы заменяются на кириллицу,
+    после чего текст проверяется по списку запрещенных слов. Слова, целиком написанные
+    латиницей, не заменяются, иначе английское "mat" совпало бы с "мат".
+    """
+
+    name = "obfuscated_banned_words"
+    cost = 5
+
+    def violated(self, text: str) -> bool:
+        lowered = LETTER_SEPARATORS.sub("", text.lower())
+        words = [
+            word.translate(HOMOGLYPHS) if self._is_masked(word) else word
+            for word in OBFUSCATED_WORD_PATTERN.findall(lowered)
+        ]
+        return get_banned_words_matcher().contains(words)
+
+    @staticmethod
+    def _is_masked(word: str) -> bool:
+        """Проверяет, похоже ли слово на замаскированное: смешение алфавитов или цифры и @ среди букв."""
+        has_cyrillic = CYRILLIC_LETTER.search(word) is not None
+        has_latin = LATIN_LETTER.search(word) is not None
+        if has_cyrillic and has_latin:
+            return True
+        return (has_cyrillic or has_latin) and MASK_CHARACTER.search(word) is not None
+
+
+class RulePipeline:
+    """Цепочка правил быстрой модерации.
+
+    Правила выполняются в порядке возрастания стоимости, проверка останавливается на
+    первом нарушенном правиле. Для каждого правила собираются время проверки и доля
+    срабатываний, по которым можно уточнить стоимости и порядок правил.
+    """
+
+    def __init__(self, rules: Iterable[Rule], costs: dict[str, float] | None = None) -> None:
+        """Инициализирует цепочку.
+
+        Args:
+            rules: Правила
+            costs: Стоимости, переопределяющие заявленные правилами, по имени правила
+        """
+        costs = costs or {}
+        self.rules = sorted(rules, key=lambda rule: costs.get(rule.name, rule.cost))
+        # Метрики правил запрашиваются заранее, чтобы не искать их по имени при каждой проверке
+        self._stats = [
+            (
+                rule,
+                metrics.histogram(f"rule_{rule.name}_ms"),
+                metrics.counter(f"rule_{rule.name}_checks"),
+                metrics.counter(f"rule_{rule.name}_hits"),
+            )
+            for rule in self.rules
+        ]
+        metrics.gauge("rule_hit_rates", self.hit_rates)
+
+    def check(self, text: str) -> Rule | None:
+        """Проверяет текст по правилам.
+
+        Args:
+            text: Текст для проверки
+
+        Returns:
+            Первое нарушенное правило или None, если текст прошел все правила
+        """
+        for rule, latency, checks, hits in self._stats:
+            started = time.perf_counter()
+            violated = rule.violated(text)
+            latency.observe((time.perf_counter() - started) * 1000)
+            checks.inc()
+            if violated:
+                hits.inc()
+                logger.debug(f"Текст нарушает правило {rule.name}")
+                return rule
+        return None
+
+    def hit_rates(self) -> dict[str, float]:
+        """Возвращает долю срабатываний каждого правила среди проверенных им текстов."""
+        return {rule.name: hits.value / checks.value if checks.value else 0.0 for rule, _, checks, hits in self._stats}
+
+
+@cache
+def get_rule_pipeline() -> RulePipeline:
+    """Возвращает цепочку правил, собранную по настройкам."""
+    moderation = settings.moderation
+    rules: list[Rule] = [MaxLengthRule(moderation.max_length), BannedWordsRule()]
+    if moderation.check_links:
+        rules.append(LinksRule())
+    if moderation.max_repeated_chars is not None:
+        rules.append(RepeatedCharactersRule(moderation.max_repeated_chars))
+    if moderation.max_caps_ratio is not None:
+        rules.append(CapsRatioRule(moderation.max_caps_ratio, moderation.caps_min_letters))
+    if moderation.check_phone_numbers:
+        rules.append(PhoneNumbersRule())
+    if moderation.check_obfuscated_words:
+        rules.append(ObfuscatedBannedWordsRule())
+    return RulePipeline(rules, moderation.rule_costs)
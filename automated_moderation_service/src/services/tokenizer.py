@@ -0,0 +1,50 @@
+# stdlib
+import re
+from collections.abc import Callable
+
+# thirdparty
+from nltk import word_tokenize
+
+# project
+from core.config import settings
+from core.constants import Tokenizer
+
+# Слово - непрерывная последовательность букв любого алфавита, числа выделяются отдельно.
+# Знаки препинания для поиска запрещенных слов не нужны и в токены не попадают.
+WORD_PATTERN = re.compile(r"[^\W\d_]+|\d+")
+
+
+def regex_tokenize(text: str) -> list[str]:
+    """Разбивает текст на слова регулярным выражением.
+
+    В отличие от nltk не выполняет разбиение на предложения и не применяет правила
+    Treebank, поэтому работает на порядок быстрее.
+
+    Args:
+        text: Текст для разбиения
+
+    Returns:
+        Слова текста по порядку
+    """
+    return WORD_PATTERN.findall(text)
+
+
+def nltk_tokenize(text: str) -> list[str]:
+    """Разбивает текст на слова с помощью nltk.
+
+    Args:
+        text: Текст для разбиения
+
+    Returns:
+        Слова и знаки препинания текста по порядку
+    """
+    return word_tokenize(text)
+
+
+TOKENIZERS: dict[Tokenizer, Callable[[str], list[str]]] = {
+    Tokenizer.REGEX: regex_tokenize,
+    Tokenizer.NLTK: nltk_tokenize,
+}
+
+# Токенизатор, выбранный в настройках
+tokenize = TOKENIZERS[settings.moderation.tokenizer]
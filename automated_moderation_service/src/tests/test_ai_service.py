@@ -0,0 +1,152 @@
+# stdlib
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+# thirdparty
+import httpx
+import pytest
+
+# project
+from core.constants import MODERATION_BATCH_SYSTEM_PROMPT, CircuitState
+from exceptions import CircuitOpenError
+from schemas import ModerationResponse
+from services.ai_service.circuit_breaker import CircuitBreaker
+from services.ai_service.provider import LLMProvider
+from services.ai_service.rate_limiter import MemoryLimiterState, RateLimiter
+from services.ai_service.service import ModerationService
+
+# Попытки, после которых предохранитель размыкается
+MIN_REQUESTS = 2
+RESPONSE = json.dumps(
+    {
+        "status": "rejected",
+        "confidence": 0.9,
+        "tags": ["risky"],
+        "issues": [
+            {"code": "6", "category": "Оскорбления", "description": "Оскорбления", "law": "ст. 5.61.1 КоАП РФ"}
+        ],
+    },
+    ensure_ascii=False,
+)
+
+
+class StreamingProvider(LLMProvider):
+    """Поставщик, отдающий заранее заданный ответ потоком по несколько символов."""
+
+    def __init__(self, early_statuses: set[str], enabled: bool = True) -> None:
+        self.config: dict[str, Any] = {"streaming": {"enabled": enabled, "early_statuses": early_statuses}}
+        self.requests = 0
+
+    async def send_moderation_request(self, text: str, system_prompt: str) -> dict[str, Any]:
+        self.requests += 1
+        raise httpx.ConnectError("API недоступно")
+
+    async def stream_moderation_request(self, text: str, system_prompt: str) -> AsyncIterator[str]:
+        for start in range(0, len(RESPONSE), 8):
+            yield RESPONSE[start : start + 8]
+
+    async def close(self) -> None:
+        pass
+
+
+def chat_response(content: str) -> dict[str, Any]:
+    """Возвращает ответ API с указанным текстом сообщения."""
+    return {
+        "choices": [{"message": {"content": content, "role": "assistant"}, "index": 0, "finish_reason": "stop"}],
+        "created": 0,
+        "model": "GigaChat",
+        "object": "chat.completion",
+        "usage": {},
+    }
+
+
+class BatchProvider(StreamingProvider):
+    """Поставщик, в пакетном ответе которого разобрать можно только первый текст."""
+
+    def __init__(self) -> None:
+        super().__init__(set(), enabled=False)
+        self.single_texts: list[str] = []
+
+    async def send_moderation_request(self, text: str, system_prompt: str) -> dict[str, Any]:
+        if system_prompt != MODERATION_BATCH_SYSTEM_PROMPT:
+            self.single_texts.append(text)
+            return chat_response(RESPONSE)
+        results = [
+            {"id": 1, "status": "approved", "tags": [], "issues": [], "confidence": 0.95},
+            # Уверенность вне допустимого диапазона, результата для третьего текста нет
+            {"id": 2, "status": "approved", "tags": [], "issues": [], "confidence": 7},
+        ]
+        return chat_response(json.dumps({"results": results}))
+
+
+class LimitedProvider(StreamingProvider):
+    """Поставщик, который перед каждым запросом ждет лимитер с квотой 10 запросов в секунду."""
+
+    def __init__(self) -> None:
+        super().__init__(set(), enabled=False)
+        self.rate_limiter = RateLimiter(rpm=600, tpm=None, burst_seconds=0.1, state=MemoryLimiterState())
+
+    async def send_moderation_request(self, text: str, system_prompt: str) -> dict[str, Any]:
+        await self.rate_limiter.acquire(1)
+        return chat_response(RESPONSE)
+
+
+async def test_early_verdict_delivers_issues_later() -> None:
+    """Тест досрочного вердикта, который дополняется нарушениями после окончания потока."""
+    result = await ModerationService(StreamingProvider({"rejected"})).moderate_text("Текст")
+
+    assert result.status == "rejected"
+    assert not result.is_complete
+    assert result.issues == []
+    complete = await result.complete()
+    assert complete.tags == ["risky"]
+    assert complete.issues[0]["category"] == "Оскорбления"
+
+
+async def test_streaming_without_early_verdict_returns_full_response() -> None:
+    """Тест полного ответа, если статус не входит в досрочные."""
+    result = await ModerationService(StreamingProvider({"approved"})).moderate_text("Текст")
+
+    assert result.is_complete
+    assert result.issues[0]["law"] == "ст. 5.61.1 КоАП РФ"
+
+
+async def test_circuit_breaker_counts_each_attempt() -> None:
+    """Тест учета предохранителем каждой попытки и прекращения повторов после размыкания."""
+    provider = StreamingProvider(set(), enabled=False)
+    circuit_breaker = CircuitBreaker(
+        window=60, min_requests=MIN_REQUESTS, error_rate=0.5, slow_call_seconds=10, slow_call_rate=1, open_duration=30
+    )
+
+    with patch("asyncio.sleep", AsyncMock()), pytest.raises(CircuitOpenError):
+        await ModerationService(provider, circuit_breaker).moderate_text("Текст")
+
+    assert provider.requests == MIN_REQUESTS
+    assert circuit_breaker.state == CircuitState.OPEN
+
+
+async def test_circuit_breaker_ignores_rate_limiter_wait() -> None:
+    """Тест того, что ожидание в лимитере не делает ответ API медленным для предохранителя."""
+    circuit_breaker = CircuitBreaker(
+        window=60, min_requests=1, error_rate=1, slow_call_seconds=0.05, slow_call_rate=0.5, open_duration=30
+    )
+    service = ModerationService(LimitedProvider(), circuit_breaker)
+
+    # Второй запрос ждет пополнения корзины лимитера около 0.1 с
+    await service.moderate_text("Первый текст")
+    await service.moderate_text("Второй текст")
+
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+
+async def test_partial_batch_response_falls_back_to_single_requests() -> None:
+    """Тест отдельной модерации текстов, результаты которых не удалось разобрать из пакетного ответа."""
+    provider = BatchProvider()
+
+    results = await ModerationService(provider).moderate_batch(["Первый", "Второй", "Третий"])
+
+    assert provider.single_texts == ["Второй", "Третий"]
+    statuses = [result.status if isinstance(result, ModerationResponse) else result for result in results]
+    assert statuses == ["approved", "rejected", "rejected"]
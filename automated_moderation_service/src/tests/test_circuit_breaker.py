@@ -0,0 +1,88 @@
+# stdlib
+from collections.abc import Iterator
+from unittest.mock import patch
+
+# thirdparty
+import pytest
+
+# project
+from core.constants import CircuitState
+from services.ai_service.circuit_breaker import CircuitBreaker
+
+# Время в разомкнутом состоянии и в ожидании пробного запроса, с
+OPEN_DURATION = 30.0
+
+
+class Clock:
+    """Часы, которые двигаются только вручную."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Iterator[Clock]:
+    """Подменяет часы предохранителя."""
+    clock = Clock()
+    with patch("services.ai_service.circuit_breaker.time.monotonic", clock):
+        yield clock
+
+
+@pytest.fixture
+def circuit_breaker(clock: Clock) -> CircuitBreaker:
+    """Предохранитель, размыкаемый одной ошибкой."""
+    return CircuitBreaker(
+        window=60, min_requests=1, error_rate=1, slow_call_seconds=10, slow_call_rate=1, open_duration=OPEN_DURATION
+    )
+
+
+def test_late_result_does_not_switch_half_open_breaker(circuit_breaker: CircuitBreaker, clock: Clock) -> None:
+    """Тест того, что результат запроса, начатого до размыкания, не переключает полуоткрытую цепь."""
+    assert circuit_breaker.allow_request()
+    late_generation = circuit_breaker.generation
+    assert circuit_breaker.allow_request()
+    circuit_breaker.record_failure(circuit_breaker.generation)
+    assert circuit_breaker.state == CircuitState.OPEN
+
+    clock.now += OPEN_DURATION
+    assert circuit_breaker.allow_request()
+    probe_generation = circuit_breaker.generation
+    circuit_breaker.record_success(0.1, late_generation)
+    circuit_breaker.record_failure(late_generation)
+
+    assert circuit_breaker.state == CircuitState.HALF_OPEN
+    assert not circuit_breaker.allow_request()
+    circuit_breaker.record_success(0.1, probe_generation)
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+
+def test_probe_failure_reopens_breaker(circuit_breaker: CircuitBreaker, clock: Clock) -> None:
+    """Тест повторного размыкания цепи ошибкой пробного запроса."""
+    assert circuit_breaker.allow_request()
+    circuit_breaker.record_failure(circuit_breaker.generation)
+
+    clock.now += OPEN_DURATION
+    assert circuit_breaker.allow_request()
+    circuit_breaker.record_failure(circuit_breaker.generation)
+
+    assert circuit_breaker.state == CircuitState.OPEN
+    assert not circuit_breaker.allow_request()
+
+
+def test_replaced_probe_result_is_ignored(circuit_breaker: CircuitBreaker, clock: Clock) -> None:
+    """Тест того, что результат пробного запроса, замененного новым, не учитывается."""
+    assert circuit_breaker.allow_request()
+    circuit_breaker.record_failure(circuit_breaker.generation)
+    clock.now += OPEN_DURATION
+    assert circuit_breaker.allow_request()
+    stale_probe_generation = circuit_breaker.generation
+
+    # Пробный запрос не ответил за open_duration и заменяется новым
+    clock.now += OPEN_DURATION
+    assert circuit_breaker.allow_request()
+    circuit_breaker.record_failure(stale_probe_generation)
+
+    assert circuit_breaker.state == CircuitState.HALF_OPEN
@@ -0,0 +1,70 @@
+# stdlib
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# thirdparty
+import pytest
+
+# project
+from exceptions import ManualModerationError
+from grpc_services.generated import moderator_pb2
+from services.manual_moderation import ManualModerationBatcher
+from services.review_service import ReviewService
+
+
+async def test_batcher_sends_reviews_in_one_batch() -> None:
+    """Тест передачи накопленных отзывов одним пакетом."""
+    response = moderator_pb2.CreateDeleteReviewBatchResponse(success=True, affected=2)
+    create_reviews = AsyncMock(return_value=response)
+    with patch(
+        "services.manual_moderation.ModeratorGRPCClient",
+        MagicMock(return_value=MagicMock(create_reviews=create_reviews)),
+    ):
+        batcher = ManualModerationBatcher(max_items=2, window=10)
+        await asyncio.gather(
+            batcher.submit(moderator_pb2.CreateReviewRequest(review_id="1")),
+            batcher.submit(moderator_pb2.CreateReviewRequest(review_id="2")),
+        )
+
+    create_reviews.assert_awaited_once()
+    assert create_reviews.await_args is not None
+    assert [review.review_id for review in create_reviews.await_args.args[0]] == ["1", "2"]
+
+
+async def test_batcher_sends_reviews_one_by_one_when_batch_rejected() -> None:
+    """Тест передачи отзывов по одному, если сервис ручной модерации не принял пакет."""
+    batch_response = moderator_pb2.CreateDeleteReviewBatchResponse(success=False, message="invalid review")
+    create_review = AsyncMock(
+        side_effect=lambda **review: moderator_pb2.CreateDeleteReviewResponse(
+            success=review["review_id"] != "2", message="invalid review"
+        )
+    )
+    client = MagicMock(create_reviews=AsyncMock(return_value=batch_response), create_review=create_review)
+    with patch("services.manual_moderation.ModeratorGRPCClient", MagicMock(return_value=client)):
+        batcher = ManualModerationBatcher(max_items=10, window=0.01)
+        results = await asyncio.gather(
+            batcher.submit(moderator_pb2.CreateReviewRequest(review_id="1")),
+            batcher.submit(moderator_pb2.CreateReviewRequest(review_id="2")),
+            batcher.submit(moderator_pb2.CreateReviewRequest(review_id="3")),
+            return_exceptions=True,
+        )
+
+    assert results[0] is None
+    assert isinstance(results[1], ManualModerationError)
+    assert str(results[1]) == "invalid review"
+    assert results[2] is None
+    assert sorted(call.kwargs["review_id"] for call in create_review.await_args_list) == ["1", "2", "3"]
+
+
+async def test_send_to_manual_moderation_raises_when_review_rejected() -> None:
+    """Тест ошибки при передаче без пакетов, если сервис ручной модерации не добавил отзыв."""
+    response = moderator_pb2.CreateDeleteReviewResponse(success=False, message="database unavailable")
+    client = MagicMock(create_review=AsyncMock(return_value=response))
+    with (
+        patch("services.manual_moderation.ModeratorGRPCClient", MagicMock(return_value=client)),
+        patch("services.review_service.get_manual_moderation_batcher", MagicMock(return_value=None)),
+        pytest.raises(ManualModerationError),
+    ):
+        await ReviewService.send_to_manual_moderation(
+            review_id="1", review_title="Заголовок", review_text="Текст", user_id="2", movie_id="3", comment=""
+        )
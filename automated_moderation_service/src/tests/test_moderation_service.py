@@ -0,0 +1,36 @@
+# stdlib
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+# project
+from schemas import ModerationResponse
+from services.ai_service.moderation_service import AIModerationService
+
+VERDICT = ModerationResponse(status="approved", tags=[], issues=[], confidence=0.95)
+
+
+async def test_identical_requests_share_one_upstream_call() -> None:
+    """Тест объединения одновременных запросов с одинаковым текстом в один запрос к API."""
+    response_ready = asyncio.Event()
+
+    async def request_moderation(text: str) -> ModerationResponse:
+        await response_ready.wait()
+        return VERDICT
+
+    with patch.object(
+        AIModerationService, "_request_moderation", AsyncMock(side_effect=request_moderation)
+    ) as request:
+        waiters = [
+            asyncio.create_task(AIModerationService._moderate_once(text))
+            for text in ("Отличный фильм", "  отличный   ФИЛЬМ ", "Отличный фильм")
+        ]
+        await asyncio.sleep(0)
+        # Отмена одного из ожидающих не прерывает общий запрос
+        waiters[0].cancel()
+        response_ready.set()
+        results = await asyncio.gather(*waiters[1:])
+
+    request.assert_awaited_once_with("Отличный фильм")
+    assert results == [VERDICT, VERDICT]
+    assert waiters[0].cancelled()
+    assert AIModerationService._in_flight == {}
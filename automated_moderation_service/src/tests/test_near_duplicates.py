@@ -0,0 +1,34 @@
+# project
+from core.constants import ModerationStatus
+from services.near_duplicates import NearDuplicateIndex, Verdict
+
+TEXT = "Фильм скучный, актеры играют плохо, сюжет предсказуемый с первых минут"
+
+
+def test_lookup_finds_near_duplicate() -> None:
+    """Тест поиска отзыва, отличающегося знаками препинания и регистром."""
+    index = NearDuplicateIndex(num_perm=64, bands=16, threshold=0.85, max_entries=100)
+    verdict = Verdict(ModerationStatus.REJECTED, "Оскорбления")
+    index.add(index.signature(TEXT), verdict)
+
+    assert index.lookup(index.signature(TEXT.upper() + "!!!")) == verdict
+    assert index.lookup(index.signature("Совсем другой отзыв о хорошем кино")) is None
+
+
+def test_memory_bound_evicts_oldest_entries() -> None:
+    """Тест вытеснения давно не найденных записей при превышении оценки памяти."""
+    # Запись с сигнатурой из 64 чисел занимает около 4.5 КБ, в индекс помещаются две
+    index = NearDuplicateIndex(num_perm=64, bands=16, threshold=0.85, max_entries=100, max_memory=10_000)
+    texts = [
+        "Фильм скучный, актеры играют плохо",
+        "Отличная музыка и красивые пейзажи",
+        "Сюжет запутанный, финал разочаровал",
+    ]
+    signatures = [index.signature(text) for text in texts]
+    for text, signature in zip(texts, signatures, strict=True):
+        index.add(signature, Verdict(ModerationStatus.REJECTED, text))
+
+    assert index.lookup(signatures[0]) is None
+    assert [index.lookup(signature) for signature in signatures[1:]] == [
+        Verdict(ModerationStatus.REJECTED, text) for text in texts[1:]
+    ]
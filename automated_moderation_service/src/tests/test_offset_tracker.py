@@ -0,0 +1,100 @@
+# stdlib
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# thirdparty
+from aiokafka import TopicPartition
+
+# project
+from main import KafkaReviewConsumer, RevocationListener
+from services.offset_tracker import OffsetTracker
+
+TOPIC = "reviews"
+FIRST_PARTITION = TopicPartition(TOPIC, 0)
+SECOND_PARTITION = TopicPartition(TOPIC, 1)
+OFFSETS = (0, 1, 2)
+
+
+def test_commits_only_contiguous_prefix() -> None:
+    """Тест того, что коммитится только смещение после непрерывно обработанных сообщений."""
+    offsets = OffsetTracker()
+    for offset in (10, 11, 12):
+        offsets.add(FIRST_PARTITION, offset)
+
+    offsets.complete(FIRST_PARTITION, 12)
+    assert offsets.committable() == {}
+
+    offsets.complete(FIRST_PARTITION, 10)
+    assert offsets.committable() == {FIRST_PARTITION: 11}
+
+    offsets.complete(FIRST_PARTITION, 11)
+    assert offsets.committable() == {FIRST_PARTITION: 13}
+    assert offsets.pending() == 0
+
+
+def test_out_of_order_completion_is_tracked_per_partition() -> None:
+    """Тест завершения сообщений не по порядку в нескольких партициях."""
+    offsets = OffsetTracker()
+    for offset in OFFSETS:
+        offsets.add(FIRST_PARTITION, offset)
+        offsets.add(SECOND_PARTITION, offset)
+
+    offsets.complete(SECOND_PARTITION, 0)
+    offsets.complete(FIRST_PARTITION, 2)
+    offsets.complete(FIRST_PARTITION, 1)
+    assert offsets.committable() == {SECOND_PARTITION: 1}
+
+    offsets.mark_committed({SECOND_PARTITION: 1})
+    offsets.complete(FIRST_PARTITION, 0)
+    assert offsets.committable() == {FIRST_PARTITION: 3}
+    # Во второй партиции обработано только первое сообщение
+    assert offsets.pending() == len(OFFSETS) - 1
+
+
+def test_revoked_partition_is_forgotten() -> None:
+    """Тест того, что сообщения отозванной партиции не сдвигают ее позицию."""
+    offsets = OffsetTracker()
+    offsets.add(FIRST_PARTITION, 0)
+    offsets.add(FIRST_PARTITION, 1)
+    offsets.add(SECOND_PARTITION, 0)
+    offsets.complete(FIRST_PARTITION, 0)
+
+    offsets.forget({FIRST_PARTITION})
+    # Сообщение, завершившееся после отзыва партиции, не учитывается
+    offsets.complete(FIRST_PARTITION, 1)
+    assert offsets.committable() == {}
+    assert offsets.pending() == 1
+
+    # После повторного назначения партиция учитывается заново
+    offsets.add(FIRST_PARTITION, 5)
+    offsets.complete(FIRST_PARTITION, 5)
+    assert offsets.committable() == {FIRST_PARTITION: 6}
+
+
+async def test_revocation_commits_processed_messages_before_rebalance() -> None:
+    """Тест того, что при отзыве партиции обработка завершается и смещения коммитятся до передачи партиции."""
+    review_consumer = KafkaReviewConsumer()
+    review_consumer.consumer = MagicMock(commit=AsyncMock(), assignment=MagicMock(return_value={FIRST_PARTITION}))
+    slow_message = asyncio.Event()
+
+    async def handle_message(message: dict[str, str]) -> None:
+        if message["id"] == "slow":
+            await slow_message.wait()
+
+    with patch.object(KafkaReviewConsumer, "handle_message", AsyncMock(side_effect=handle_message)):
+        for offset, review_id in enumerate(("slow", "fast")):
+            await review_consumer._semaphore.acquire()
+            msg = MagicMock(topic=TOPIC, partition=0, offset=offset, key=review_id.encode())
+            review_consumer.dispatch(msg, {"id": review_id}, commit=False)
+
+        revocation = asyncio.create_task(RevocationListener(review_consumer).on_partitions_revoked({FIRST_PARTITION}))
+        await asyncio.sleep(0)
+        assert not revocation.done()
+        review_consumer.consumer.commit.assert_not_awaited()
+
+        slow_message.set()
+        await revocation
+
+    review_consumer.consumer.commit.assert_awaited_once_with({FIRST_PARTITION: 2})
+    assert review_consumer.offsets.committable() == {}
+    assert review_consumer.offsets.pending() == 0
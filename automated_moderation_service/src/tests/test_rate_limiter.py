@@ -0,0 +1,100 @@
+# stdlib
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, patch
+
+# thirdparty
+import pytest
+
+# project
+from services.ai_service.rate_limiter import MemoryLimiterState, RateLimiter
+
+# Пауза из заголовка Retry-After, с
+RETRY_AFTER = 5.0
+
+
+class Clock:
+    """Часы, которые двигаются только вручную или паузой лимитера."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock() -> Iterator[Clock]:
+    """Подменяет часы и паузы лимитера."""
+    clock = Clock()
+    with (
+        patch("services.ai_service.rate_limiter.time.time", clock),
+        patch("services.ai_service.rate_limiter.asyncio.sleep", AsyncMock(side_effect=clock.sleep)),
+    ):
+        yield clock
+
+
+def requests_limiter() -> RateLimiter:
+    """Лимитер на запрос в секунду с емкостью корзины в два запроса."""
+    return RateLimiter(rpm=60, tpm=None, burst_seconds=2, state=MemoryLimiterState())
+
+
+async def test_waits_when_bucket_is_empty(clock: Clock) -> None:
+    """Тест ожидания пополнения пустой корзины запросов."""
+    limiter = requests_limiter()
+
+    await limiter.acquire(1)
+    await limiter.acquire(1)
+    assert clock.sleeps == []
+
+    await limiter.acquire(1)
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+async def test_bucket_refills_up_to_capacity(clock: Clock) -> None:
+    """Тест пополнения корзины со временем не больше ее емкости."""
+    limiter = requests_limiter()
+    await limiter.acquire(1)
+    await limiter.acquire(1)
+
+    clock.now += 60
+    await limiter.acquire(1)
+    await limiter.acquire(1)
+    assert clock.sleeps == []
+
+    await limiter.acquire(1)
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+async def test_acquire_is_weighted_by_tokens(clock: Clock) -> None:
+    """Тест списания бюджета по оценке токенов запроса."""
+    # 10 токенов в секунду, емкость корзины 100 токенов
+    limiter = RateLimiter(rpm=None, tpm=600, burst_seconds=10, state=MemoryLimiterState())
+
+    await limiter.acquire(60)
+    assert clock.sleeps == []
+
+    # Осталось 40 токенов, недостающие 20 пополняются за 2 с
+    await limiter.acquire(60)
+    assert clock.sleeps == [pytest.approx(2.0)]
+
+    # Запрос больше емкости ждет полной корзины и уводит ее в минус
+    await limiter.acquire(250)
+    assert clock.sleeps[1:] == [pytest.approx(10.0)]
+    # Следующий запрос ждет, пока корзина не вернется из минуса: (150 + 50) / 10 = 20 с
+    await limiter.acquire(50)
+    assert clock.sleeps[2:] == [pytest.approx(20.0)]
+
+
+async def test_penalize_blocks_until_retry_after(clock: Clock) -> None:
+    """Тест паузы всех запросов после ответа 429."""
+    limiter = requests_limiter()
+
+    limiter.penalize(RETRY_AFTER)
+    await limiter.acquire(1)
+
+    assert clock.sleeps == [pytest.approx(RETRY_AFTER)]
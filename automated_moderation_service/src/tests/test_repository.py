@@ -0,0 +1,68 @@
+# stdlib
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+# thirdparty
+import httpx
+import pytest
+
+# project
+from core.config import GigaChatSettings
+from core.metrics import Counter, Histogram
+from services.ai_service.repository import GigaChatRepository
+
+# Время ответа API по последним замерам и задержка дубля, с
+HEDGE_DELAY = 0.05
+
+
+@pytest.fixture
+async def repository() -> AsyncIterator[GigaChatRepository]:
+    """Репозиторий, дублирующий запросы после медианы времени ответа."""
+    config = GigaChatSettings(
+        hedge_enabled=True, hedge_percentile=50, hedge_max_ratio=1, hedge_min_samples=1
+    ).get_config()
+    repository = GigaChatRepository(config)
+    # Метрики реестра общие для процесса, у репозитория теста они свои
+    repository._chat_latency = Histogram()
+    repository._chat_requests = Counter()
+    repository._hedged_requests = Counter()
+    repository._chat_latency.observe(HEDGE_DELAY * 1000)
+    yield repository
+    await repository.close()
+
+
+async def test_slow_request_is_hedged_and_cancelled(repository: GigaChatRepository) -> None:
+    """Тест дубля, отправленного после задержки, и отмены запроса, ответившего позже."""
+    started = time.monotonic()
+    sent_at: list[float] = []
+    primary_cancelled = asyncio.Event()
+
+    async def post(url: str, **kwargs: Any) -> httpx.Response:
+        sent_at.append(time.monotonic() - started)
+        if len(sent_at) == 1:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                primary_cancelled.set()
+                raise
+        return httpx.Response(200, json={"id": len(sent_at)})
+
+    with patch.object(repository.client, "post", AsyncMock(side_effect=post)):
+        response = await repository._post_hedged_chat_request("{}", "token", 1)
+        await asyncio.wait_for(primary_cancelled.wait(), timeout=1)
+
+    assert response.json() == {"id": 2}
+    assert sent_at[1] >= HEDGE_DELAY
+    assert repository._hedged_requests.value == 1
+
+
+async def test_fast_request_is_not_hedged(repository: GigaChatRepository) -> None:
+    """Тест того, что запрос, ответивший до задержки, не дублируется."""
+    with patch.object(repository.client, "post", AsyncMock(return_value=httpx.Response(200, json={}))) as post:
+        await repository._post_hedged_chat_request("{}", "token", 1)
+
+    post.assert_awaited_once()
+    assert repository._hedged_requests.value == 0
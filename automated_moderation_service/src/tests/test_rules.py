@@ -0,0 +1,34 @@
+# thirdparty
+import pytest
+
+# project
+from services.rules import ObfuscatedBannedWordsRule
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "I bought a yoga mat",
+        "The mate of the captain",
+        "Mat finish looks great, 10/10",
+        "Фильм снят в 2024 году, рейтинг 8",
+    ],
+)
+def test_obfuscated_banned_words_ignores_plain_words(text: str) -> None:
+    """Слова, целиком написанные латиницей, и числа не считаются маскировкой."""
+    assert not ObfuscatedBannedWordsRule().violated(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Сплошной mат в диалогах",
+        "Сплошной м@т в диалогах",
+        "Сплошной m@t в диалогах",
+        "Сплошной м.а.т в диалогах",
+        "Сплошной m-а-t в диалогах",
+    ],
+)
+def test_obfuscated_banned_words_detects_masked_words(text: str) -> None:
+    """Смешение алфавитов, цифры и @ среди букв и разделители раскрываются."""
+    assert ObfuscatedBannedWordsRule().violated(text)
@@ -0,0 +1,132 @@
+# stdlib
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+# thirdparty
+import pytest
+
+# project
+from core.constants import (
+    MODERATION_BATCH_SYSTEM_PROMPT,
+    MODERATION_SYSTEM_PROMPT,
+)
+from schemas import ModerationResponse
+from services.ai_service.verdict_cache import (
+    MemoryVerdictStore,
+    SQLiteVerdictStore,
+    VerdictCache,
+)
+
+# Время жизни вердикта, с
+TTL = 60.0
+MODEL = "GigaChat"
+
+
+class Clock:
+    """Часы, которые двигаются только вручную."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Iterator[Clock]:
+    """Подменяет часы хранилищ вердиктов."""
+    clock = Clock()
+    with patch("services.ai_service.verdict_cache.time.time", clock):
+        yield clock
+
+
+def verdict(status: str = "rejected") -> ModerationResponse:
+    """Возвращает вердикт модерации."""
+    return ModerationResponse(status=status, tags=["risky"], issues=[{"category": "Оскорбления"}], confidence=0.9)
+
+
+def test_memory_store_expires_verdicts(clock: Clock) -> None:
+    """Тест устаревания вердикта в памяти по TTL."""
+    store = MemoryVerdictStore(max_size=10, ttl=TTL)
+    store.set("key", verdict())
+
+    clock.now += TTL - 1
+    assert store.get("key") is not None
+
+    clock.now += 1
+    assert store.get("key") is None
+    assert len(store) == 0
+
+
+def test_memory_store_evicts_least_recently_used(clock: Clock) -> None:
+    """Тест вытеснения давно не использованного вердикта."""
+    store = MemoryVerdictStore(max_size=2, ttl=TTL)
+    store.set("first", verdict())
+    store.set("second", verdict())
+
+    assert store.get("first") is not None
+    store.set("third", verdict())
+
+    assert store.get("second") is None
+    assert store.get("first") is not None
+    assert store.get("third") is not None
+
+
+async def test_sqlite_store_round_trip(clock: Clock, tmp_path: Path) -> None:
+    """Тест чтения вердикта, сохраненного в SQLite, после перезапуска."""
+    path = str(tmp_path / "verdicts.db")
+    store = SQLiteVerdictStore(path, max_size=10, ttl=TTL)
+    await store.set("key", verdict())
+    store.close()
+
+    store = SQLiteVerdictStore(path, max_size=10, ttl=TTL)
+    stored = await store.get("key")
+    assert stored is not None
+    response, expires_at = stored
+    assert response == verdict()
+    assert expires_at == clock.now + TTL
+
+    clock.now += TTL
+    assert await store.get("key") is None
+    store.close()
+
+
+async def test_sqlite_store_evicts_least_recently_used(clock: Clock, tmp_path: Path) -> None:
+    """Тест вытеснения из SQLite вердиктов сверх лимита."""
+    store = SQLiteVerdictStore(str(tmp_path / "verdicts.db"), max_size=2, ttl=TTL)
+    with patch("services.ai_service.verdict_cache.SQLITE_EVICTION_INTERVAL", 1):
+        for key in ("first", "second"):
+            await store.set(key, verdict())
+            clock.now += 1
+        assert await store.get("first") is not None
+        clock.now += 1
+        await store.set("third", verdict())
+
+    assert await store.get("second") is None
+    assert await store.get("first") is not None
+    store.close()
+
+
+async def test_verdict_is_keyed_by_prompt_actually_sent(clock: Clock) -> None:
+    """Тест того, что вердикт ищется по промпту запроса, которым он получен."""
+    memory = MemoryVerdictStore(max_size=10, ttl=TTL)
+    batch_cache = VerdictCache([MODERATION_SYSTEM_PROMPT, MODERATION_BATCH_SYSTEM_PROMPT], MODEL, memory)
+    single_cache = VerdictCache([MODERATION_SYSTEM_PROMPT], MODEL, memory)
+
+    await batch_cache.set("Текст  отзыва", verdict().set_system_prompt(MODERATION_BATCH_SYSTEM_PROMPT))
+
+    cached = await batch_cache.get("текст отзыва")
+    assert cached is not None
+    assert cached.system_prompt == MODERATION_BATCH_SYSTEM_PROMPT
+    assert await single_cache.get("текст отзыва") is None
+
+
+async def test_verdict_without_prompt_is_not_cached(clock: Clock) -> None:
+    """Тест того, что вердикт без известного промпта и неуверенный вердикт не сохраняются."""
+    cache = VerdictCache([MODERATION_SYSTEM_PROMPT], MODEL, MemoryVerdictStore(max_size=10, ttl=TTL))
+
+    await cache.set("Текст", verdict())
+    await cache.set("Текст", verdict("pending").set_system_prompt(MODERATION_SYSTEM_PROMPT))
+
+    assert len(cache.memory) == 0
@@ -0,0 +1,73 @@
+# stdlib
+from unittest.mock import AsyncMock
+
+# thirdparty
+import grpc
+import pytest
+
+# project
+from grpc_services.grpc_client.versioning import (
+    LATEST_VERSION,
+    LEGACY_VERSION,
+    VersionNegotiator,
+)
+
+TARGET = "moderation-grpc-server:50051"
+SERVICE = "review.ModeratorService"
+
+
+def rpc_error(code: grpc.StatusCode) -> grpc.aio.AioRpcError:
+    return grpc.aio.AioRpcError(code, grpc.aio.Metadata(), grpc.aio.Metadata())
+
+
+async def test_version_caches_latest() -> None:
+    """Тест однократной проверки сервера, поддерживающего новую версию."""
+    negotiator = VersionNegotiator()
+    probe = AsyncMock()
+
+    assert await negotiator.version(TARGET, SERVICE, probe) == LATEST_VERSION
+    assert await negotiator.version(TARGET, SERVICE, probe) == LATEST_VERSION
+    probe.assert_awaited_once()
+
+
+async def test_version_reprobes_legacy_server() -> None:
+    """Тест повторной проверки сервера со старой версией после интервала."""
+    negotiator = VersionNegotiator(reprobe_interval=0)
+    probe = AsyncMock(side_effect=[rpc_error(grpc.StatusCode.UNIMPLEMENTED), None])
+
+    assert await negotiator.version(TARGET, SERVICE, probe) == LEGACY_VERSION
+    assert await negotiator.version(TARGET, SERVICE, probe) == LATEST_VERSION
+
+
+async def test_version_propagates_probe_errors() -> None:
+    """Тест ошибки пробного вызова, не связанной с версией API."""
+    negotiator = VersionNegotiator()
+    probe = AsyncMock(side_effect=rpc_error(grpc.StatusCode.UNAVAILABLE))
+
+    with pytest.raises(grpc.aio.AioRpcError):
+        await negotiator.version(TARGET, SERVICE, probe)
+
+
+async def test_call_downgrades_on_unimplemented() -> None:
+    """Тест перехода на старую версию, если сервер перестал поддерживать новую."""
+    negotiator = VersionNegotiator()
+    probe = AsyncMock()
+    legacy = AsyncMock(return_value="v1")
+    latest = AsyncMock(side_effect=rpc_error(grpc.StatusCode.UNIMPLEMENTED))
+
+    assert await negotiator.call(TARGET, SERVICE, probe, legacy, latest) == "v1"
+    assert await negotiator.call(TARGET, SERVICE, probe, legacy, latest) == "v1"
+    latest.assert_awaited_once()
+    assert [call.args for call in legacy.await_args_list] == [(), ()]
+
+
+async def test_call_does_not_retry_other_errors() -> None:
+    """Тест ошибки вызова новой версии, не связанной с версией API."""
+    negotiator = VersionNegotiator()
+    legacy = AsyncMock()
+    latest = AsyncMock(side_effect=rpc_error(grpc.StatusCode.DEADLINE_EXCEEDED))
+
+    with pytest.raises(grpc.aio.AioRpcError):
+        await negotiator.call(TARGET, SERVICE, AsyncMock(), legacy, latest)
+    legacy.assert_not_awaited()
+    assert await negotiator.version(TARGET, SERVICE, AsyncMock()) == LATEST_VERSION
@@ -28,7 +28,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0fmoderator.proto\x12\x06review\"\x96\x01\n\x13\x43reateReviewRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x10\n\x08movie_id\x18\x02 \x01(\t\x12\x11\n\treview_id\x18\x03 \x01(\t\x12\x14\n\x0creview_title\x18\x04 \x01(\t\x12\x13\n\x0breview_text\x18\x05 \x01(\t\x12\x1e\n\x16\x61uto_moderation_result\x18\x06 \x01(\t\"(\n\x13\x44\x65leteReviewRequest\x12\x11\n\treview_id\x18\x01 \x01(\t\">\n\x1a\x43reateDeleteReviewResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t2\xb4\x01\n\x10ModeratorService\x12O\n\x0c\x43reateReview\x12\x1b.review.CreateReviewRequest\x1a\".review.CreateDeleteReviewResponse\x12O\n\x0c\x44\x65leteReview\x12\x1b.review.DeleteReviewRequest\x1a\".review.CreateDeleteReviewResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0fmoderator.proto\x12\x06review\"\x96\x01\n\x13\x43reateReviewRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x10\n\x08movie_id\x18\x02 \x01(\t\x12\x11\n\treview_id\x18\x03 \x01(\t\x12\x14\n\x0creview_title\x18\x04 \x01(\t\x12\x13\n\x0breview_text\x18\x05 \x01(\t\x12\x1e\n\x16\x61uto_moderation_result\x18\x06 \x01(\t\"(\n\x13\x44\x65leteReviewRequest\x12\x11\n\treview_id\x18\x01 \x01(\t\">\n\x1a\x43reateDeleteReviewResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"H\n\x18\x43reateReviewBatchRequest\x12,\n\x07reviews\x18\x01 \x03(\x0b\x32\x1b.review.CreateReviewRequest\".\n\x18\x44\x65leteReviewBatchRequest\x12\x12\n\nreview_ids\x18\x01 \x03(\t\"U\n\x1f\x43reateDeleteReviewBatchResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x10\n\x08\x61\x66\x66\x65\x63ted\x18\x03 \x01(\x05\x32\xf4\x02\n\x10ModeratorService\x12O\n\x0c\x43reateReview\x12\x1b.review.CreateReviewRequest\x1a\".review.CreateDeleteReviewResponse\x12O\n\x0c\x44\x65leteReview\x12\x1b.review.DeleteReviewRequest\x1a\".review.CreateDeleteReviewResponse\x12^\n\x11\x43reateReviewBatch\x12 .review.CreateReviewBatchRequest\x1a\'.review.CreateDeleteReviewBatchResponse\x12^\n\x11\x44\x65leteReviewBatch\x12 .review.DeleteReviewBatchRequest\x1a\'.review.CreateDeleteReviewBatchResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -41,6 +41,12 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_DELETEREVIEWREQUEST']._serialized_end=220
   _globals['_CREATEDELETEREVIEWRESPONSE']._serialized_start=222
   _globals['_CREATEDELETEREVIEWRESPONSE']._serialized_end=284
-  _globals['_MODERATORSERVICE']._serialized_start=287
-  _globals['_MODERATORSERVICE']._serialized_end=467
+  _globals['_CREATEREVIEWBATCHREQUEST']._serialized_start=286
+  _globals['_CREATEREVIEWBATCHREQUEST']._serialized_end=358
+  _globals['_DELETEREVIEWBATCHREQUEST']._serialized_start=360
+  _globals['_DELETEREVIEWBATCHREQUEST']._serialized_end=406
+  _globals['_CREATEDELETEREVIEWBATCHRESPONSE']._serialized_start=408
+  _globals['_CREATEDELETEREVIEWBATCHRESPONSE']._serialized_end=493
+  _globals['_MODERATORSERVICE']._serialized_start=496
+  _globals['_MODERATORSERVICE']._serialized_end=868
 # @@protoc_insertion_point(module_scope)
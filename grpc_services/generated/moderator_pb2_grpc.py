@@ -48,6 +48,16 @@ class ModeratorServiceStub(object):
                 request_serializer=moderator__pb2.DeleteReviewRequest.SerializeToString,
                 response_deserializer=moderator__pb2.CreateDeleteReviewResponse.FromString,
                 _registered_method=True)
+        self.CreateReviewBatch = channel.unary_unary(
+                '/review.ModeratorService/CreateReviewBatch',
+                request_serializer=moderator__pb2.CreateReviewBatchRequest.SerializeToString,
+                response_deserializer=moderator__pb2.CreateDeleteReviewBatchResponse.FromString,
+                _registered_method=True)
+        self.DeleteReviewBatch = channel.unary_unary(
+                '/review.ModeratorService/DeleteReviewBatch',
+                request_serializer=moderator__pb2.DeleteReviewBatchRequest.SerializeToString,
+                response_deserializer=moderator__pb2.CreateDeleteReviewBatchResponse.FromString,
+                _registered_method=True)
 
 
 class ModeratorServiceServicer(object):
@@ -65,6 +75,20 @@ class ModeratorServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CreateReviewBatch(self, request, context):
+        """Добавляет рецензии одной многострочной вставкой, уже добавленные пропускаются
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteReviewBatch(self, request, context):
+        """Удаляет рецензии одним запросом
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ModeratorServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -78,6 +102,16 @@ def add_ModeratorServiceServicer_to_server(servicer, server):
                     request_deserializer=moderator__pb2.DeleteReviewRequest.FromString,
                     response_serializer=moderator__pb2.CreateDeleteReviewResponse.SerializeToString,
             ),
+            'CreateReviewBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateReviewBatch,
+                    request_deserializer=moderator__pb2.CreateReviewBatchRequest.FromString,
+                    response_serializer=moderator__pb2.CreateDeleteReviewBatchResponse.SerializeToString,
+            ),
+            'DeleteReviewBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteReviewBatch,
+                    request_deserializer=moderator__pb2.DeleteReviewBatchRequest.FromString,
+                    response_serializer=moderator__pb2.CreateDeleteReviewBatchResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'review.ModeratorService', rpc_method_handlers)
@@ -142,3 +176,57 @@ class ModeratorService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def CreateReviewBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/review.ModeratorService/CreateReviewBatch',
+            moderator__pb2.CreateReviewBatchRequest.SerializeToString,
+            moderator__pb2.CreateDeleteReviewBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteReviewBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/review.ModeratorService/DeleteReviewBatch',
+            moderator__pb2.DeleteReviewBatchRequest.SerializeToString,
+            moderator__pb2.CreateDeleteReviewBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: moderator_v2.proto
+# Protobuf Python Version: 5.29.0
+"""Generated protocol buffer code."""
+# thirdparty
+from google.protobuf import (
+    descriptor as _descriptor,
+    descriptor_pool as _descriptor_pool,
+    runtime_version as _runtime_version,
+    symbol_database as _symbol_database,
+)
+from google.protobuf.internal import builder as _builder
+
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    0,
+    '',
+    'moderator_v2.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12moderator_v2.proto\x12\treview.v2\"\x96\x01\n\x13\x43reateReviewRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x0c\x12\x10\n\x08movie_id\x18\x02 \x01(\x0c\x12\x11\n\treview_id\x18\x03 \x01(\x0c\x12\x14\n\x0creview_title\x18\x04 \x01(\t\x12\x13\n\x0breview_text\x18\x05 \x01(\t\x12\x1e\n\x16\x61uto_moderation_result\x18\x06 \x01(\t\"(\n\x13\x44\x65leteReviewRequest\x12\x11\n\treview_id\x18\x01 \x01(\x0c\">\n\x1a\x43reateDeleteReviewResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"K\n\x18\x43reateReviewBatchRequest\x12/\n\x07reviews\x18\x01 \x03(\x0b\x32\x1e.review.v2.CreateReviewRequest\".\n\x18\x44\x65leteReviewBatchRequest\x12\x12\n\nreview_ids\x18\x01 \x03(\x0c\"U\n\x1f\x43reateDeleteReviewBatchResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x10\n\x08\x61\x66\x66\x65\x63ted\x18\x03 \x01(\x05\x32\x8c\x03\n\x10ModeratorService\x12U\n\x0c\x43reateReview\x12\x1e.review.v2.CreateReviewRequest\x1a%.review.v2.CreateDeleteReviewResponse\x12U\n\x0c\x44\x65leteReview\x12\x1e.review.v2.DeleteReviewRequest\x1a%.review.v2.CreateDeleteReviewResponse\x12\x64\n\x11\x43reateReviewBatch\x12#.review.v2.CreateReviewBatchRequest\x1a*.review.v2.CreateDeleteReviewBatchResponse\x12\x64\n\x11\x44\x65leteReviewBatch\x12#.review.v2.DeleteReviewBatchRequest\x1a*.review.v2.CreateDeleteReviewBatchResponseb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'moderator_v2_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_CREATEREVIEWREQUEST']._serialized_start=34
+  _globals['_CREATEREVIEWREQUEST']._serialized_end=184
+  _globals['_DELETEREVIEWREQUEST']._serialized_start=186
+  _globals['_DELETEREVIEWREQUEST']._serialized_end=226
+  _globals['_CREATEDELETEREVIEWRESPONSE']._serialized_start=228
+  _globals['_CREATEDELETEREVIEWRESPONSE']._serialized_end=290
+  _globals['_CREATEREVIEWBATCHREQUEST']._serialized_start=292
+  _globals['_CREATEREVIEWBATCHREQUEST']._serialized_end=367
+  _globals['_DELETEREVIEWBATCHREQUEST']._serialized_start=369
+  _globals['_DELETEREVIEWBATCHREQUEST']._serialized_end=415
+  _globals['_CREATEDELETEREVIEWBATCHRESPONSE']._serialized_start=417
+  _globals['_CREATEDELETEREVIEWBATCHRESPONSE']._serialized_end=502
+  _globals['_MODERATORSERVICE']._serialized_start=505
+  _globals['_MODERATORSERVICE']._serialized_end=901
+# @@protoc_insertion_point(module_scope)
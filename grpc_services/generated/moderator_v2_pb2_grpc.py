@@ -0,0 +1,235 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+# stdlib
+import warnings
+
+# thirdparty
+import grpc
+
+from . import moderator_v2_pb2 as moderator__v2__pb2
+
+GRPC_GENERATED_VERSION = '1.71.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    # thirdparty
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + f' but the generated code in moderator_v2_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class ModeratorServiceStub(object):
+    """Версия 2: идентификаторы передаются 16 байтами UUID
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.CreateReview = channel.unary_unary(
+                '/review.v2.ModeratorService/CreateReview',
+                request_serializer=moderator__v2__pb2.CreateReviewRequest.SerializeToString,
+                response_deserializer=moderator__v2__pb2.CreateDeleteReviewResponse.FromString,
+                _registered_method=True)
+        self.DeleteReview = channel.unary_unary(
+                '/review.v2.ModeratorService/DeleteReview',
+                request_serializer=moderator__v2__pb2.DeleteReviewRequest.SerializeToString,
+                response_deserializer=moderator__v2__pb2.CreateDeleteReviewResponse.FromString,
+                _registered_method=True)
+        self.CreateReviewBatch = channel.unary_unary(
+                '/review.v2.ModeratorService/CreateReviewBatch',
+                request_serializer=moderator__v2__pb2.CreateReviewBatchRequest.SerializeToString,
+                response_deserializer=moderator__v2__pb2.CreateDeleteReviewBatchResponse.FromString,
+                _registered_method=True)
+        self.DeleteReviewBatch = channel.unary_unary(
+                '/review.v2.ModeratorService/DeleteReviewBatch',
+                request_serializer=moderator__v2__pb2.DeleteReviewBatchRequest.SerializeToString,
+                response_deserializer=moderator__v2__pb2.CreateDeleteReviewBatchResponse.FromString,
+                _registered_method=True)
+
+
+class ModeratorServiceServicer(object):
+    """Версия 2: идентификаторы передаются 16 байтами UUID
+    """
+
+    def CreateReview(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteReview(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CreateReviewBatch(self, request, context):
+        """Добавляет рецензии одной многострочной вставкой, уже добавленные пропускаются
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteReviewBatch(self, request, context):
+        """Удаляет рецензии одним запросом
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_ModeratorServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'CreateReview': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateReview,
+                    request_deserializer=moderator__v2__pb2.CreateReviewRequest.FromString,
+                    response_serializer=moderator__v2__pb2.CreateDeleteReviewResponse.SerializeToString,
+            ),
+            'DeleteReview': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteReview,
+                    request_deserializer=moderator__v2__pb2.DeleteReviewRequest.FromString,
+                    response_serializer=moderator__v2__pb2.CreateDeleteReviewResponse.SerializeToString,
+            ),
+            'CreateReviewBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateReviewBatch,
+                    request_deserializer=moderator__v2__pb2.CreateReviewBatchRequest.FromString,
+                    response_serializer=moderator__v2__pb2.CreateDeleteReviewBatchResponse.SerializeToString,
+            ),
+            'DeleteReviewBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteReviewBatch,
+                    request_deserializer=moderator__v2__pb2.DeleteReviewBatchRequest.FromString,
+                    response_serializer=moderator__v2__pb2.CreateDeleteReviewBatchResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'review.v2.ModeratorService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('review.v2.ModeratorService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class ModeratorService(object):
+    """Версия 2: идентификаторы передаются 16 байтами UUID
+    """
+
+    @staticmethod
+    def CreateReview(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/review.v2.ModeratorService/CreateReview',
+            moderator__v2__pb2.CreateReviewRequest.SerializeToString,
+            moderator__v2__pb2.CreateDeleteReviewResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteReview(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/review.v2.ModeratorService/DeleteReview',
+            moderator__v2__pb2.DeleteReviewRequest.SerializeToString,
+            moderator__v2__pb2.CreateDeleteReviewResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CreateReviewBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/review.v2.ModeratorService/CreateReviewBatch',
+            moderator__v2__pb2.CreateReviewBatchRequest.SerializeToString,
+            moderator__v2__pb2.CreateDeleteReviewBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteReviewBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/review.v2.ModeratorService/DeleteReviewBatch',
+            moderator__v2__pb2.DeleteReviewBatchRequest.SerializeToString,
+            moderator__v2__pb2.CreateDeleteReviewBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -28,7 +28,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0creview.proto\x12\x06review\"O\n\x19UpdateReviewStatusRequest\x12\x11\n\treview_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x0f\n\x07\x63omment\x18\x03 \x01(\t\">\n\x1aUpdateReviewStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t2l\n\rReviewService\x12[\n\x12UpdateReviewStatus\x12!.review.UpdateReviewStatusRequest\x1a\".review.UpdateReviewStatusResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0creview.proto\x12\x06review\"O\n\x19UpdateReviewStatusRequest\x12\x11\n\treview_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x0f\n\x07\x63omment\x18\x03 \x01(\t\">\n\x1aUpdateReviewStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"T\n\x1eUpdateReviewStatusBatchRequest\x12\x32\n\x07updates\x18\x01 \x03(\x0b\x32!.review.UpdateReviewStatusRequest\"O\n\x18UpdateReviewStatusResult\x12\x11\n\treview_id\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x0f\n\x07message\x18\x03 \x01(\t\"T\n\x1fUpdateReviewStatusBatchResponse\x12\x31\n\x07results\x18\x01 \x03(\x0b\x32 .review.UpdateReviewStatusResult2\xc3\x02\n\rReviewService\x12[\n\x12UpdateReviewStatus\x12!.review.UpdateReviewStatusRequest\x1a\".review.UpdateReviewStatusResponse\x12j\n\x17UpdateReviewStatusBatch\x12&.review.UpdateReviewStatusBatchRequest\x1a\'.review.UpdateReviewStatusBatchResponse\x12i\n\x19StreamReviewStatusUpdates\x12!.review.UpdateReviewStatusRequest\x1a\'.review.UpdateReviewStatusBatchResponse(\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -39,6 +39,12 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_UPDATEREVIEWSTATUSREQUEST']._serialized_end=103
   _globals['_UPDATEREVIEWSTATUSRESPONSE']._serialized_start=105
   _globals['_UPDATEREVIEWSTATUSRESPONSE']._serialized_end=167
-  _globals['_REVIEWSERVICE']._serialized_start=169
-  _globals['_REVIEWSERVICE']._serialized_end=277
+  _globals['_UPDATEREVIEWSTATUSBATCHREQUEST']._serialized_start=169
+  _globals['_UPDATEREVIEWSTATUSBATCHREQUEST']._serialized_end=253
+  _globals['_UPDATEREVIEWSTATUSRESULT']._serialized_start=255
+  _globals['_UPDATEREVIEWSTATUSRESULT']._serialized_end=334
+  _globals['_UPDATEREVIEWSTATUSBATCHRESPONSE']._serialized_start=336
+  _globals['_UPDATEREVIEWSTATUSBATCHRESPONSE']._serialized_end=420
+  _globals['_REVIEWSERVICE']._serialized_start=423
+  _globals['_REVIEWSERVICE']._serialized_end=746
 # @@protoc_insertion_point(module_scope)
@@ -43,6 +43,16 @@ class ReviewServiceStub(object):
                 request_serializer=review__pb2.UpdateReviewStatusRequest.SerializeToString,
                 response_deserializer=review__pb2.UpdateReviewStatusResponse.FromString,
                 _registered_method=True)
+        self.UpdateReviewStatusBatch = channel.unary_unary(
+                '/review.ReviewService/UpdateReviewStatusBatch',
+                request_serializer=review__pb2.UpdateReviewStatusBatchRequest.SerializeToString,
+                response_deserializer=review__pb2.UpdateReviewStatusBatchResponse.FromString,
+                _registered_method=True)
+        self.StreamReviewStatusUpdates = channel.stream_unary(
+                '/review.ReviewService/StreamReviewStatusUpdates',
+                request_serializer=review__pb2.UpdateReviewStatusRequest.SerializeToString,
+                response_deserializer=review__pb2.UpdateReviewStatusBatchResponse.FromString,
+                _registered_method=True)
 
 
 class ReviewServiceServicer(object):
@@ -54,6 +64,20 @@ class ReviewServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def UpdateReviewStatusBatch(self, request, context):
+        """Обновляет статусы нескольких рецензий одной массовой записью в MongoDB
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamReviewStatusUpdates(self, request_iterator, context):
+        """Принимает поток обновлений статусов и применяет их пакетами по мере поступления
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ReviewServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -62,6 +86,16 @@ def add_ReviewServiceServicer_to_server(servicer, server):
                     request_deserializer=review__pb2.UpdateReviewStatusRequest.FromString,
                     response_serializer=review__pb2.UpdateReviewStatusResponse.SerializeToString,
             ),
+            'UpdateReviewStatusBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateReviewStatusBatch,
+                    request_deserializer=review__pb2.UpdateReviewStatusBatchRequest.FromString,
+                    response_serializer=review__pb2.UpdateReviewStatusBatchResponse.SerializeToString,
+            ),
+            'StreamReviewStatusUpdates': grpc.stream_unary_rpc_method_handler(
+                    servicer.StreamReviewStatusUpdates,
+                    request_deserializer=review__pb2.UpdateReviewStatusRequest.FromString,
+                    response_serializer=review__pb2.UpdateReviewStatusBatchResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'review.ReviewService', rpc_method_handlers)
@@ -99,3 +133,57 @@ class ReviewService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def UpdateReviewStatusBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/review.ReviewService/UpdateReviewStatusBatch',
+            review__pb2.UpdateReviewStatusBatchRequest.SerializeToString,
+            review__pb2.UpdateReviewStatusBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamReviewStatusUpdates(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/review.ReviewService/StreamReviewStatusUpdates',
+            review__pb2.UpdateReviewStatusRequest.SerializeToString,
+            review__pb2.UpdateReviewStatusBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
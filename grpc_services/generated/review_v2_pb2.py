@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: review_v2.proto
+# Protobuf Python Version: 5.29.0
+"""Generated protocol buffer code."""
+# thirdparty
+from google.protobuf import (
+    descriptor as _descriptor,
+    descriptor_pool as _descriptor_pool,
+    runtime_version as _runtime_version,
+    symbol_database as _symbol_database,
+)
+from google.protobuf.internal import builder as _builder
+
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    0,
+    '',
+    'review_v2.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0freview_v2.proto\x12\treview.v2\"l\n\x19UpdateReviewStatusRequest\x12\x11\n\treview_id\x18\x01 \x01(\x0c\x12+\n\x06status\x18\x02 \x01(\x0e\x32\x1b.review.v2.ModerationStatus\x12\x0f\n\x07\x63omment\x18\x03 \x01(\t\">\n\x1aUpdateReviewStatusResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\"W\n\x1eUpdateReviewStatusBatchRequest\x12\x35\n\x07updates\x18\x01 \x03(\x0b\x32$.review.v2.UpdateReviewStatusRequest\"O\n\x18UpdateReviewStatusResult\x12\x11\n\treview_id\x18\x01 \x01(\x0c\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x0f\n\x07message\x18\x03 \x01(\t\"W\n\x1fUpdateReviewStatusBatchResponse\x12\x34\n\x07results\x18\x01 \x03(\x0b\x32#.review.v2.UpdateReviewStatusResult*\x94\x01\n\x10ModerationStatus\x12!\n\x1dMODERATION_STATUS_UNSPECIFIED\x10\x00\x12\x1e\n\x1aMODERATION_STATUS_APPROVED\x10\x01\x12\x1e\n\x1aMODERATION_STATUS_REJECTED\x10\x02\x12\x1d\n\x19MODERATION_STATUS_PENDING\x10\x03\x32\xd5\x02\n\rReviewService\x12\x61\n\x12UpdateReviewStatus\x12$.review.v2.UpdateReviewStatusRequest\x1a%.review.v2.UpdateReviewStatusResponse\x12p\n\x17UpdateReviewStatusBatch\x12).review.v2.UpdateReviewStatusBatchRequest\x1a*.review.v2.UpdateReviewStatusBatchResponse\x12o\n\x19StreamReviewStatusUpdates\x12$.review.v2.UpdateReviewStatusRequest\x1a*.review.v2.UpdateReviewStatusBatchResponse(\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'review_v2_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_MODERATIONSTATUS']._serialized_start=464
+  _globals['_MODERATIONSTATUS']._serialized_end=612
+  _globals['_UPDATEREVIEWSTATUSREQUEST']._serialized_start=30
+  _globals['_UPDATEREVIEWSTATUSREQUEST']._serialized_end=138
+  _globals['_UPDATEREVIEWSTATUSRESPONSE']._serialized_start=140
+  _globals['_UPDATEREVIEWSTATUSRESPONSE']._serialized_end=202
+  _globals['_UPDATEREVIEWSTATUSBATCHREQUEST']._serialized_start=204
+  _globals['_UPDATEREVIEWSTATUSBATCHREQUEST']._serialized_end=291
+  _globals['_UPDATEREVIEWSTATUSRESULT']._serialized_start=293
+  _globals['_UPDATEREVIEWSTATUSRESULT']._serialized_end=372
+  _globals['_UPDATEREVIEWSTATUSBATCHRESPONSE']._serialized_start=374
+  _globals['_UPDATEREVIEWSTATUSBATCHRESPONSE']._serialized_end=461
+  _globals['_REVIEWSERVICE']._serialized_start=615
+  _globals['_REVIEWSERVICE']._serialized_end=956
+# @@protoc_insertion_point(module_scope)
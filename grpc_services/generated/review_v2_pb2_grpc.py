@@ -0,0 +1,192 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+# stdlib
+import warnings
+
+# thirdparty
+import grpc
+
+from . import review_v2_pb2 as review__v2__pb2
+
+GRPC_GENERATED_VERSION = '1.71.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    # thirdparty
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + f' but the generated code in review_v2_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class ReviewServiceStub(object):
+    """Версия 2: идентификаторы передаются 16 байтами UUID, статусы - перечислением
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.UpdateReviewStatus = channel.unary_unary(
+                '/review.v2.ReviewService/UpdateReviewStatus',
+                request_serializer=review__v2__pb2.UpdateReviewStatusRequest.SerializeToString,
+                response_deserializer=review__v2__pb2.UpdateReviewStatusResponse.FromString,
+                _registered_method=True)
+        self.UpdateReviewStatusBatch = channel.unary_unary(
+                '/review.v2.ReviewService/UpdateReviewStatusBatch',
+                request_serializer=review__v2__pb2.UpdateReviewStatusBatchRequest.SerializeToString,
+                response_deserializer=review__v2__pb2.UpdateReviewStatusBatchResponse.FromString,
+                _registered_method=True)
+        self.StreamReviewStatusUpdates = channel.stream_unary(
+                '/review.v2.ReviewService/StreamReviewStatusUpdates',
+                request_serializer=review__v2__pb2.UpdateReviewStatusRequest.SerializeToString,
+                response_deserializer=review__v2__pb2.UpdateReviewStatusBatchResponse.FromString,
+                _registered_method=True)
+
+
+class ReviewServiceServicer(object):
+    """Версия 2: идентификаторы передаются 16 байтами UUID, статусы - перечислением
+    """
+
+    def UpdateReviewStatus(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateReviewStatusBatch(self, request, context):
+        """Обновляет статусы нескольких рецензий одной массовой записью в MongoDB
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamReviewStatusUpdates(self, request_iterator, context):
+        """Принимает поток обновлений статусов и применяет их пакетами по мере поступления
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_ReviewServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'UpdateReviewStatus': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateReviewStatus,
+                    request_deserializer=review__v2__pb2.UpdateReviewStatusRequest.FromString,
+                    response_serializer=review__v2__pb2.UpdateReviewStatusResponse.SerializeToString,
+            ),
+            'UpdateReviewStatusBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateReviewStatusBatch,
+                    request_deserializer=review__v2__pb2.UpdateReviewStatusBatchRequest.FromString,
+                    response_serializer=review__v2__pb2.UpdateReviewStatusBatchResponse.SerializeToString,
+            ),
+            'StreamReviewStatusUpdates': grpc.stream_unary_rpc_method_handler(
+                    servicer.StreamReviewStatusUpdates,
+                    request_deserializer=review__v2__pb2.UpdateReviewStatusRequest.FromString,
+                    response_serializer=review__v2__pb2.UpdateReviewStatusBatchResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'review.v2.ReviewService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('review.v2.ReviewService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class ReviewService(object):
+    """Версия 2: идентификаторы передаются 16 байтами UUID, статусы - перечислением
+    """
+
+    @staticmethod
+    def UpdateReviewStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/review.v2.ReviewService/UpdateReviewStatus',
+            review__v2__pb2.UpdateReviewStatusRequest.SerializeToString,
+            review__v2__pb2.UpdateReviewStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateReviewStatusBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/review.v2.ReviewService/UpdateReviewStatusBatch',
+            review__v2__pb2.UpdateReviewStatusBatchRequest.SerializeToString,
+            review__v2__pb2.UpdateReviewStatusBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamReviewStatusUpdates(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/review.v2.ReviewService/StreamReviewStatusUpdates',
+            review__v2__pb2.UpdateReviewStatusRequest.SerializeToString,
+            review__v2__pb2.UpdateReviewStatusBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
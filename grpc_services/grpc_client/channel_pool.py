@@ -0,0 +1,103 @@
+# stdlib
+import itertools
+import json
+
+# thirdparty
+import grpc
+
+# Таймаут вызова по умолчанию, с
+DEFAULT_TIMEOUT = 5.0
+
+# Повтор вызовов, не дошедших до сервера (UNAVAILABLE), на уровне канала
+RETRY_SERVICE_CONFIG = json.dumps(
+    {
+        "methodConfig": [
+            {
+                "name": [
+                    {"service": "review.ReviewService"},
+                    {"service": "review.ModeratorService"},
+                    {"service": "review.v2.ReviewService"},
+                    {"service": "review.v2.ModeratorService"},
+                ],
+                "retryPolicy": {
+                    "maxAttempts": 3,
+                    "initialBackoff": "0.1s",
+                    "maxBackoff": "1s",
+                    "backoffMultiplier": 2,
+                    "retryableStatusCodes": ["UNAVAILABLE"],
+                },
+            }
+        ]
+    }
+)
+
+# Keepalive-пинги обнаруживают оборванные соединения до очередного вызова
+CHANNEL_OPTIONS: list[tuple[str, int | str]] = [
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.enable_retries", 1),
+    ("grpc.service_config", RETRY_SERVICE_CONFIG),
+    # Каналы с одинаковыми настройками делят глобальный пул подканалов, то есть одно
+    # HTTP/2-соединение; локальный пул дает каждому каналу пула свое соединение
+    ("grpc.use_local_subchannel_pool", 1),
+]
+
+
+class ChannelPool:
+    """Общий для процесса пул gRPC-каналов.
+
+    Каналы создаются при первом обращении к адресу и переиспользуются всеми клиентами,
+    поэтому вызов не тратит время на установку HTTP/2-соединения. На каждый адрес
+    открывается `size` каналов, каждый со своим соединением, и каналы выдаются по кругу.
+    Сервер с несколькими процессами на общем порту распределяет между процессами
+    соединения, а не вызовы, поэтому нагрузка клиента попадает не более чем в `size`
+    процессов сервера. При остановке процесса каналы закрываются через `close`.
+    """
+
+    def __init__(self, size: int = 1, options: list[tuple[str, int | str]] | None = None) -> None:
+        """Инициализирует пул.
+
+        Args:
+            size: Количество каналов на один адрес
+            options: Настройки каналов
+        """
+        self.size = size
+        self.options = CHANNEL_OPTIONS if options is None else options
+        self._channels: dict[str, list[grpc.aio.Channel]] = {}
+        self._cycles: dict[str, itertools.cycle[grpc.aio.Channel]] = {}
+
+    def configure(self, size: int) -> None:
+        """Задает количество каналов на адрес.
+
+        Действует для адресов, к которым каналы еще не открыты, поэтому вызывается
+        при запуске процесса до первого gRPC-вызова.
+
+        Args:
+            size: Количество каналов на один адрес
+        """
+        self.size = size
+
+    def get(self, target: str) -> grpc.aio.Channel:
+        """Возвращает канал к адресу.
+
+        Args:
+            target: Адрес gRPC-сервера
+        """
+        if target not in self._cycles:
+            channels = [grpc.aio.insecure_channel(target, options=self.options) for _ in range(self.size)]
+            self._channels[target] = channels
+            self._cycles[target] = itertools.cycle(channels)
+        return next(self._cycles[target])
+
+    async def close(self) -> None:
+        """Закрывает все каналы пула."""
+        channels = [channel for target_channels in self._channels.values() for channel in target_channels]
+        self._channels.clear()
+        self._cycles.clear()
+        for channel in channels:
+            await channel.close()
+
+
+channel_pool = ChannelPool()
@@ -1,14 +1,38 @@
-# thirdparty
-import grpc
+# stdlib
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+from uuid import UUID
 
 # project
-from grpc_services.generated import moderator_pb2, moderator_pb2_grpc
+from grpc_services.generated import (
+    moderator_pb2,
+    moderator_pb2_grpc,
+    moderator_v2_pb2,
+    moderator_v2_pb2_grpc,
+)
+from grpc_services.grpc_client.channel_pool import (
+    DEFAULT_TIMEOUT,
+    channel_pool,
+)
+from grpc_services.grpc_client.versioning import LEGACY_VERSION, negotiator
+
+SERVICE_NAME = "review.ModeratorService"
 
 
 class ModeratorGRPCClient:
-    def __init__(self, grpc_server_url: str) -> None:
-        self.channel = grpc.aio.insecure_channel(grpc_server_url)
+    def __init__(
+        self,
+        grpc_server_url: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        api_version: int | None = None,
+    ) -> None:
+        self.grpc_server_url = grpc_server_url
+        self.channel = channel_pool.get(grpc_server_url)
         self.stub = moderator_pb2_grpc.ModeratorServiceStub(self.channel)
+        self.stub_v2 = moderator_v2_pb2_grpc.ModeratorServiceStub(self.channel)
+        self.timeout = timeout
+        # None - версия API определяется по ответу сервера
+        self.api_version = api_version
 
     async def create_review(
         self,
@@ -18,7 +42,7 @@ class ModeratorGRPCClient:
         review_title: str,
         review_text: str,
         auto_moderation_result: str,
-    ) -> moderator_pb2.CreateDeleteReviewResponse:
+    ) -> moderator_pb2.CreateDeleteReviewResponse | moderator_v2_pb2.CreateDeleteReviewResponse:
         request = moderator_pb2.CreateReviewRequest(
             user_id=user_id,
             movie_id=movie_id,
@@ -27,11 +51,75 @@ class ModeratorGRPCClient:
             review_text=review_text,
             auto_moderation_result=auto_moderation_result,
         )
-        return await self.stub.CreateReview(request)
+        return await self._call(
+            lambda: self.stub.CreateReview(request, timeout=self.timeout),
+            lambda: self.stub_v2.CreateReview(self._request_v2(request), timeout=self.timeout),
+        )
 
-    async def delete_review(self, review_id: str) -> moderator_pb2.CreateDeleteReviewResponse:
-        request = moderator_pb2.DeleteReviewRequest(review_id=review_id)
-        return await self.stub.DeleteReview(request)
+    async def delete_review(
+        self, review_id: str
+    ) -> moderator_pb2.CreateDeleteReviewResponse | moderator_v2_pb2.CreateDeleteReviewResponse:
+        return await self._call(
+            lambda: self.stub.DeleteReview(
+                moderator_pb2.DeleteReviewRequest(review_id=review_id), timeout=self.timeout
+            ),
+            lambda: self.stub_v2.DeleteReview(
+                moderator_v2_pb2.DeleteReviewRequest(review_id=UUID(review_id).bytes), timeout=self.timeout
+            ),
+        )
+
+    async def create_reviews(
+        self,
+        reviews: Iterable[moderator_pb2.CreateReviewRequest],
+    ) -> moderator_pb2.CreateDeleteReviewBatchResponse | moderator_v2_pb2.CreateDeleteReviewBatchResponse:
+        reviews = list(reviews)
+        return await self._call(
+            lambda: self.stub.CreateReviewBatch(
+                moderator_pb2.CreateReviewBatchRequest(reviews=reviews), timeout=self.timeout
+            ),
+            lambda: self.stub_v2.CreateReviewBatch(
+                moderator_v2_pb2.CreateReviewBatchRequest(reviews=[self._request_v2(review) for review in reviews]),
+                timeout=self.timeout,
+            ),
+        )
 
-    async def close(self) -> None:
-        await self.channel.close()
+    async def delete_reviews(
+        self, review_ids: Iterable[str]
+    ) -> moderator_pb2.CreateDeleteReviewBatchResponse | moderator_v2_pb2.CreateDeleteReviewBatchResponse:
+        review_ids = list(review_ids)
+        return await self._call(
+            lambda: self.stub.DeleteReviewBatch(
+                moderator_pb2.DeleteReviewBatchRequest(review_ids=review_ids), timeout=self.timeout
+            ),
+            lambda: self.stub_v2.DeleteReviewBatch(
+                moderator_v2_pb2.DeleteReviewBatchRequest(
+                    review_ids=[UUID(review_id).bytes for review_id in review_ids]
+                ),
+                timeout=self.timeout,
+            ),
+        )
+
+    async def _call(
+        self,
+        legacy: Callable[[], Awaitable[Any]],
+        latest: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Выполняет вызов в заданной версии API или в версии, которую поддерживает сервер."""
+        if self.api_version is not None:
+            return await (legacy() if self.api_version == LEGACY_VERSION else latest())
+        return await negotiator.call(self.grpc_server_url, SERVICE_NAME, self._probe, legacy, latest)
+
+    async def _probe(self) -> None:
+        """Пробный вызов v2: пустой пакет удалений не изменяет данные."""
+        await self.stub_v2.DeleteReviewBatch(moderator_v2_pb2.DeleteReviewBatchRequest(), timeout=self.timeout)
+
+    @staticmethod
+    def _request_v2(request: moderator_pb2.CreateReviewRequest) -> moderator_v2_pb2.CreateReviewRequest:
+        return moderator_v2_pb2.CreateReviewRequest(
+            user_id=UUID(request.user_id).bytes,
+            movie_id=UUID(request.movie_id).bytes,
+            review_id=UUID(request.review_id).bytes,
+            review_title=request.review_title,
+            review_text=request.review_text,
+            auto_moderation_result=request.auto_moderation_result,
+        )
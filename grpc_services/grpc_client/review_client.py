@@ -1,23 +1,140 @@
+# stdlib
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+)
+from typing import Any
+from uuid import UUID
+
 # thirdparty
 import grpc
 
 # project
-from grpc_services.generated import review_pb2, review_pb2_grpc
+from grpc_services.generated import (
+    review_pb2,
+    review_pb2_grpc,
+    review_v2_pb2,
+    review_v2_pb2_grpc,
+)
+from grpc_services.grpc_client.channel_pool import (
+    DEFAULT_TIMEOUT,
+    channel_pool,
+)
+from grpc_services.grpc_client.versioning import LEGACY_VERSION, negotiator
+
+SERVICE_NAME = "review.ReviewService"
+STATUSES_V2 = {
+    "approved": review_v2_pb2.MODERATION_STATUS_APPROVED,
+    "rejected": review_v2_pb2.MODERATION_STATUS_REJECTED,
+    "pending": review_v2_pb2.MODERATION_STATUS_PENDING,
+}
 
 
 class ReviewGRPCClient:
-    def __init__(self, grpc_server_url: str) -> None:
-        self.channel = grpc.aio.insecure_channel(grpc_server_url)
+    def __init__(
+        self,
+        grpc_server_url: str,
+        timeout: float = DEFAULT_TIMEOUT,
+        api_version: int | None = None,
+    ) -> None:
+        self.grpc_server_url = grpc_server_url
+        self.channel = channel_pool.get(grpc_server_url)
         self.stub = review_pb2_grpc.ReviewServiceStub(self.channel)
+        self.stub_v2 = review_v2_pb2_grpc.ReviewServiceStub(self.channel)
+        self.timeout = timeout
+        # None - версия API определяется по ответу сервера
+        self.api_version = api_version
 
     async def update_review_status(
         self,
         review_id: str,
         status: str,
         comment: str,
-    ) -> review_pb2.UpdateReviewStatusResponse:
+    ) -> review_pb2.UpdateReviewStatusResponse | review_v2_pb2.UpdateReviewStatusResponse:
         request = review_pb2.UpdateReviewStatusRequest(review_id=review_id, status=status, comment=comment)
-        return await self.stub.UpdateReviewStatus(request)
+        return await self._call(
+            lambda: self.stub.UpdateReviewStatus(request, timeout=self.timeout),
+            lambda: self.stub_v2.UpdateReviewStatus(
+                self._request_v2(review_id, status, comment), timeout=self.timeout
+            ),
+        )
+
+    async def update_review_statuses(
+        self,
+        updates: Iterable[tuple[str, str, str]],
+    ) -> review_pb2.UpdateReviewStatusBatchResponse | review_v2_pb2.UpdateReviewStatusBatchResponse:
+        updates = list(updates)
+        request = review_pb2.UpdateReviewStatusBatchRequest(
+            updates=[
+                review_pb2.UpdateReviewStatusRequest(review_id=review_id, status=status, comment=comment)
+                for review_id, status, comment in updates
+            ]
+        )
+        return await self._call(
+            lambda: self.stub.UpdateReviewStatusBatch(request, timeout=self.timeout),
+            lambda: self.stub_v2.UpdateReviewStatusBatch(
+                review_v2_pb2.UpdateReviewStatusBatchRequest(
+                    updates=[self._request_v2(review_id, status, comment) for review_id, status, comment in updates]
+                ),
+                timeout=self.timeout,
+            ),
+        )
+
+    async def stream_review_statuses(
+        self,
+        updates: AsyncIterable[tuple[str, str, str]],
+    ) -> review_pb2.UpdateReviewStatusBatchResponse | review_v2_pb2.UpdateReviewStatusBatchResponse:
+        # Поток обновлений нельзя прочитать повторно, поэтому при UNIMPLEMENTED вызов
+        # не повторяется в v1, а только переводит сервис на v1 для следующих вызовов
+        version = await self._version()
+        if version == LEGACY_VERSION:
+
+            async def requests() -> AsyncIterator[review_pb2.UpdateReviewStatusRequest]:
+                async for review_id, status, comment in updates:
+                    yield review_pb2.UpdateReviewStatusRequest(review_id=review_id, status=status, comment=comment)
+
+            return await self.stub.StreamReviewStatusUpdates(requests(), timeout=self.timeout)
+
+        async def requests_v2() -> AsyncIterator[review_v2_pb2.UpdateReviewStatusRequest]:
+            async for review_id, status, comment in updates:
+                yield self._request_v2(review_id, status, comment)
+
+        try:
+            return await self.stub_v2.StreamReviewStatusUpdates(requests_v2(), timeout=self.timeout)
+        except grpc.aio.AioRpcError as error:
+            if error.code() == grpc.StatusCode.UNIMPLEMENTED and self.api_version is None:
+                negotiator.downgrade(self.grpc_server_url, SERVICE_NAME)
+            raise
+
+    async def _version(self) -> int:
+        """Возвращает версию API, заданную явно или поддерживаемую сервером."""
+        if self.api_version is not None:
+            return self.api_version
+        return await negotiator.version(self.grpc_server_url, SERVICE_NAME, self._probe)
+
+    async def _call(
+        self,
+        legacy: Callable[[], Awaitable[Any]],
+        latest: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Выполняет вызов в заданной версии API или в версии, которую поддерживает сервер."""
+        if self.api_version is not None:
+            return await (legacy() if self.api_version == LEGACY_VERSION else latest())
+        return await negotiator.call(self.grpc_server_url, SERVICE_NAME, self._probe, legacy, latest)
+
+    async def _probe(self) -> None:
+        """Пробный вызов v2: пустой пакет обновлений не изменяет данные."""
+        await self.stub_v2.UpdateReviewStatusBatch(
+            review_v2_pb2.UpdateReviewStatusBatchRequest(), timeout=self.timeout
+        )
 
-    async def close(self) -> None:
-        await self.channel.close()
+    @staticmethod
+    def _request_v2(review_id: str, status: str, comment: str) -> review_v2_pb2.UpdateReviewStatusRequest:
+        return review_v2_pb2.UpdateReviewStatusRequest(
+            review_id=UUID(review_id).bytes,
+            status=STATUSES_V2.get(status, review_v2_pb2.MODERATION_STATUS_UNSPECIFIED),
+            comment=comment,
+        )
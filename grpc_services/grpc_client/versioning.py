@@ -0,0 +1,110 @@
+# stdlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+# thirdparty
+import grpc
+
+logger = logging.getLogger(__name__)
+
+# Версии API сервисов, от новой к старой
+LATEST_VERSION = 2
+LEGACY_VERSION = 1
+# Интервал, через который сервер, поддерживающий только старую версию, проверяется повторно, с
+REPROBE_INTERVAL = 60.0
+
+
+class VersionNegotiator:
+    """Определяет версию API, которую поддерживает сервер.
+
+    Первый вызов сервиса по адресу выполняет пробный вызов новой версии. Если сервер
+    отвечает UNIMPLEMENTED, клиенты используют старую версию и повторяют проверку
+    не чаще `reprobe_interval` секунд, поэтому после обновления серверов переходят
+    на новую версию без перезапуска. Если вызов новой версии получил UNIMPLEMENTED,
+    например после отката сервера, адрес переводится на старую версию.
+    """
+
+    def __init__(self, reprobe_interval: float = REPROBE_INTERVAL) -> None:
+        """Инициализирует определитель версий.
+
+        Args:
+            reprobe_interval: Интервал повторной проверки сервера со старой версией, с
+        """
+        self.reprobe_interval = reprobe_interval
+        # Версия и время проверки по адресу и сервису
+        self._versions: dict[tuple[str, str], tuple[int, float]] = {}
+
+    async def version(self, target: str, service: str, probe: Callable[[], Awaitable[object]]) -> int:
+        """Возвращает версию API сервиса.
+
+        Args:
+            target: Адрес gRPC-сервера
+            service: Имя сервиса
+            probe: Пробный вызов новой версии, не изменяющий данные
+        """
+        key = (target, service)
+        cached = self._versions.get(key)
+        now = time.monotonic()
+        if cached is not None and (cached[0] == LATEST_VERSION or now - cached[1] < self.reprobe_interval):
+            return cached[0]
+        try:
+            await probe()
+            version = LATEST_VERSION
+        except grpc.aio.AioRpcError as error:
+            if error.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+            version = LEGACY_VERSION
+        if cached is None or cached[0] != version:
+            logger.info(f"{service} на {target}: используется версия API v{version}")
+        self._versions[key] = (version, now)
+        return version
+
+    def downgrade(self, target: str, service: str) -> None:
+        """Переводит сервис на старую версию API до следующей проверки.
+
+        Args:
+            target: Адрес gRPC-сервера
+            service: Имя сервиса
+        """
+        logger.warning(
+            f"{service} на {target} не поддерживает версию API v{LATEST_VERSION}, переход на v{LEGACY_VERSION}"
+        )
+        self._versions[(target, service)] = (LEGACY_VERSION, time.monotonic())
+
+    async def call(
+        self,
+        target: str,
+        service: str,
+        probe: Callable[[], Awaitable[object]],
+        legacy: Callable[[], Awaitable[Any]],
+        latest: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Выполняет вызов в версии API, которую поддерживает сервер.
+
+        Если вызов новой версии получил UNIMPLEMENTED, сервис переводится на старую
+        версию и вызов повторяется в ней один раз.
+
+        Args:
+            target: Адрес gRPC-сервера
+            service: Имя сервиса
+            probe: Пробный вызов новой версии, не изменяющий данные
+            legacy: Вызов старой версии
+            latest: Вызов новой версии
+
+        Returns:
+            Ответ сервера
+        """
+        if await self.version(target, service, probe) == LEGACY_VERSION:
+            return await legacy()
+        try:
+            return await latest()
+        except grpc.aio.AioRpcError as error:
+            if error.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+            self.downgrade(target, service)
+        return await legacy()
+
+
+negotiator = VersionNegotiator()
@@ -0,0 +1,131 @@
+# stdlib
+import asyncio
+import logging
+import multiprocessing
+import signal
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from types import FrameType
+
+# thirdparty
+import grpc
+
+logger = logging.getLogger(__name__)
+
+# Настройки сервера, разрешающие keepalive-пинги клиентов с CHANNEL_OPTIONS из channel_pool
+SERVER_KEEPALIVE_OPTIONS: list[tuple[str, int]] = [
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_recv_ping_interval_without_data_ms", 20_000),
+    ("grpc.http2.max_ping_strikes", 0),
+]
+
+# Регистрирует сервисы на сервере и владеет ресурсами процесса (подключениями к БД) на время его работы
+ServerSetup = Callable[[grpc.aio.Server], AbstractAsyncContextManager[object]]
+
+
+@dataclass(frozen=True)
+class ServingConfig:
+    """Режим работы gRPC-сервера."""
+
+    port: int = 50051
+    workers: int = 1
+    max_concurrent_rpcs: int | None = None
+    max_message_length: int = 4 * 1024 * 1024
+    keepalive_time_ms: int = 60_000
+    keepalive_timeout_ms: int = 20_000
+    shutdown_grace: float = 10.0
+
+    def server_options(self) -> list[tuple[str, int]]:
+        """Возвращает настройки сервера.
+
+        SO_REUSEPORT позволяет нескольким процессам принимать соединения на одном порту,
+        распределение соединений между ними выполняет ядро при установке соединения.
+        """
+        return [
+            *SERVER_KEEPALIVE_OPTIONS,
+            ("grpc.keepalive_time_ms", self.keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms),
+            ("grpc.max_receive_message_length", self.max_message_length),
+            ("grpc.max_send_message_length", self.max_message_length),
+            ("grpc.so_reuseport", 1),
+        ]
+
+
+async def serve_process(config: ServingConfig, setup: ServerSetup) -> None:
+    """Обслуживает запросы в текущем процессе до получения SIGTERM или SIGINT.
+
+    По сигналу сервер перестает принимать новые вызовы и дает начатым
+    `shutdown_grace` секунд на завершение.
+
+    Args:
+        config: Режим работы сервера
+        setup: Регистрация сервисов и ресурсы процесса
+    """
+    server = grpc.aio.server(options=config.server_options(), maximum_concurrent_rpcs=config.max_concurrent_rpcs)
+    async with setup(server):
+        server.add_insecure_port(f"[::]:{config.port}")
+        await server.start()
+        stopping = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, stopping.set)
+        logger.info(f"gRPC server running on port {config.port}...")
+        await stopping.wait()
+        logger.info(f"Stopping gRPC server, waiting up to {config.shutdown_grace} s for active calls...")
+        await server.stop(config.shutdown_grace)
+
+
+def _run_process(config: ServingConfig, setup: ServerSetup) -> None:
+    asyncio.run(serve_process(config, setup))
+
+
+def serve(config: ServingConfig, setup: ServerSetup) -> None:
+    """Запускает gRPC-сервер в `workers` процессах на общем порту.
+
+    Процессы запускаются методом spawn, чтобы каждый инициализировал gRPC заново.
+    Ядро распределяет между процессами соединения, а не вызовы: все вызовы одного
+    HTTP/2-соединения обслуживает один процесс. Клиент нагружает не больше процессов,
+    чем открыл соединений, поэтому размер пула каналов клиентов (`ChannelPool.size`)
+    должен быть не меньше `workers`. SIGTERM и SIGINT передаются процессам для плавной остановки. Если процесс
+    завершился сам, останавливаются и остальные, чтобы сервис перезапустился целиком.
+
+    Args:
+        config: Режим работы сервера
+        setup: Регистрация сервисов и ресурсы процесса; должна быть функцией уровня модуля
+    """
+    if config.workers == 1:
+        _run_process(config, setup)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_run_process, args=(config, setup), name=f"grpc-worker-{number}")
+        for number in range(config.workers)
+    ]
+    for process in processes:
+        process.start()
+    logger.info(f"Started {config.workers} gRPC worker processes on port {config.port}")
+
+    stopping = False
+
+    def stop(signum: int, frame: FrameType | None) -> None:
+        # Повторный SIGTERM завершил бы процесс, уже закрывший цикл событий, без обработчика
+        nonlocal stopping
+        if stopping:
+            return
+        stopping = True
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    wait([process.sentinel for process in processes])
+    stop(signal.SIGTERM, None)
+    for process in processes:
+        process.join()
+    failed = [process.name for process in processes if process.exitcode]
+    if failed:
+        raise SystemExit(f"gRPC worker processes exited with an error: {', '.join(failed)}")
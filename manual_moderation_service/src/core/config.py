@@ -9,6 +9,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # project
 from core.logger import LOGGING
+from grpc_services.grpc_server.serving import ServingConfig
 
 logging_config.dictConfig(LOGGING)
 DOTENV_PATH = find_dotenv(".env")
@@ -22,6 +23,7 @@ class AppSettings(BaseSettings):
     project_name: str = Field(default="Manual Moderation API")
     api_production: bool = Field(default=True)
     ugc_grpc_server_url: str = Field(default="ugc-grpc-server:50051")
+    grpc_channel_pool_size: int = Field(default=1, ge=1, description="Количество gRPC-соединений с сервером UGC")
 
     # Настройки Postgres
     db_user: str = Field(default="postgres")
@@ -35,6 +37,17 @@ class AppSettings(BaseSettings):
     jwt_algorithm: str = Field(default="RS256")
     jwt_public_key_path: str = Field(default="/app/keys/example_public_key.pem")
 
+    # gRPC-сервер
+    grpc_port: int = Field(default=50051)
+    grpc_workers: int = Field(default=1, ge=1, description="Количество процессов gRPC-сервера на общем порту")
+    grpc_max_concurrent_rpcs: int | None = Field(
+        default=None, ge=1, description="Максимум одновременных вызовов в процессе, сверх него - RESOURCE_EXHAUSTED"
+    )
+    grpc_max_message_length: int = Field(default=4 * 1024 * 1024, ge=1, description="Максимальный размер сообщения")
+    grpc_keepalive_time_ms: int = Field(default=60_000, ge=1, description="Интервал keepalive-пингов клиентам")
+    grpc_keepalive_timeout_ms: int = Field(default=20_000, ge=1, description="Ожидание ответа на keepalive-пинг")
+    grpc_shutdown_grace: float = Field(default=10.0, ge=0, description="Время на завершение вызовов при остановке")
+
     # Другие настройки
     test_mode: bool = Field(default=False)
 
@@ -49,6 +62,18 @@ class AppSettings(BaseSettings):
     def database_dsn(self) -> str:
         return f"postgresql+asyncpg://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
+    @property
+    def grpc_serving(self) -> ServingConfig:
+        return ServingConfig(
+            port=self.grpc_port,
+            workers=self.grpc_workers,
+            max_concurrent_rpcs=self.grpc_max_concurrent_rpcs,
+            max_message_length=self.grpc_max_message_length,
+            keepalive_time_ms=self.grpc_keepalive_time_ms,
+            keepalive_timeout_ms=self.grpc_keepalive_timeout_ms,
+            shutdown_grace=self.grpc_shutdown_grace,
+        )
+
     @property
     def jwt_public_key(self) -> str:
         try:
@@ -0,0 +1,51 @@
+"""002_unique_review_id
+
+Revision ID: 5b7e1f93a2c4
+Revises: d40cc348551a
+Create Date: 2026-10-18 12:45:03.214571
+
+"""
+
+# stdlib
+from typing import Sequence, Union
+
+# thirdparty
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7e1f93a2c4"
+down_revision: Union[str, None] = "d40cc348551a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Повторно добавленные рецензии оставляем в одном экземпляре: сначала промодерированный
+    # (последний по дате модерации), среди непромодерированных - самый ранний.
+    # Enum хранится в базе по имени, поэтому статус сравнивается с 'PENDING'
+    op.execute(
+        """
+        DELETE FROM review
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT
+                    id,
+                    row_number() OVER (
+                        PARTITION BY review_id
+                        ORDER BY
+                            moderation_status = 'PENDING',
+                            moderation_at DESC NULLS LAST,
+                            created_at,
+                            id
+                    ) AS position
+                FROM review
+            ) AS numbered
+            WHERE position > 1
+        )
+        """
+    )
+    op.create_unique_constraint("review_review_id_key", "review", ["review_id"])
+
+
+def downgrade() -> None:
+    op.drop_constraint("review_review_id_key", "review", type_="unique")
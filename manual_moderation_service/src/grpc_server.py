@@ -1,16 +1,23 @@
 # stdlib
-import asyncio
 import logging
-from concurrent import futures
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
 from uuid import UUID
 
 # thirdparty
 import grpc
 
 # project
-from db.db import get_session
-from grpc_services.generated import moderator_pb2, moderator_pb2_grpc
-from schemas.review import CreateReview
+from core.config import settings
+from db.db import engine, get_session
+from grpc_services.generated import (
+    moderator_pb2,
+    moderator_pb2_grpc,
+    moderator_v2_pb2,
+    moderator_v2_pb2_grpc,
+)
+from grpc_services.grpc_server.serving import serve
+from schemas.review import CreateReview as CreateReviewSchema
 from services.repositories.review import ReviewRepository
 
 logger = logging.getLogger(__name__)
@@ -20,29 +27,20 @@ class ModeratorServiceServicer(moderator_pb2_grpc.ModeratorServiceServicer):
     async def CreateReview(
         self, request: moderator_pb2.CreateReviewRequest, context: grpc.aio.ServicerContext
     ) -> moderator_pb2.CreateDeleteReviewResponse:
-        user_id = UUID(request.user_id)
-        movie_id = UUID(request.movie_id)
-        review_id = UUID(request.review_id)
-        review_title = request.review_title
-        review_text = request.review_text
-        auto_moderation_result = request.auto_moderation_result
-
-        async for session in get_session():
-            review_repo = ReviewRepository(session)
-            try:
-                await review_repo.create(
-                    obj_in=CreateReview(
-                        user_id=user_id,
-                        movie_id=movie_id,
-                        review_id=review_id,
-                        review_title=review_title,
-                        review_text=review_text,
-                        auto_moderation_result=auto_moderation_result,
-                    )
-                )
-                return moderator_pb2.CreateDeleteReviewResponse(success=True)
-            except Exception as er:
-                return moderator_pb2.CreateDeleteReviewResponse(success=False, message=str(er))
+        try:
+            review = CreateReviewSchema(
+                user_id=UUID(request.user_id),
+                movie_id=UUID(request.movie_id),
+                review_id=UUID(request.review_id),
+                review_title=request.review_title,
+                review_text=request.review_text,
+                auto_moderation_result=request.auto_moderation_result,
+            )
+        except ValueError as er:
+            return moderator_pb2.CreateDeleteReviewResponse(success=False, message=str(er))
+        # Повторно доставленный отзыв уже добавлен: вставка пропускает его, как и пакетная
+        success, message, _ = await create_reviews([review])
+        return moderator_pb2.CreateDeleteReviewResponse(success=success, message=message)
 
     async def DeleteReview(
         self, request: moderator_pb2.DeleteReviewRequest, context: grpc.aio.ServicerContext
@@ -59,15 +57,130 @@ class ModeratorServiceServicer(moderator_pb2_grpc.ModeratorServiceServicer):
             except Exception as er:
                 return moderator_pb2.CreateDeleteReviewResponse(success=False, message=str(er))
 
+    async def CreateReviewBatch(
+        self, request: moderator_pb2.CreateReviewBatchRequest, context: grpc.aio.ServicerContext
+    ) -> moderator_pb2.CreateDeleteReviewBatchResponse:
+        try:
+            reviews = [
+                CreateReviewSchema(
+                    user_id=UUID(review.user_id),
+                    movie_id=UUID(review.movie_id),
+                    review_id=UUID(review.review_id),
+                    review_title=review.review_title,
+                    review_text=review.review_text,
+                    auto_moderation_result=review.auto_moderation_result,
+                )
+                for review in request.reviews
+            ]
+        except ValueError as er:
+            return moderator_pb2.CreateDeleteReviewBatchResponse(success=False, message=str(er))
+        success, message, affected = await create_reviews(reviews)
+        return moderator_pb2.CreateDeleteReviewBatchResponse(success=success, message=message, affected=affected)
+
+    async def DeleteReviewBatch(
+        self, request: moderator_pb2.DeleteReviewBatchRequest, context: grpc.aio.ServicerContext
+    ) -> moderator_pb2.CreateDeleteReviewBatchResponse:
+        try:
+            review_ids = [UUID(review_id) for review_id in request.review_ids]
+        except ValueError as er:
+            return moderator_pb2.CreateDeleteReviewBatchResponse(success=False, message=str(er))
+        success, message, affected = await delete_reviews(review_ids)
+        return moderator_pb2.CreateDeleteReviewBatchResponse(success=success, message=message, affected=affected)
+
+
+class ModeratorServiceServicerV2(moderator_v2_pb2_grpc.ModeratorServiceServicer):
+    """Версия 2: идентификаторы - 16 байт UUID, добавление и удаление выполняются одним запросом."""
+
+    async def CreateReview(
+        self, request: moderator_v2_pb2.CreateReviewRequest, context: grpc.aio.ServicerContext
+    ) -> moderator_v2_pb2.CreateDeleteReviewResponse:
+        try:
+            review = self._parse(request)
+        except ValueError as er:
+            return moderator_v2_pb2.CreateDeleteReviewResponse(success=False, message=str(er))
+        success, message, _ = await create_reviews([review])
+        return moderator_v2_pb2.CreateDeleteReviewResponse(success=success, message=message)
+
+    async def DeleteReview(
+        self, request: moderator_v2_pb2.DeleteReviewRequest, context: grpc.aio.ServicerContext
+    ) -> moderator_v2_pb2.CreateDeleteReviewResponse:
+        try:
+            review_id = UUID(bytes=request.review_id)
+        except ValueError as er:
+            return moderator_v2_pb2.CreateDeleteReviewResponse(success=False, message=str(er))
+        success, message, _ = await delete_reviews([review_id])
+        return moderator_v2_pb2.CreateDeleteReviewResponse(success=success, message=message)
+
+    async def CreateReviewBatch(
+        self, request: moderator_v2_pb2.CreateReviewBatchRequest, context: grpc.aio.ServicerContext
+    ) -> moderator_v2_pb2.CreateDeleteReviewBatchResponse:
+        try:
+            reviews = [self._parse(review) for review in request.reviews]
+        except ValueError as er:
+            return moderator_v2_pb2.CreateDeleteReviewBatchResponse(success=False, message=str(er))
+        success, message, affected = await create_reviews(reviews)
+        return moderator_v2_pb2.CreateDeleteReviewBatchResponse(success=success, message=message, affected=affected)
+
+    async def DeleteReviewBatch(
+        self, request: moderator_v2_pb2.DeleteReviewBatchRequest, context: grpc.aio.ServicerContext
+    ) -> moderator_v2_pb2.CreateDeleteReviewBatchResponse:
+        try:
+            review_ids = [UUID(bytes=review_id) for review_id in request.review_ids]
+        except ValueError as er:
+            return moderator_v2_pb2.CreateDeleteReviewBatchResponse(success=False, message=str(er))
+        success, message, affected = await delete_reviews(review_ids)
+        return moderator_v2_pb2.CreateDeleteReviewBatchResponse(success=success, message=message, affected=affected)
+
+    @staticmethod
+    def _parse(request: moderator_v2_pb2.CreateReviewRequest) -> CreateReviewSchema:
+        """Преобразует запрос в данные рецензии без разбора строк."""
+        return CreateReviewSchema.model_construct(
+            user_id=UUID(bytes=request.user_id),
+            movie_id=UUID(bytes=request.movie_id),
+            review_id=UUID(bytes=request.review_id),
+            review_title=request.review_title,
+            review_text=request.review_text,
+            auto_moderation_result=request.auto_moderation_result,
+        )
+
+
+async def create_reviews(reviews: list[CreateReviewSchema]) -> tuple[bool, str, int]:
+    """Добавляет рецензии одной многострочной вставкой, пропуская уже добавленные.
+
+    Returns:
+        Признак успеха, сообщение об ошибке и количество добавленных рецензий.
+    """
+    async for session in get_session():
+        try:
+            return True, "", await ReviewRepository(session).create_many(reviews)
+        except Exception as er:
+            return False, str(er), 0
+    return False, "No database session", 0
+
+
+async def delete_reviews(review_ids: list[UUID]) -> tuple[bool, str, int]:
+    """Удаляет рецензии одним запросом.
+
+    Returns:
+        Признак успеха, сообщение об ошибке и количество удаленных рецензий.
+    """
+    async for session in get_session():
+        try:
+            return True, "", await ReviewRepository(session).delete_by_review_ids(review_ids)
+        except Exception as er:
+            return False, str(er), 0
+    return False, "No database session", 0
+
 
-async def serve() -> None:
-    server = grpc.aio.server(futures.ThreadPoolExecutor(max_workers=10))
+@asynccontextmanager
+async def setup_server(server: grpc.aio.Server) -> AsyncGenerator[None, None]:
     moderator_pb2_grpc.add_ModeratorServiceServicer_to_server(ModeratorServiceServicer(), server)
-    server.add_insecure_port("[::]:50051")
-    await server.start()
-    logger.info("gRPC server running on port 50051...")
-    await server.wait_for_termination()
+    moderator_v2_pb2_grpc.add_ModeratorServiceServicer_to_server(ModeratorServiceServicerV2(), server)
+    try:
+        yield
+    finally:
+        await engine.dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(serve())
+    serve(settings.grpc_serving, setup_server)
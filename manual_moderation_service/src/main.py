@@ -1,3 +1,7 @@
+# stdlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 # thirdparty
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -6,8 +10,17 @@ from fastapi.responses import ORJSONResponse
 # project
 from api.v1 import api_router as api_v1_router
 from core.config import settings
+from grpc_services.grpc_client.channel_pool import channel_pool
 from handlers import exception_handlers
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    channel_pool.configure(settings.grpc_channel_pool_size)
+    yield
+    await channel_pool.close()
+
+
 app = FastAPI(
     title=settings.project_name,
     description="API сервиса авторизации кинотеатра",
@@ -16,6 +29,7 @@ app = FastAPI(
     openapi_url="/api-moderator/openapi.json",
     default_response_class=ORJSONResponse,
     exception_handlers=exception_handlers,
+    lifespan=lifespan,
 )
 
 # Настройка CORS
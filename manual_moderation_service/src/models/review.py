@@ -21,7 +21,7 @@ class ModerationStatus(StrEnum):
 class Review(Base):
     user_id: Mapped[UUID] = mapped_column(nullable=False, doc="ID пользователя")
     movie_id: Mapped[UUID] = mapped_column(nullable=False, doc="ID фильма")
-    review_id: Mapped[UUID] = mapped_column(nullable=False, doc="ID рецензии")
+    review_id: Mapped[UUID] = mapped_column(nullable=False, unique=True, doc="ID рецензии")
     review_title: Mapped[str] = mapped_column(Text, nullable=False, doc="Название рецензии")
     review_text: Mapped[str] = mapped_column(Text, nullable=False, doc="Текст рецензии")
     auto_moderation_result: Mapped[str | None] = mapped_column(Text, nullable=True, doc="Результат автомодерации")
@@ -1,4 +1,10 @@
+# stdlib
+from collections.abc import Sequence
+from uuid import UUID
+
 # thirdparty
+from sqlalchemy import Uuid, any_, bindparam, delete
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 # project
@@ -10,3 +16,34 @@ from services.repositories.base import BaseCRUDRepository
 class ReviewRepository(BaseCRUDRepository[Review, CreateReview, UpdateReview]):
     def __init__(self, session: AsyncSession):
         super().__init__(Review, session)
+
+    async def create_many(self, objs_in: Sequence[CreateReview]) -> int:
+        """Добавляет рецензии одной многострочной вставкой, пропуская уже добавленные.
+
+        Returns:
+            Количество добавленных рецензий.
+        """
+        if not objs_in:
+            return 0
+        query = (
+            insert(self.model)
+            .values([obj_in.model_dump() for obj_in in objs_in])
+            .on_conflict_do_nothing(index_elements=[self.model.review_id])
+        )
+        result = await self.session.execute(query)
+        await self.session.commit()
+        return result.rowcount
+
+    async def delete_by_review_ids(self, review_ids: Sequence[UUID]) -> int:
+        """Удаляет рецензии по идентификаторам одним запросом.
+
+        Returns:
+            Количество удаленных рецензий.
+        """
+        if not review_ids:
+            return 0
+        ids_param = bindparam("review_ids", list(review_ids), type_=ARRAY(Uuid()))
+        query = delete(self.model).where(self.model.review_id == any_(ids_param))
+        result = await self.session.execute(query)
+        await self.session.commit()
+        return result.rowcount
@@ -2,4 +2,4 @@
 
 # Run the GRPC server
 echo "Запуск GRPC сервера..."
-eval uv run src/grpc_server.py 
+exec uv run src/grpc_server.py
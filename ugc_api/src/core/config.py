@@ -9,6 +9,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # project
 from core.logger import LOGGING
+from grpc_services.grpc_server.serving import ServingConfig
 
 logging_config.dictConfig(LOGGING)
 DOTENV_PATH = find_dotenv(".env")
@@ -26,6 +27,9 @@ class AppSettings(BaseSettings):
     kafka_batch_sleep: int = Field(default=1, description="Задержка при отправке сообщений пакетами")
     kafka_batch_size: int = Field(default=100, description="Количество сообщений, отправляемых в пакете")
     kafka_retry_backoff_ms: int = Field(default=100)
+    kafka_linger_ms: int = Field(default=5, description="Время ожидания продюсером накопления пакета сообщений")
+    kafka_max_batch_size: int = Field(default=16384, description="Максимальный размер пакета на партицию в байтах")
+    kafka_compression_type: str | None = Field(default=None, description="Сжатие пакетов: gzip, snappy, lz4, zstd")
 
     # MongoDB
     mongo_db: str = Field(default="Movies")
@@ -41,6 +45,17 @@ class AppSettings(BaseSettings):
     jwt_algorithm: str = Field(default="RS256")
     jwt_public_key_path: Path = Field(default=Path("/app/keys/example_public_key.pem"))
 
+    # gRPC-сервер
+    grpc_port: int = Field(default=50051)
+    grpc_workers: int = Field(default=1, ge=1, description="Количество процессов gRPC-сервера на общем порту")
+    grpc_max_concurrent_rpcs: int | None = Field(
+        default=None, ge=1, description="Максимум одновременных вызовов в процессе, сверх него - RESOURCE_EXHAUSTED"
+    )
+    grpc_max_message_length: int = Field(default=4 * 1024 * 1024, ge=1, description="Максимальный размер сообщения")
+    grpc_keepalive_time_ms: int = Field(default=60_000, ge=1, description="Интервал keepalive-пингов клиентам")
+    grpc_keepalive_timeout_ms: int = Field(default=20_000, ge=1, description="Ожидание ответа на keepalive-пинг")
+    grpc_shutdown_grace: float = Field(default=10.0, ge=0, description="Время на завершение вызовов при остановке")
+
     # Другие настройки
     test_mode: bool = Field(default=False)
 
@@ -60,6 +75,18 @@ class AppSettings(BaseSettings):
             f"{self.mongo_db}?authSource=admin"
         )
 
+    @property
+    def grpc_serving(self) -> ServingConfig:
+        return ServingConfig(
+            port=self.grpc_port,
+            workers=self.grpc_workers,
+            max_concurrent_rpcs=self.grpc_max_concurrent_rpcs,
+            max_message_length=self.grpc_max_message_length,
+            keepalive_time_ms=self.grpc_keepalive_time_ms,
+            keepalive_timeout_ms=self.grpc_keepalive_timeout_ms,
+            shutdown_grace=self.grpc_shutdown_grace,
+        )
+
     @property
     def jwt_public_key(self) -> str:
         try:
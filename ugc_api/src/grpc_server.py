@@ -1,20 +1,45 @@
 # stdlib
-import asyncio
 import logging
-from concurrent import futures
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+)
+from contextlib import asynccontextmanager
+from typing import Any
 from uuid import UUID
 
 # thirdparty
 import grpc
 
 # project
+from core.config import settings
 from db.mongodb import init_mongodb
-from grpc_services.generated import review_pb2, review_pb2_grpc
+from documents.review import Status
+from grpc_services.generated import (
+    review_pb2,
+    review_pb2_grpc,
+    review_v2_pb2,
+    review_v2_pb2_grpc,
+)
+from grpc_services.grpc_server.serving import serve
+from schemas.review import ReviewStatusUpdate
 from services.repositories.reviews import ReviewRepository
 from services.review_service import ReviewService
 
 logger = logging.getLogger(__name__)
 
+# Количество обновлений потока, записываемых в MongoDB одной массовой операцией
+STREAM_FLUSH_SIZE = 500
+# Статусы рецензий по значениям перечисления API v2
+STATUSES_V2 = {
+    review_v2_pb2.MODERATION_STATUS_APPROVED: Status.APPROVED,
+    review_v2_pb2.MODERATION_STATUS_REJECTED: Status.REJECTED,
+    review_v2_pb2.MODERATION_STATUS_PENDING: Status.PENDING,
+}
+
 
 class ReviewStatusServicer(review_pb2_grpc.ReviewServiceServicer):
     async def UpdateReviewStatus(
@@ -33,17 +58,156 @@ class ReviewStatusServicer(review_pb2_grpc.ReviewServiceServicer):
         except Exception as er:
             return review_pb2.UpdateReviewStatusResponse(success=False, message=str(er))
 
+    async def UpdateReviewStatusBatch(
+        self, request: review_pb2.UpdateReviewStatusBatchRequest, context: grpc.aio.ServicerContext
+    ) -> review_pb2.UpdateReviewStatusBatchResponse:
+        results = await self._update_statuses(request.updates)
+        return review_pb2.UpdateReviewStatusBatchResponse(results=results)
+
+    async def StreamReviewStatusUpdates(
+        self,
+        request_iterator: AsyncIterator[review_pb2.UpdateReviewStatusRequest],
+        context: grpc.aio.ServicerContext,
+    ) -> review_pb2.UpdateReviewStatusBatchResponse:
+        results = await update_in_chunks(request_iterator, self._update_statuses)
+        return review_pb2.UpdateReviewStatusBatchResponse(results=results)
+
+    @staticmethod
+    async def _update_statuses(
+        requests: Iterable[review_pb2.UpdateReviewStatusRequest],
+    ) -> list[review_pb2.UpdateReviewStatusResult]:
+        """Применяет обновления статусов одной массовой записью и возвращает результат по каждому."""
+        results: list[review_pb2.UpdateReviewStatusResult] = []
+        updates: list[tuple[review_pb2.UpdateReviewStatusResult, ReviewStatusUpdate]] = []
+        for request in requests:
+            result = review_pb2.UpdateReviewStatusResult(review_id=request.review_id, success=True)
+            results.append(result)
+            try:
+                update = ReviewStatusUpdate(
+                    review_id=UUID(request.review_id),
+                    status=Status(request.status),
+                    moderation_comment=request.comment,
+                )
+            except ValueError as er:
+                result.success = False
+                result.message = str(er)
+                continue
+            updates.append((result, update))
+        await apply_status_updates(updates)
+        return results
+
+
+class ReviewStatusServicerV2(review_v2_pb2_grpc.ReviewServiceServicer):
+    """Версия 2: идентификаторы рецензий - 16 байт UUID, статусы - перечисление."""
+
+    async def UpdateReviewStatus(
+        self, request: review_v2_pb2.UpdateReviewStatusRequest, context: grpc.aio.ServicerContext
+    ) -> review_v2_pb2.UpdateReviewStatusResponse:
+        response = review_v2_pb2.UpdateReviewStatusResponse(success=True)
+        try:
+            update = self._parse(request)
+        except ValueError as er:
+            return review_v2_pb2.UpdateReviewStatusResponse(success=False, message=str(er))
+        await apply_status_updates([(response, update)])
+        return response
+
+    async def UpdateReviewStatusBatch(
+        self, request: review_v2_pb2.UpdateReviewStatusBatchRequest, context: grpc.aio.ServicerContext
+    ) -> review_v2_pb2.UpdateReviewStatusBatchResponse:
+        results = await self._update_statuses(request.updates)
+        return review_v2_pb2.UpdateReviewStatusBatchResponse(results=results)
+
+    async def StreamReviewStatusUpdates(
+        self,
+        request_iterator: AsyncIterator[review_v2_pb2.UpdateReviewStatusRequest],
+        context: grpc.aio.ServicerContext,
+    ) -> review_v2_pb2.UpdateReviewStatusBatchResponse:
+        results = await update_in_chunks(request_iterator, self._update_statuses)
+        return review_v2_pb2.UpdateReviewStatusBatchResponse(results=results)
+
+    @classmethod
+    async def _update_statuses(
+        cls, requests: Iterable[review_v2_pb2.UpdateReviewStatusRequest]
+    ) -> list[review_v2_pb2.UpdateReviewStatusResult]:
+        """Применяет обновления статусов одной массовой записью и возвращает результат по каждому."""
+        results: list[review_v2_pb2.UpdateReviewStatusResult] = []
+        updates: list[tuple[review_v2_pb2.UpdateReviewStatusResult, ReviewStatusUpdate]] = []
+        for request in requests:
+            result = review_v2_pb2.UpdateReviewStatusResult(review_id=request.review_id, success=True)
+            results.append(result)
+            try:
+                updates.append((result, cls._parse(request)))
+            except ValueError as er:
+                result.success = False
+                result.message = str(er)
+        await apply_status_updates(updates)
+        return results
+
+    @staticmethod
+    def _parse(request: review_v2_pb2.UpdateReviewStatusRequest) -> ReviewStatusUpdate:
+        """Преобразует запрос в обновление статуса без разбора строк."""
+        status = STATUSES_V2.get(request.status)
+        if status is None:
+            raise ValueError(f"Unknown status {request.status}")
+        return ReviewStatusUpdate.model_construct(
+            review_id=UUID(bytes=request.review_id),
+            status=status,
+            moderation_comment=request.comment,
+        )
+
+
+async def update_in_chunks(
+    request_iterator: AsyncIterator[Any],
+    update_statuses: Callable[[list[Any]], Awaitable[list[Any]]],
+) -> list[Any]:
+    """Применяет обновления из потока пакетами по `STREAM_FLUSH_SIZE`."""
+    results: list[Any] = []
+    chunk: list[Any] = []
+    async for request in request_iterator:
+        chunk.append(request)
+        if len(chunk) >= STREAM_FLUSH_SIZE:
+            results += await update_statuses(chunk)
+            chunk = []
+    if chunk:
+        results += await update_statuses(chunk)
+    return results
+
+
+async def apply_status_updates(
+    updates: list[
+        tuple[
+            review_pb2.UpdateReviewStatusResult
+            | review_v2_pb2.UpdateReviewStatusResult
+            | review_v2_pb2.UpdateReviewStatusResponse,
+            ReviewStatusUpdate,
+        ]
+    ],
+) -> None:
+    """Применяет обновления одной массовой записью и отмечает неудачные в их результатах."""
+    review_service = ReviewService(review_repo=ReviewRepository())
+    try:
+        missing = await review_service.update_review_statuses([update for _, update in updates])
+    except Exception as er:
+        for result, _ in updates:
+            result.success = False
+            result.message = str(er)
+        return
+    for result, update in updates:
+        if update.review_id in missing:
+            result.success = False
+            result.message = f"Review {update.review_id} not found"
+
 
-async def serve() -> None:
+@asynccontextmanager
+async def setup_server(server: grpc.aio.Server) -> AsyncGenerator[None, None]:
     client = await init_mongodb()
-    server = grpc.aio.server(futures.ThreadPoolExecutor(max_workers=10))
     review_pb2_grpc.add_ReviewServiceServicer_to_server(ReviewStatusServicer(), server)
-    server.add_insecure_port("[::]:50051")
-    await server.start()
-    logger.info("gRPC server running on port 50051...")
-    await server.wait_for_termination()
-    client.close()
+    review_v2_pb2_grpc.add_ReviewServiceServicer_to_server(ReviewStatusServicerV2(), server)
+    try:
+        yield
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(serve())
+    serve(settings.grpc_serving, setup_server)
@@ -14,6 +14,7 @@ from core.config import settings
 from db.mongodb import init_mongodb
 from handlers import exception_handlers
 from middlewares.request_id import request_id_require
+from services.kafka_producer import close_kafka_producer, init_kafka_producer
 
 if settings.sentry_dsn:
     sentry_sdk.init(
@@ -25,7 +26,9 @@ if settings.sentry_dsn:
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     client = await init_mongodb()
+    await init_kafka_producer()
     yield
+    await close_kafka_producer()
     client.close()
 
 
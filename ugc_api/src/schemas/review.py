@@ -24,3 +24,9 @@ class CreateReviewData(BaseModel):
     movie_id: UUID
     title: str
     review_text: str
+
+
+class ReviewStatusUpdate(BaseModel):
+    review_id: UUID
+    status: Status
+    moderation_comment: str = ""
@@ -1,7 +1,7 @@
 # stdlib
 import json
+import logging
 import random
-from contextlib import asynccontextmanager
 
 # thirdparty
 from aiokafka.producer import AIOKafkaProducer
@@ -10,27 +10,28 @@ from aiokafka.producer import AIOKafkaProducer
 from core.config import settings
 from schemas.kafka import KafkaMessage
 
+logger = logging.getLogger(__name__)
+
 
 class KafkaProducerService:
     def __init__(self) -> None:
         self.producer = AIOKafkaProducer(
             bootstrap_servers=settings.kafka_bootstrap_server,
             retry_backoff_ms=settings.kafka_retry_backoff_ms,
+            linger_ms=settings.kafka_linger_ms,
+            max_batch_size=settings.kafka_max_batch_size,
+            compression_type=settings.kafka_compression_type,
         )
 
-    @asynccontextmanager
-    async def kafka_producer(self) -> AIOKafkaProducer:
-        await self.start()
-        try:
-            yield self.producer
-        finally:
-            await self.stop()
-
     async def start(self) -> None:
         await self.producer.start()
 
     async def stop(self) -> None:
-        await self.producer.stop()
+        """Дожидается отправки накопленных сообщений и закрывает соединения с брокерами."""
+        try:
+            await self.producer.flush()
+        finally:
+            await self.producer.stop()
 
     def _encode_value(self, value: str | bytes | dict) -> bytes:
         """Унифицированное преобразование значения в байты."""
@@ -50,32 +51,55 @@ class KafkaProducerService:
         value = self._encode_value(message)
         key_bytes = self._encode_key(key)
 
-        async with self.kafka_producer() as producer:
-            await producer.send_and_wait(
-                topic=settings.kafka_topic_name,
-                value=value,
-                key=key_bytes,
-            )
+        await self.producer.send_and_wait(
+            topic=settings.kafka_topic_name,
+            value=value,
+            key=key_bytes,
+        )
 
     async def send_batch_messages(self, messages: list[KafkaMessage]) -> None:
-        async with self.kafka_producer() as producer:
-            batch = producer.create_batch()
-            for message in messages:
-                value = self._encode_value(message.value)
-                key_bytes = self._encode_key(message.key) if message.key else None
-
-                batch.append(
-                    key=key_bytes,
-                    value=value,
-                )
-
-            partitions = await producer.partitions_for(settings.kafka_topic_name)
-            await producer.send_batch(
-                batch=batch,
-                topic=settings.kafka_topic_name,
-                partition=random.choice(tuple(partitions)),
+        batch = self.producer.create_batch()
+        for message in messages:
+            value = self._encode_value(message.value)
+            key_bytes = self._encode_key(message.key) if message.key else None
+
+            batch.append(
+                key=key_bytes,
+                value=value,
             )
 
+        partitions = await self.producer.partitions_for(settings.kafka_topic_name)
+        await self.producer.send_batch(
+            batch=batch,
+            topic=settings.kafka_topic_name,
+            partition=random.choice(tuple(partitions)),
+        )
+
+
+# Продюсер создается один раз на процесс в lifespan приложения
+kafka_producer_service: KafkaProducerService | None = None
+
+
+async def init_kafka_producer() -> KafkaProducerService:
+    """Создает и запускает общий для приложения продюсер Kafka."""
+    global kafka_producer_service  # noqa: PLW0603
+    kafka_producer_service = KafkaProducerService()
+    await kafka_producer_service.start()
+    logger.info("Kafka producer запущен.")
+    return kafka_producer_service
+
+
+async def close_kafka_producer() -> None:
+    """Отправляет накопленные сообщения и останавливает общий продюсер Kafka."""
+    global kafka_producer_service  # noqa: PLW0603
+    if kafka_producer_service is None:
+        return
+    await kafka_producer_service.stop()
+    kafka_producer_service = None
+    logger.info("Kafka producer остановлен.")
+
 
 async def get_kafka_producer_service() -> KafkaProducerService:
-    return KafkaProducerService()
+    if kafka_producer_service is None:
+        raise RuntimeError("Kafka producer не инициализирован")
+    return kafka_producer_service
@@ -1,19 +1,26 @@
 # stdlib
-from typing import Any
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 # thirdparty
 from beanie import SortDirection
+from bson import Binary
+from pymongo import UpdateOne
 
 # project
 from documents.review import Review, Status
-from schemas.review import CreateReview, UpdateReview
+from schemas.review import CreateReview, ReviewStatusUpdate, UpdateReview
 from services.repositories.base import (
     DocumentNotFoundException,
     DocumentType,
     RatingRepository,
 )
 
+if TYPE_CHECKING:
+    # thirdparty
+    from pymongo.results import BulkWriteResult
+
 
 class ReviewRepository(RatingRepository[Review, CreateReview, UpdateReview]):
     def __init__(self) -> None:
@@ -51,6 +58,41 @@ class ReviewRepository(RatingRepository[Review, CreateReview, UpdateReview]):
             raise DocumentNotFoundException(f"Not found. {self.model.Settings.name}: {document_id}")
         return document
 
+    async def update_statuses(self, updates: Sequence[ReviewStatusUpdate]) -> set[UUID]:
+        """
+        Обновляет статусы рецензий одной массовой записью.
+
+        Каждое обновление - точечный `UpdateOne` полей статуса и комментария, все они
+        отправляются в MongoDB одним `bulk_write`. Отсутствующие рецензии ищутся
+        отдельным запросом, только если обновлены не все.
+
+        Args:
+            updates: Новые статусы рецензий.
+
+        Returns:
+            Идентификаторы рецензий, которые не найдены.
+        """
+        if not updates:
+            return set()
+        collection = self.model.get_motor_collection()
+        result: BulkWriteResult = await collection.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": Binary.from_uuid(update.review_id)},
+                    {"$set": {"status": update.status.value, "moderation_comment": update.moderation_comment}},
+                )
+                for update in updates
+            ],
+            ordered=False,
+        )
+        if result.matched_count == len(updates):
+            return set()
+        review_ids = {update.review_id for update in updates}
+        found = collection.find(
+            {"_id": {"$in": [Binary.from_uuid(review_id) for review_id in review_ids]}}, {"_id": 1}
+        )
+        return review_ids - {document["_id"].as_uuid() async for document in found}
+
     def _create_query(
         self, filters: dict[str, Any] | None = None, request_user: UUID | None = None, get_all: bool = False
     ) -> dict[str, Any]:
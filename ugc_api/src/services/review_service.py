@@ -7,7 +7,12 @@ from fastapi import Depends
 
 # project
 from documents.review import Review as ReviewDocument, Status
-from schemas.review import CreateReview, CreateReviewData, UpdateReview
+from schemas.review import (
+    CreateReview,
+    CreateReviewData,
+    ReviewStatusUpdate,
+    UpdateReview,
+)
 from services.kafka_producer import (
     KafkaProducerService,
     get_kafka_producer_service,
@@ -63,6 +68,10 @@ class ReviewService:
 
         return updated_review
 
+    async def update_review_statuses(self, updates: list[ReviewStatusUpdate]) -> set[UUID]:
+        """Массовое обновление статусов рецензий. Возвращает идентификаторы ненайденных рецензий."""
+        return await self.review_repo.update_statuses(updates)
+
     async def delete_review(self, review_id: UUID, user_id: UUID) -> None:
         """Удаление рецензии с отправкой события в Kafka."""
         review: ReviewDocument = await self.review_repo.get(document_id=review_id, request_user=user_id)
@@ -21,6 +21,7 @@ from documents.reaction import Reaction
 from documents.review import Review
 from main import app
 from schemas.bookmark import CreateBookmark
+from services.kafka_producer import KafkaProducerService
 from services.repositories.bookmarks import BookmarkRepository
 from services.repositories.movies import MovieRepository
 
@@ -151,12 +152,21 @@ def mock_movie_repo() -> Callable[[], MovieRepository]:
     return get_repo
 
 
+@pytest.fixture
+def mock_kafka_producer() -> Generator[AsyncMock, None, None]:
+    # Продюсер Kafka создается в lifespan, который в тестах отключен
+    mock_producer = AsyncMock(spec=KafkaProducerService)
+    with patch("services.kafka_producer.kafka_producer_service", mock_producer):
+        yield mock_producer
+
+
 @pytest.fixture
 async def client(
     mock_mongodb: AsyncIOMotorDatabase,
     mock_jwt_bearer: AsyncMock,
     mock_bookmark_repo: Callable[[], BookmarkRepository],
     mock_movie_repo: Callable[[], MovieRepository],
+    mock_kafka_producer: AsyncMock,
 ) -> AsyncGenerator[TestClient, None]:
     app.dependency_overrides.clear()
 
@@ -0,0 +1,95 @@
+# stdlib
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+# thirdparty
+from grpc_server import ReviewStatusServicer, ReviewStatusServicerV2
+
+# project
+from documents.review import Status
+from grpc_services.generated import review_pb2, review_v2_pb2
+from services.repositories.reviews import ReviewRepository
+
+REVIEW_ID = "44444444-4444-4444-4444-444444444444"
+MISSING_REVIEW_ID = "99999999-9999-9999-9999-999999999999"
+
+
+async def test_update_review_status_batch() -> None:
+    """Тест массового обновления статусов рецензий с результатом по каждой."""
+    request = review_pb2.UpdateReviewStatusBatchRequest(
+        updates=[
+            review_pb2.UpdateReviewStatusRequest(review_id=REVIEW_ID, status="rejected", comment="Оскорбления"),
+            review_pb2.UpdateReviewStatusRequest(review_id=MISSING_REVIEW_ID, status="approved"),
+            review_pb2.UpdateReviewStatusRequest(review_id="not-a-uuid", status="approved"),
+            review_pb2.UpdateReviewStatusRequest(review_id=REVIEW_ID, status="unknown"),
+        ]
+    )
+
+    with patch.object(
+        ReviewRepository, "update_statuses", AsyncMock(return_value={UUID(MISSING_REVIEW_ID)})
+    ) as update_statuses:
+        response = await ReviewStatusServicer().UpdateReviewStatusBatch(request, MagicMock())
+
+    assert [result.review_id for result in response.results] == [
+        REVIEW_ID,
+        MISSING_REVIEW_ID,
+        "not-a-uuid",
+        REVIEW_ID,
+    ]
+    assert [result.success for result in response.results] == [True, False, False, False]
+    assert update_statuses.await_args is not None
+    updates = update_statuses.await_args.args[0]
+    assert [(update.review_id, update.status) for update in updates] == [
+        (UUID(REVIEW_ID), Status.REJECTED),
+        (UUID(MISSING_REVIEW_ID), Status.APPROVED),
+    ]
+    assert updates[0].moderation_comment == "Оскорбления"
+
+
+async def test_stream_review_status_updates() -> None:
+    """Тест потокового обновления статусов рецензий."""
+
+    async def requests() -> AsyncIterator[review_pb2.UpdateReviewStatusRequest]:
+        yield review_pb2.UpdateReviewStatusRequest(review_id=MISSING_REVIEW_ID, status="rejected")
+        yield review_pb2.UpdateReviewStatusRequest(review_id=REVIEW_ID, status="approved")
+
+    with patch.object(
+        ReviewRepository, "update_statuses", AsyncMock(return_value={UUID(MISSING_REVIEW_ID)})
+    ) as update_statuses:
+        response = await ReviewStatusServicer().StreamReviewStatusUpdates(requests(), MagicMock())
+
+    assert [result.success for result in response.results] == [False, True]
+    update_statuses.assert_awaited_once()
+
+
+async def test_update_review_status_batch_v2() -> None:
+    """Тест массового обновления статусов рецензий через API v2."""
+    request = review_v2_pb2.UpdateReviewStatusBatchRequest(
+        updates=[
+            review_v2_pb2.UpdateReviewStatusRequest(
+                review_id=UUID(REVIEW_ID).bytes, status=review_v2_pb2.MODERATION_STATUS_REJECTED
+            ),
+            review_v2_pb2.UpdateReviewStatusRequest(
+                review_id=UUID(MISSING_REVIEW_ID).bytes, status=review_v2_pb2.MODERATION_STATUS_APPROVED
+            ),
+            review_v2_pb2.UpdateReviewStatusRequest(
+                review_id=b"short", status=review_v2_pb2.MODERATION_STATUS_APPROVED
+            ),
+            review_v2_pb2.UpdateReviewStatusRequest(review_id=UUID(REVIEW_ID).bytes),
+        ]
+    )
+
+    with patch.object(
+        ReviewRepository, "update_statuses", AsyncMock(return_value={UUID(MISSING_REVIEW_ID)})
+    ) as update_statuses:
+        response = await ReviewStatusServicerV2().UpdateReviewStatusBatch(request, MagicMock())
+
+    assert [result.success for result in response.results] == [True, False, False, False]
+    assert response.results[0].review_id == UUID(REVIEW_ID).bytes
+    assert update_statuses.await_args is not None
+    updates = update_statuses.await_args.args[0]
+    assert [(update.review_id, update.status) for update in updates] == [
+        (UUID(REVIEW_ID), Status.REJECTED),
+        (UUID(MISSING_REVIEW_ID), Status.APPROVED),
+    ]
@@ -0,0 +1,97 @@
+# stdlib
+from collections.abc import Iterator, Sequence
+from typing import Any
+from unittest.mock import patch
+from uuid import UUID
+
+# thirdparty
+import pytest
+from bson import Binary
+from motor.motor_asyncio import (
+    AsyncIOMotorCollection,
+    AsyncIOMotorCursor,
+    AsyncIOMotorDatabase,
+)
+from pymongo import UpdateOne
+from pymongo.results import BulkWriteResult
+
+# project
+from documents.review import Review, Status
+from schemas.review import ReviewStatusUpdate
+from services.repositories.reviews import ReviewRepository
+
+REVIEW_ID = UUID("44444444-4444-4444-4444-444444444444")
+MISSING_REVIEW_ID = UUID("99999999-9999-9999-9999-999999999999")
+
+
+class BulkUpdates:
+    """Приемник операций пакета, заполняемый самими операциями pymongo."""
+
+    def __init__(self) -> None:
+        self.updates: list[tuple[dict[str, Any], dict[str, Any]]] = []
+
+    def add_update(
+        self, selector: dict[str, Any], document: dict[str, Any], multi: bool, upsert: bool, **_: Any
+    ) -> None:
+        self.updates.append((selector, document))
+
+
+class BulkWriteCollection:
+    """Коллекция mongomock с `bulk_write`, который принимает аргументы текущего pymongo.
+
+    Операции пакета выполняются по одной на исходной коллекции, поэтому проверяются
+    фильтры и обновления, которые строит репозиторий.
+    """
+
+    def __init__(self, collection: AsyncIOMotorCollection) -> None:
+        self.collection = collection
+        self.find_calls = 0
+
+    async def bulk_write(self, requests: Sequence[UpdateOne], ordered: bool = True) -> BulkWriteResult:
+        bulk = BulkUpdates()
+        for request in requests:
+            request._add_to_bulk(bulk)  # type: ignore
+        matched = 0
+        for selector, document in bulk.updates:
+            matched += (await self.collection.update_one(selector, document)).matched_count
+        return BulkWriteResult({"nMatched": matched}, acknowledged=True)
+
+    def find(self, *args: Any, **kwargs: Any) -> AsyncIOMotorCursor:
+        self.find_calls += 1
+        return self.collection.find(*args, **kwargs)
+
+
+@pytest.fixture
+def reviews_collection(mock_mongodb: AsyncIOMotorDatabase) -> Iterator[BulkWriteCollection]:
+    collection = BulkWriteCollection(Review.get_motor_collection())
+    with patch.object(Review, "get_motor_collection", return_value=collection):
+        yield collection
+
+
+async def test_update_statuses_returns_missing_reviews(reviews_collection: BulkWriteCollection) -> None:
+    """Тест массового обновления статусов, в котором одной рецензии нет."""
+    missing = await ReviewRepository().update_statuses(
+        [
+            ReviewStatusUpdate(review_id=REVIEW_ID, status=Status.REJECTED, moderation_comment="Оскорбления"),
+            ReviewStatusUpdate(review_id=MISSING_REVIEW_ID, status=Status.APPROVED),
+        ]
+    )
+
+    assert missing == {MISSING_REVIEW_ID}
+    review = await reviews_collection.collection.find_one({"_id": Binary.from_uuid(REVIEW_ID)})
+    assert review is not None
+    assert review["status"] == Status.REJECTED.value
+    assert review["moderation_comment"] == "Оскорбления"
+
+
+async def test_update_statuses_skips_lookup_when_all_matched(reviews_collection: BulkWriteCollection) -> None:
+    """Тест того, что отсутствующие рецензии не ищутся, если обновлены все."""
+    missing = await ReviewRepository().update_statuses(
+        [ReviewStatusUpdate(review_id=REVIEW_ID, status=Status.APPROVED)]
+    )
+
+    assert missing == set()
+    assert reviews_collection.find_calls == 0
+    review = await reviews_collection.collection.find_one({"_id": Binary.from_uuid(REVIEW_ID)})
+    assert review is not None
+    assert review["status"] == Status.APPROVED.value
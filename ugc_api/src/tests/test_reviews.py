@@ -1,6 +1,7 @@
 # stdlib
 from collections.abc import Callable
 from http import HTTPStatus
+from unittest.mock import AsyncMock
 
 # thirdparty
 from fastapi.testclient import TestClient
@@ -17,6 +18,7 @@ def test_create_review(
     client: TestClient,
     headers: dict[str, str],
     mock_movie_repo: Callable[[], MovieRepository],
+    mock_kafka_producer: AsyncMock,
 ) -> None:
     """Тест создания рецензии."""
     request_data = {
@@ -35,6 +37,8 @@ def test_create_review(
     data = response.json()
     assert data["title"] == request_data["title"]
     assert data["review_text"] == request_data["review_text"]
+    mock_kafka_producer.send_message.assert_awaited_once()
+    assert mock_kafka_producer.send_message.await_args.kwargs["message"]["event_type"] == "review_created"
 
 
 def test_get_reviews(client: TestClient, headers: dict[str, str]) -> None:
@@ -50,7 +54,7 @@ def test_get_reviews(client: TestClient, headers: dict[str, str]) -> None:
     assert len(data) > 0
 
 
-def test_delete_review(client: TestClient, headers: dict[str, str]) -> None:
+def test_delete_review(client: TestClient, headers: dict[str, str], mock_kafka_producer: AsyncMock) -> None:
     """Тест удаления рецензии."""
     response = client.delete(
         f"/api-ugc/v1/reviews/{REVIEW_ID}",
@@ -58,3 +62,5 @@ def test_delete_review(client: TestClient, headers: dict[str, str]) -> None:
     )
 
     assert response.status_code == HTTPStatus.NO_CONTENT
+    mock_kafka_producer.send_message.assert_awaited_once()
+    assert mock_kafka_producer.send_message.await_args.kwargs["key"] == REVIEW_ID